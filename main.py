@@ -28,7 +28,6 @@ from src.visualization.visualization import (
     InteractiveController,
     run_statistics_simulation,
 )
-from src.visualization.pygame_visualization import run_pygame_simulation
 
 
 def run_benchmark(debug: bool = False):
@@ -111,6 +110,8 @@ def run_simulation_mode(
 
     print(f"Running {mode_name} with {floors} floors and {elevators} elevators...")
 
+    from src.visualization.pygame_visualization import run_pygame_simulation
+
     run_pygame_simulation(
         num_floors=floors,
         num_elevators=elevators,
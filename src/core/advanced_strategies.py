@@ -8,10 +8,11 @@ More sophisticated strategies for elevator assignment:
 - ML-based (simple heuristic learning)
 """
 
-from typing import List, Optional, Dict, Tuple
+import time
+from typing import Callable, List, Optional, Dict, Tuple
 from collections import defaultdict
 from src.core.interfaces import ElevatorAssignmentStrategy, ElevatorConfig
-from src.core.elevator_simulator import ElevatorState
+from src.core.elevator_simulator import Direction, ElevatorState
 from src.core.strategies import NearestCarStrategy
 
 
@@ -56,13 +57,16 @@ class LOOKStrategy(ElevatorAssignmentStrategy):
 
         # Base score on distance and direction
         # Idle elevator - very good
-        if elevator.state == ElevatorState.IDLE:
+        if elevator.state is ElevatorState.IDLE:
             score = distance * 0.5  # Low score = high priority
         # Moving in same direction and will pass this floor
-        elif elevator.direction == direction:
-            if direction.value == "UP" and elevator.current_floor <= request_floor:
+        elif elevator.direction is direction:
+            if direction is Direction.UP and elevator.current_floor <= request_floor:
                 score = distance * 0.7  # Will pick up on the way
-            elif direction.value == "DOWN" and elevator.current_floor >= request_floor:
+            elif (
+                direction is Direction.DOWN
+                and elevator.current_floor >= request_floor
+            ):
                 score = distance * 0.7  # Will pick up on the way
             else:
                 score = distance * 2.0 + 100  # Won't pass this floor
@@ -124,7 +128,8 @@ class DestinationDispatchStrategy(ElevatorAssignmentStrategy):
         self, elevators, request_floor, destination_floor, direction, config
     ) -> Optional[int]:
         """Find elevator serving similar destinations"""
-        candidates = []
+        best_elevator = None
+        best_load = float("inf")
 
         for i, elevator in enumerate(elevators):
             if elevator.is_full:
@@ -137,48 +142,49 @@ class DestinationDispatchStrategy(ElevatorAssignmentStrategy):
                 if any(
                     abs(dest - destination_floor) <= 3 for dest in destinations
                 ) and (
-                    elevator.direction == direction
-                    or elevator.state == ElevatorState.IDLE
+                    elevator.direction is direction
+                    or elevator.state is ElevatorState.IDLE
                 ):
                     # Consider load balancing
                     if config.enable_load_balancing:
                         load_factor = elevator.passenger_count / elevator.capacity
                         # Prefer less loaded elevators
-                        candidates.append((i, load_factor))
+                        if load_factor < best_load:
+                            best_load = load_factor
+                            best_elevator = i
                     else:
                         return i  # Return first match if no load balancing
 
-        # Return least loaded candidate
-        if candidates:
-            return min(candidates, key=lambda x: x[1])[0]
-
-        return None
+        # Least loaded candidate, if any
+        return best_elevator
 
     def _assign_nearest(self, elevators, request_floor, config) -> Optional[int]:
         """Fallback to nearest available elevator with load balancing"""
-        available = [(i, e) for i, e in enumerate(elevators) if not e.is_full]
-
-        if not available:
-            return None
+        enable_load_balancing = config.enable_load_balancing
+        load_factor_weight = config.load_factor_weight
 
-        # Prefer idle elevators
-        idle = [(i, e) for i, e in available if e.state == ElevatorState.IDLE]
-        search_set = idle if idle else available
+        # Single pass keeping the best idle car and the best car with room;
+        # idle cars are preferred and earlier cars win ties
+        best_idle = best_available = None
+        idle_score = available_score = float("inf")
 
-        # Calculate score considering distance and load
-        def calc_score(idx_elevator):
-            i, e = idx_elevator
-            distance = abs(e.current_floor - request_floor)
-            score = distance
+        for i, elevator in enumerate(elevators):
+            passenger_count = len(elevator.passengers)
+            if passenger_count >= elevator.capacity:
+                continue
 
-            # Add load balancing
-            if config.enable_load_balancing:
-                load_factor = e.passenger_count / e.capacity
-                score += load_factor * config.load_factor_weight
+            # Score considers distance and load
+            score = abs(elevator.current_floor - request_floor)
+            if enable_load_balancing:
+                score += passenger_count / elevator.capacity * load_factor_weight
 
-            return score
+            if elevator.state is ElevatorState.IDLE:
+                if score < idle_score:
+                    idle_score, best_idle = score, i
+            elif best_idle is None and score < available_score:
+                available_score, best_available = score, i
 
-        return min(search_set, key=calc_score)[0]
+        return best_idle if best_idle is not None else best_available
 
     def register_destination(
         self, elevator_idx: int, request_floor: int, destination_floor: int
@@ -255,11 +261,11 @@ class MLBasedStrategy(ElevatorAssignmentStrategy):
         score += distance * self.strategy_weights["nearest"]
 
         # Idle bonus (weighted)
-        if elevator.state == ElevatorState.IDLE:
+        if elevator.state is ElevatorState.IDLE:
             score -= 10 * self.strategy_weights["idle_preference"]
 
         # Same direction bonus (weighted)
-        if elevator.direction == direction:
+        if elevator.direction is direction:
             score -= 5 * self.strategy_weights["same_direction"]
 
         # Load balancing (weighted)
@@ -354,6 +360,9 @@ class AdaptiveStrategy(ElevatorAssignmentStrategy):
         # Track recent request rate
         self.recent_requests = []
         self.max_history = 100
+        # Source of the request timestamps. Wall-clock by default; a
+        # simulation in simulated-time mode installs its virtual clock here.
+        self.clock: Callable[[], float] = time.time
 
     def assign_elevator(
         self,
@@ -365,9 +374,7 @@ class AdaptiveStrategy(ElevatorAssignmentStrategy):
     ) -> Optional[int]:
         """Assign elevator using adaptive strategy selection"""
         # Record request
-        import time
-
-        self.recent_requests.append(time.time())
+        self.recent_requests.append(self.clock())
         if len(self.recent_requests) > self.max_history:
             self.recent_requests.pop(0)
 
@@ -7,9 +7,20 @@ for a multi-story mall. Features include multiple elevators,
 intelligent scheduling, person generation, and real-time visualization.
 """
 
+import bisect
 import random
 import time
-from typing import List, Dict, Set, Optional, Tuple
+from collections.abc import MutableSet
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
 from enum import Enum
 from dataclasses import dataclass
 from src.utils.config_loader import get_config
@@ -33,6 +44,108 @@ class ElevatorState(Enum):
     MAINTENANCE = "MAINTENANCE"
 
 
+class FloorSet(MutableSet):
+    """
+    A set of floor numbers stored as an integer bitmask.
+
+    Bit f is set when floor f is in the set. It behaves like a set of ints
+    for callers, while directional queries ("any floor above f?", "nearest
+    floor below f?") become a shift or bit_length instead of a scan.
+    Iteration yields floors in ascending order.
+    """
+
+    __slots__ = ("mask",)
+
+    def __init__(self, floors: Iterable[int] = ()):
+        self.mask = 0
+        for floor in floors:
+            self.mask |= 1 << floor
+
+    def __contains__(self, floor) -> bool:
+        return floor >= 0 and (self.mask >> floor) & 1 == 1
+
+    def __iter__(self) -> Iterator[int]:
+        mask = self.mask
+        while mask:
+            lowest = mask & -mask
+            yield lowest.bit_length() - 1
+            mask ^= lowest
+
+    def __len__(self) -> int:
+        return bin(self.mask).count("1")
+
+    def __bool__(self) -> bool:
+        return self.mask != 0
+
+    def __repr__(self) -> str:
+        return f"FloorSet({list(self)})"
+
+    def add(self, floor: int):
+        self.mask |= 1 << floor
+
+    def discard(self, floor: int):
+        self.mask &= ~(1 << floor)
+
+    def clear(self):
+        self.mask = 0
+
+
+def _lowest_above(mask: int, floor: int) -> Optional[int]:
+    """Lowest floor in mask strictly above floor, if any"""
+    above = mask >> (floor + 1)
+    if not above:
+        return None
+    return (above & -above).bit_length() + floor
+
+
+def _highest_below(mask: int, floor: int) -> Optional[int]:
+    """Highest floor in mask strictly below floor, if any"""
+    below = mask & ((1 << floor) - 1)
+    if not below:
+        return None
+    return below.bit_length() - 1
+
+
+def _nearest_other(mask: int, floor: int) -> Optional[int]:
+    """Floor in mask closest to floor (excluding it); ties go to the lower"""
+    lower = _highest_below(mask, floor)
+    upper = _lowest_above(mask, floor)
+    if lower is None:
+        return upper
+    if upper is None or floor - lower <= upper - floor:
+        return lower
+    return upper
+
+
+def _resolve_direction(
+    direction: Direction, has_more_up: bool, has_more_down: bool
+) -> Direction:
+    """Direction to travel given the requests above and below the car"""
+    # If we have requests in current direction, continue
+    if direction == Direction.UP:
+        if has_more_up:
+            return direction
+        return Direction.DOWN if has_more_down else Direction.IDLE
+    if direction == Direction.DOWN:
+        if has_more_down:
+            return direction
+        return Direction.UP if has_more_up else Direction.IDLE
+    if has_more_up:
+        return Direction.UP
+    if has_more_down:
+        return Direction.DOWN
+    return direction
+
+
+class StepPlan(NamedTuple):
+    """What an elevator should do next, from one pass over its requests"""
+
+    direction: Direction
+    next_stop: Optional[int]
+    has_more_up: bool
+    has_more_down: bool
+
+
 @dataclass
 class Person:
     """Represents a person in the mall wanting to use elevators"""
@@ -58,7 +171,10 @@ class Person:
     @property
     def wait_time(self) -> float:
         """Calculate how long this person has been waiting"""
-        current_time = time.time()
+        return self.wait_time_at(time.time())
+
+    def wait_time_at(self, current_time: float) -> float:
+        """Calculate how long this person has waited as of current_time"""
         if self.boarding_time:
             return self.boarding_time - self.arrival_time
         return current_time - self.arrival_time
@@ -78,9 +194,9 @@ class Elevator:
 
         # Passengers and requests
         self.passengers: List[Person] = []
-        self.up_requests: Set[int] = set()  # Floors with up requests
-        self.down_requests: Set[int] = set()  # Floors with down requests
-        self.destination_floors: Set[int] = set()  # Internal destination requests
+        self.up_requests = FloorSet()  # Floors with up requests
+        self.down_requests = FloorSet()  # Floors with down requests
+        self.destination_floors = FloorSet()  # Internal destination requests
 
         # Statistics
         self.total_passengers_served = 0
@@ -108,17 +224,21 @@ class Elevator:
         """Add an internal destination (passenger's target floor)"""
         self.destination_floors.add(floor)
 
-    def board_passenger(self, person: Person) -> bool:
+    def board_passenger(
+        self, person: Person, current_time: Optional[float] = None
+    ) -> bool:
         """Try to board a passenger. Returns True if successful."""
         if self.is_full:
             return False
 
-        person.boarding_time = time.time()
+        person.boarding_time = current_time if current_time is not None else time.time()
         self.passengers.append(person)
         self.add_destination(person.destination_floor)
         return True
 
-    def unboard_passengers(self, floor: int) -> List[Person]:
+    def unboard_passengers(
+        self, floor: int, current_time: Optional[float] = None
+    ) -> List[Person]:
         """Remove passengers who have reached their destination"""
         passengers_leaving = [
             p for p in self.passengers if p.destination_floor == floor
@@ -126,13 +246,13 @@ class Elevator:
         self.passengers = [p for p in self.passengers if p.destination_floor != floor]
 
         # Mark visit start time for passengers reaching their destination
-        current_time = time.time()
+        if current_time is None:
+            current_time = time.time()
         for passenger in passengers_leaving:
             if not passenger.is_leaving and passenger.visit_duration:
                 passenger.visit_start_time = current_time
 
-        if floor in self.destination_floors:
-            self.destination_floors.remove(floor)
+        self.destination_floors.discard(floor)
 
         self.total_passengers_served += len(passengers_leaving)
         return passengers_leaving
@@ -142,67 +262,70 @@ class Elevator:
     ) -> bool:
         """Check if there are any requests in the given direction"""
         if direction == Direction.UP:
-            up_floors = [f for f in self.up_requests if f > current_floor]
-            dest_floors = [f for f in self.destination_floors if f > current_floor]
-            return bool(up_floors or dest_floors)
+            mask = self.up_requests.mask | self.destination_floors.mask
+            return mask >> (current_floor + 1) != 0
         elif direction == Direction.DOWN:
-            down_floors = [f for f in self.down_requests if f < current_floor]
-            dest_floors = [f for f in self.destination_floors if f < current_floor]
-            return bool(down_floors or dest_floors)
+            mask = self.down_requests.mask | self.destination_floors.mask
+            return mask & ((1 << current_floor) - 1) != 0
         return False
 
     def get_next_stop(self) -> Optional[int]:
         """Determine the next floor this elevator should stop at"""
-        current = self.current_floor
+        return self._next_stop(self.direction, self.current_floor)
 
+    def _next_stop(self, direction: Direction, current: int) -> Optional[int]:
+        """Next floor to stop at when travelling in direction from current"""
         # Find next stop in current direction (NOT including current floor)
-        if self.direction == Direction.UP:
-            candidates = [f for f in self.destination_floors if f > current]
-            candidates.extend([f for f in self.up_requests if f > current])
-            if candidates:
-                return min(candidates)
-        elif self.direction == Direction.DOWN:
-            candidates = [f for f in self.destination_floors if f < current]
-            candidates.extend([f for f in self.down_requests if f < current])
-            if candidates:
-                return max(candidates)
-        elif self.direction == Direction.IDLE:
+        if direction == Direction.UP:
+            return _lowest_above(
+                self.destination_floors.mask | self.up_requests.mask, current
+            )
+        elif direction == Direction.DOWN:
+            return _highest_below(
+                self.destination_floors.mask | self.down_requests.mask, current
+            )
+        elif direction == Direction.IDLE:
             # When idle, find ANY destination or request (excluding current floor)
-            if self.destination_floors:
-                if candidates := [f for f in self.destination_floors if f != current]:
-                    return min(candidates, key=lambda f: abs(f - current))
-            if all_requests := [
-                f
-                for f in list(self.up_requests) + list(self.down_requests)
-                if f != current
-            ]:
-                return min(all_requests, key=lambda f: abs(f - current))
+            nearest = _nearest_other(self.destination_floors.mask, current)
+            if nearest is None:
+                nearest = _nearest_other(
+                    self.up_requests.mask | self.down_requests.mask, current
+                )
+            return nearest
         return None
 
     def update_direction(self):
         """Update elevator direction based on pending requests"""
         current = self.current_floor
+        self.direction = _resolve_direction(
+            self.direction,
+            self.has_requests_in_direction(Direction.UP, current),
+            self.has_requests_in_direction(Direction.DOWN, current),
+        )
 
-        # If we have requests in current direction, continue
-        if self.has_requests_in_direction(self.direction, current):
-            return
+    def compute_step_plan(self) -> StepPlan:
+        """
+        Work out the direction and next stop for a control step.
 
-        # Change direction if we have requests in the opposite direction
-        if self.direction == Direction.UP:
-            self.direction = (
-                Direction.DOWN
-                if self.has_requests_in_direction(Direction.DOWN, current)
-                else Direction.IDLE
-            )
-        elif self.direction == Direction.DOWN:
-            if self.has_requests_in_direction(Direction.UP, current):
-                self.direction = Direction.UP
-            else:
-                self.direction = Direction.IDLE
-        elif self.has_requests_in_direction(Direction.UP, current):
-            self.direction = Direction.UP
-        elif self.has_requests_in_direction(Direction.DOWN, current):
-            self.direction = Direction.DOWN
+        Equivalent to update_direction followed by get_next_stop, but reads
+        each request mask once and does not change the elevator. The
+        has_more_* flags report requests strictly above or below the car.
+        """
+        current = self.current_floor
+        destinations = self.destination_floors.mask
+        up_mask = self.up_requests.mask | destinations
+        down_mask = self.down_requests.mask | destinations
+        has_more_up = up_mask >> (current + 1) != 0
+        has_more_down = down_mask & ((1 << current) - 1) != 0
+
+        direction = _resolve_direction(self.direction, has_more_up, has_more_down)
+        if direction == Direction.UP:
+            next_stop = _lowest_above(up_mask, current)
+        elif direction == Direction.DOWN:
+            next_stop = _highest_below(down_mask, current)
+        else:
+            next_stop = self._next_stop(direction, current)
+        return StepPlan(direction, next_stop, has_more_up, has_more_down)
 
     def move_to_floor(self, target_floor: int) -> float:
         """Simulate movement to target floor. Returns travel time."""
@@ -222,11 +345,17 @@ class Elevator:
         return travel_time
 
     def handle_floor_stop(
-        self, floor: int, waiting_people: List[Person]
+        self,
+        floor: int,
+        waiting_people: List[Person],
+        current_time: Optional[float] = None,
     ) -> Tuple[List[Person], List[Person]]:
         """Handle stopping at a floor - unboard and board passengers"""
+        if current_time is None:
+            current_time = time.time()
+
         # Unboard passengers
-        passengers_leaving = self.unboard_passengers(floor)
+        passengers_leaving = self.unboard_passengers(floor, current_time)
 
         # Board new passengers
         passengers_boarding = []
@@ -239,7 +368,7 @@ class Elevator:
                 person.direction == self.direction or self.direction == Direction.IDLE
             )
 
-            if can_board and self.board_passenger(person):
+            if can_board and self.board_passenger(person, current_time):
                 passengers_boarding.append(person)
                 # If we were idle, adopt the passenger's direction
                 if self.direction == Direction.IDLE:
@@ -274,6 +403,10 @@ class Building:
         self.elevators: List[Elevator] = []
         self.strategy = strategy  # ElevatorAssignmentStrategy instance
 
+        # Source of the current time. Wall-clock by default; a simulation in
+        # simulated-time mode installs its virtual clock here.
+        self.clock: Callable[[], float] = time.time
+
         # Create elevators
         for i in range(self.num_elevators):
             elevator = Elevator(elevator_id=i + 1)
@@ -291,6 +424,9 @@ class Building:
         self.total_people_generated = 0
         self.total_people_completed = 0
         self.completed_journeys: List[Person] = []
+        # Completion time of each journey, parallel to completed_journeys and
+        # non-decreasing, so recent journeys can be found by bisection
+        self.completed_journey_times: List[float] = []
 
         # Visitor management for realistic mall behavior
         self.active_visitors: Dict[int, Person] = {}  # visitor_id -> Person
@@ -316,13 +452,13 @@ class Building:
             and person.visit_duration
             and person.destination_floor != 1
         ):
-            return_time = time.time() + person.visit_duration
+            return_time = self.clock() + person.visit_duration
             self.pending_returns.append((return_time, person))
             self.active_visitors[person.id] = person
 
     def process_pending_returns(self):
         """Check for visitors who should start their return journey"""
-        current_time = time.time()
+        current_time = self.clock()
         returns_to_process = []
 
         # Find returns that are due
@@ -466,32 +602,54 @@ class Building:
     ):
         """Remove people from waiting list (they boarded an elevator)"""
         if direction == Direction.UP:
-            for person in people:
-                if person in self.waiting_up[floor]:
-                    self.waiting_up[floor].remove(person)
+            waiting = self.waiting_up[floor]
         elif direction == Direction.DOWN:
-            for person in people:
-                if person in self.waiting_down[floor]:
-                    self.waiting_down[floor].remove(person)
+            waiting = self.waiting_down[floor]
+        else:
+            return
+        if not people:
+            return
+
+        # One filtering pass instead of a scan-and-remove per person
+        boarded = {id(person) for person in people}
+        waiting[:] = [person for person in waiting if id(person) not in boarded]
+
+    def record_completed_journeys(self, people: List[Person], completed_at: float):
+        """Record passengers who reached their destination at completed_at"""
+        if not people:
+            return
+        self.total_people_completed += len(people)
+        self.completed_journeys.extend(people)
+        self.completed_journey_times.extend([completed_at] * len(people))
+
+    def get_recent_journeys(self, since: float) -> List[Person]:
+        """Get completed journeys whose passenger boarded after since"""
+        # A journey completes after boarding, so only those completed after
+        # since can qualify; skip the older ones without scanning them
+        start = bisect.bisect_right(self.completed_journey_times, since)
+        return [
+            person
+            for person in self.completed_journeys[start:]
+            if person.boarding_time is not None and person.boarding_time > since
+        ]
 
     def get_building_status(self) -> Dict:
         """Get current status of the entire building"""
-        total_waiting = sum(len(people) for people in self.waiting_up.values()) + sum(
-            len(people) for people in self.waiting_down.values()
-        )
+        # One pass over the waiting areas with a single clock read
+        current_time = self.clock()
+        total_waiting = 0
+        total_wait_time = 0.0
+        for waiting in (self.waiting_up, self.waiting_down):
+            for people in waiting.values():
+                if people:
+                    total_waiting += len(people)
+                    total_wait_time += sum(p.wait_time_at(current_time) for p in people)
 
         total_passengers = sum(e.passenger_count for e in self.elevators)
 
         avg_wait_time = 0
         if total_waiting > 0:
-            all_waiting = []
-            for people in self.waiting_up.values():
-                all_waiting.extend(people)
-            for people in self.waiting_down.values():
-                all_waiting.extend(people)
-            avg_wait_time = int(
-                sum(p.wait_time for p in all_waiting) / len(all_waiting)
-            )
+            avg_wait_time = int(total_wait_time / total_waiting)
 
         return {
             "total_waiting": total_waiting,
@@ -569,7 +727,7 @@ class PersonGenerator:
             id=self.person_id_counter,
             current_floor=current_floor,
             destination_floor=destination_floor,
-            arrival_time=time.time(),
+            arrival_time=self.building.clock(),
             visit_duration=visit_duration,
             is_leaving=False,
         )
@@ -601,7 +759,7 @@ class PersonGenerator:
             id=self.person_id_counter,
             current_floor=current_floor,
             destination_floor=1,  # Always return to ground floor to exit
-            arrival_time=time.time(),
+            arrival_time=self.building.clock(),
             is_leaving=True,
         )
 
@@ -6,10 +6,13 @@ Provides event-driven architecture for monitoring elevator system events.
 Allows components to publish and subscribe to events without tight coupling.
 """
 
-from typing import Callable, Dict, List, Any, Optional
+from typing import BinaryIO, Callable, Dict, Iterable, List, Any, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from itertools import islice
+import array
+import sys
 import threading
 
 
@@ -45,6 +48,13 @@ class EventType(Enum):
     EFFICIENCY_CHANGE = "efficiency_change"
 
 
+# Fixed ordinal for each event type, used to index per-type counters
+_ORDINAL: Dict[EventType, int] = {et: i for i, et in enumerate(EventType)}
+
+# Interned event type value strings, indexed by ordinal
+_EVENT_KEYS: Tuple[str, ...] = tuple(sys.intern(et.value) for et in EventType)
+
+
 @dataclass
 class Event:
     """Represents an event in the system"""
@@ -55,7 +65,12 @@ class Event:
     source: Optional[str] = None
 
     def __str__(self):
-        return f"[{self.timestamp.strftime('%H:%M:%S.%f')[:-3]}] {self.event_type.value}: {self.data}"
+        # Format HH:MM:SS.mmm from integer fields; strftime is slow per call
+        ts = self.timestamp
+        return (
+            f"[{ts.hour:02d}:{ts.minute:02d}:{ts.second:02d}."
+            f"{ts.microsecond // 1000:03d}] {self.event_type.value}: {self.data}"
+        )
 
 
 class EventBus:
@@ -67,7 +82,8 @@ class EventBus:
     """
 
     def __init__(self):
-        self._subscribers: Dict[EventType, List[Callable[[Event], None]]] = {}
+        # Handlers per event type, kept as an insertion-ordered set
+        self._subscribers: Dict[EventType, Dict[Callable[[Event], None], None]] = {}
         self._lock = threading.Lock()
         self._event_history: List[Event] = []
         self._max_history_size = 1000
@@ -78,14 +94,14 @@ class EventBus:
         """
         Subscribe to an event type.
 
+        Subscribing the same handler twice to one event type has no effect.
+
         Args:
             event_type: Type of event to subscribe to
             handler: Callback function that takes an Event parameter
         """
         with self._lock:
-            if event_type not in self._subscribers:
-                self._subscribers[event_type] = []
-            self._subscribers[event_type].append(handler)
+            self._subscribers.setdefault(event_type, {})[handler] = None
 
     def unsubscribe(
         self, event_type: EventType, handler: Callable[[Event], None]
@@ -99,10 +115,7 @@ class EventBus:
         """
         with self._lock:
             if event_type in self._subscribers:
-                try:
-                    self._subscribers[event_type].remove(handler)
-                except ValueError:
-                    pass  # Handler not found
+                self._subscribers[event_type].pop(handler, None)
 
     def publish(
         self,
@@ -127,7 +140,7 @@ class EventBus:
                 self._event_history.pop(0)
 
             # Get subscribers
-            handlers = self._subscribers.get(event_type, []).copy()
+            handlers = tuple(self._subscribers.get(event_type, ()))
 
         # Call handlers outside lock to avoid deadlocks
         for handler in handlers:
@@ -150,14 +163,13 @@ class EventBus:
             List of events, most recent last
         """
         with self._lock:
-            events = self._event_history.copy()
-
-        if event_type:
-            events = [e for e in events if e.event_type == event_type]
-
-        if limit:
-            events = events[-limit:]
+            # Walk backwards so a small limit stops early
+            it: Iterable[Event] = reversed(self._event_history)
+            if event_type:
+                it = (e for e in it if e.event_type is event_type)
+            events = list(islice(it, limit)) if limit else list(it)
 
+        events.reverse()
         return events
 
     def clear_history(self) -> None:
@@ -209,27 +221,38 @@ class EventLogger:
         self.event_bus = event_bus
         self.verbose = verbose
         self.log_file = None
+        self._fh: Optional[BinaryIO] = None
+        self._subscribed = False
 
     def start(self, log_file: Optional[str] = None):
-        """Start logging events"""
+        """Start logging events, first stopping any logging already running"""
+        self.stop()
         self.log_file = log_file
+        if not (self.verbose or log_file):
+            return  # Nothing would be written; skip the subscription entirely
+
+        if log_file:
+            self._fh = open(log_file, "ab")
         self.event_bus.subscribe_all(self._log_event)
+        self._subscribed = True
 
     def stop(self):
         """Stop logging events"""
-        self.event_bus.unsubscribe_all(self._log_event)
-        if self.log_file:
-            # Could flush/close file here
-            pass
+        if self._subscribed:
+            self.event_bus.unsubscribe_all(self._log_event)
+            self._subscribed = False
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
 
     def _log_event(self, event: Event):
         """Log an event"""
         if self.verbose:
             print(f"EVENT: {event}")
 
-        if self.log_file:
-            with open(self.log_file, "a") as f:
-                f.write(f"{event}\n")
+        if self._fh is not None:
+            self._fh.write(f"{event}\n".encode("utf-8"))
+            self._fh.flush()  # keep the log complete if the process dies
 
 
 class EventMetrics:
@@ -239,45 +262,44 @@ class EventMetrics:
         self.event_bus = event_bus
         self.metrics: Dict[str, Any] = {
             "total_events": 0,
-            "events_by_type": {},
             "average_wait_times": [],
             "elevator_movements": 0,
             "passengers_served": 0,
         }
+        # Per-type counts indexed by EventType ordinal
+        self._event_counts = array.array("Q", [0] * len(_ORDINAL))
 
     def start(self):
         """Start collecting metrics"""
-        self.event_bus.subscribe(EventType.PERSON_ARRIVED, self._on_person_arrived)
-        self.event_bus.subscribe(EventType.ELEVATOR_MOVING, self._on_elevator_moving)
         self.event_bus.subscribe_all(self._on_any_event)
 
     def stop(self):
         """Stop collecting metrics"""
-        self.event_bus.unsubscribe(EventType.PERSON_ARRIVED, self._on_person_arrived)
-        self.event_bus.unsubscribe(EventType.ELEVATOR_MOVING, self._on_elevator_moving)
         self.event_bus.unsubscribe_all(self._on_any_event)
 
     def _on_any_event(self, event: Event):
         """Track all events"""
-        self.metrics["total_events"] += 1
-        event_type_str = event.event_type.value
-        if event_type_str not in self.metrics["events_by_type"]:
-            self.metrics["events_by_type"][event_type_str] = 0
-        self.metrics["events_by_type"][event_type_str] += 1
-
-    def _on_person_arrived(self, event: Event):
-        """Track person arrivals"""
-        self.metrics["passengers_served"] += 1
-        if "wait_time" in event.data:
-            self.metrics["average_wait_times"].append(event.data["wait_time"])
-
-    def _on_elevator_moving(self, event: Event):
-        """Track elevator movements"""
-        self.metrics["elevator_movements"] += 1
+        event_type = event.event_type
+        metrics = self.metrics
+        self._event_counts[_ORDINAL[event_type]] += 1
+        metrics["total_events"] += 1
+
+        if event_type is EventType.ELEVATOR_MOVING:
+            metrics["elevator_movements"] += 1
+        elif event_type is EventType.PERSON_ARRIVED:
+            metrics["passengers_served"] += 1
+            data = event.data
+            if "wait_time" in data:
+                metrics["average_wait_times"].append(data["wait_time"])
 
     def get_metrics(self) -> Dict[str, Any]:
         """Get collected metrics"""
         metrics = self.metrics.copy()
+        metrics["events_by_type"] = {
+            _EVENT_KEYS[i]: count
+            for i, count in enumerate(self._event_counts)
+            if count
+        }
         if metrics["average_wait_times"]:
             metrics["avg_wait_time"] = sum(metrics["average_wait_times"]) / len(
                 metrics["average_wait_times"]
@@ -290,8 +312,8 @@ class EventMetrics:
         """Reset metrics"""
         self.metrics = {
             "total_events": 0,
-            "events_by_type": {},
             "average_wait_times": [],
             "elevator_movements": 0,
             "passengers_served": 0,
         }
+        self._event_counts = array.array("Q", [0] * len(_ORDINAL))
@@ -53,6 +53,9 @@ class ElevatorConfig:
 class ElevatorAssignmentStrategy(ABC):
     """Abstract strategy for assigning elevators to requests"""
 
+    # Lets stateless strategies drop the per-instance __dict__
+    __slots__ = ()
+
     @abstractmethod
     def assign_elevator(
         self,
@@ -5,12 +5,14 @@ Data Persistence - Save and Replay Simulations
 Save simulation state and replay simulations for analysis.
 """
 
-import json
-from typing import Dict, Any, List, Optional
-from dataclasses import dataclass, field, asdict
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 import gzip
+import time
+
+from src.utils.compat import json_dumps, json_loads
 
 
 @dataclass
@@ -19,6 +21,8 @@ class SimulationSnapshot:
 
     timestamp: datetime = field(default_factory=datetime.now)
     simulation_time: float = 0.0
+    # Monotonic capture time, used for cheap ordering and file naming
+    timestamp_ns: int = field(default_factory=time.monotonic_ns)
 
     # Building state
     num_floors: int = 0
@@ -39,10 +43,20 @@ class SimulationSnapshot:
     strategy_name: str = ""
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary"""
-        data = asdict(self)
-        data["timestamp"] = self.timestamp.isoformat()
-        return data
+        """Convert to dictionary (nested containers are shared, not copied)"""
+        return {
+            "timestamp": self.timestamp.isoformat(),
+            "simulation_time": self.simulation_time,
+            "timestamp_ns": self.timestamp_ns,
+            "num_floors": self.num_floors,
+            "num_elevators": self.num_elevators,
+            "elevators": self.elevators,
+            "waiting_people": self.waiting_people,
+            "in_transit_people": self.in_transit_people,
+            "statistics": self.statistics,
+            "config": self.config,
+            "strategy_name": self.strategy_name,
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "SimulationSnapshot":
@@ -89,6 +103,18 @@ class SimulationRecording:
         self.end_time = datetime.now()
         self.final_statistics = final_stats
 
+    def snapshot_to_dict(self, snapshot: SimulationSnapshot) -> Dict[str, Any]:
+        """
+        Convert a snapshot to a dictionary, leaving out the config and
+        strategy name when they match the recording's own values.
+        """
+        data = snapshot.to_dict()
+        if snapshot.config is self.config or snapshot.config == self.config:
+            del data["config"]
+        if snapshot.strategy_name == self.strategy_name:
+            del data["strategy_name"]
+        return data
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
         return {
@@ -97,7 +123,7 @@ class SimulationRecording:
             "end_time": self.end_time.isoformat() if self.end_time else None,
             "config": self.config,
             "strategy_name": self.strategy_name,
-            "snapshots": [s.to_dict() for s in self.snapshots],
+            "snapshots": [self.snapshot_to_dict(s) for s in self.snapshots],
             "events": self.events,
             "final_statistics": self.final_statistics,
             "metadata": self.metadata,
@@ -106,6 +132,10 @@ class SimulationRecording:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "SimulationRecording":
         """Create from dictionary"""
+        config = data.get("config", {})
+        strategy_name = data.get("strategy_name", "")
+        # Snapshots omit config/strategy_name when they match the recording
+        shared = {"config": config, "strategy_name": strategy_name}
         return cls(
             session_id=data["session_id"],
             start_time=datetime.fromisoformat(data["start_time"]),
@@ -114,10 +144,11 @@ class SimulationRecording:
                 if data.get("end_time")
                 else None
             ),
-            config=data.get("config", {}),
-            strategy_name=data.get("strategy_name", ""),
+            config=config,
+            strategy_name=strategy_name,
             snapshots=[
-                SimulationSnapshot.from_dict(s) for s in data.get("snapshots", [])
+                SimulationSnapshot.from_dict({**shared, **s})
+                for s in data.get("snapshots", [])
             ],
             events=data.get("events", []),
             final_statistics=data.get("final_statistics", {}),
@@ -126,12 +157,142 @@ class SimulationRecording:
 
 
 class SimulationPersistence:
-    """Handles saving and loading simulation data"""
+    """
+    Handles saving and loading simulation data.
+
+    Two on-disk layouts are supported under the same ``sim_<id>.json[.gz]``
+    name: a single JSON document written by ``save_recording``, and an
+    append-only journal of one JSON record per line written by
+    ``write_records``. The journal starts with a ``header`` record and is
+    followed by ``snapshot``, ``event`` and ``footer`` records.
+    """
 
     def __init__(self, storage_dir: str = "simulation_data"):
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(parents=True, exist_ok=True)
 
+    def recording_path(self, session_id: str, compress: bool) -> Path:
+        """Path of a recording file"""
+        filename = f"sim_{session_id}.json"
+        if compress:
+            filename += ".gz"
+        return self.storage_dir / filename
+
+    def metadata_path(self, session_id: str) -> Path:
+        """Path of the metadata sidecar for a recording"""
+        return self.storage_dir / f"sim_{session_id}.meta.json"
+
+    def write_metadata(self, recording: SimulationRecording) -> None:
+        """
+        Write the small metadata sidecar used by list_recordings.
+
+        Args:
+            recording: Recording to describe
+        """
+        metadata = {
+            "session_id": recording.session_id,
+            "start_time": recording.start_time.isoformat(),
+            "end_time": recording.end_time.isoformat() if recording.end_time else None,
+            "strategy_name": recording.strategy_name or "unknown",
+            "num_snapshots": len(recording.snapshots),
+            "num_events": len(recording.events),
+        }
+        with open(self.metadata_path(recording.session_id), "wb") as f:
+            f.write(json_dumps(metadata))
+
+    def write_records(
+        self,
+        session_id: str,
+        records: Iterable[Dict[str, Any]],
+        compress: bool = True,
+        append: bool = True,
+    ) -> str:
+        """
+        Write journal records to a recording file.
+
+        Each call with compress=True adds a complete gzip member, so data
+        from earlier calls stays readable even if the process dies later.
+
+        Args:
+            session_id: Session ID of the recording
+            records: Records to write, each tagged with a "record" type
+            compress: Whether to use gzip compression
+            append: Append to the file instead of truncating it
+
+        Returns:
+            Path to the recording file
+        """
+        filepath = self.recording_path(session_id, compress)
+        payload = b"".join(json_dumps(record) + b"\n" for record in records)
+        mode = "ab" if append else "wb"
+
+        if compress:
+            with gzip.open(filepath, mode, compresslevel=1) as f:
+                f.write(payload)
+        else:
+            with open(filepath, mode) as f:
+                f.write(payload)
+
+        return str(filepath)
+
+    def _iter_file_records(
+        self, filepath: Path
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Stream (record type, record) pairs from a recording in either layout"""
+        opener = gzip.open if filepath.suffix == ".gz" else open
+        with opener(filepath, "rb") as f:
+            first_line = f.readline()
+            try:
+                first = json_loads(first_line)
+            except ValueError:
+                # Multi-line (pretty-printed) single document
+                first = json_loads(first_line + f.read())
+
+            if not (isinstance(first, dict) and first.get("record") == "header"):
+                yield from _document_records(first)
+                return
+
+            yield "header", {k: v for k, v in first.items() if k != "record"}
+            try:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        record = json_loads(line)
+                    except ValueError:
+                        if f.read().strip():
+                            raise
+                        # Half-written last record; keep what came before it
+                        print(f"Skipping truncated record at end of {filepath}")
+                        return
+                    yield record.pop("record"), record
+            except EOFError:
+                pass  # Truncated trailing member; keep what was written
+
+    def _read_document(self, filepath: Path) -> Dict[str, Any]:
+        """Read a recording file in either layout as a recording dict"""
+        data: Dict[str, Any] = {
+            "end_time": None,
+            "final_statistics": {},
+            "snapshots": [],
+            "events": [],
+        }
+        for kind, record in self._iter_file_records(filepath):
+            if kind == "snapshot":
+                data["snapshots"].append(record)
+            elif kind == "event":
+                data["events"].append(record["data"])
+            elif kind in ("header", "footer"):
+                data.update(record)
+        return data
+
+    def _find_recording(self, session_id: str) -> Path:
+        """Locate a recording file, preferring the compressed one"""
+        filepath = self.recording_path(session_id, compress=True)
+        if not filepath.exists():
+            filepath = self.recording_path(session_id, compress=False)
+        return filepath
+
     def save_recording(
         self, recording: SimulationRecording, compress: bool = True
     ) -> str:
@@ -145,21 +306,19 @@ class SimulationPersistence:
         Returns:
             Path to saved file
         """
-        filename = f"sim_{recording.session_id}.json"
-        if compress:
-            filename += ".gz"
-
-        filepath = self.storage_dir / filename
+        filepath = self.recording_path(recording.session_id, compress)
 
-        data = recording.to_dict()
+        payload = json_dumps(recording.to_dict())
 
         if compress:
-            with gzip.open(filepath, "wt", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            # Favour speed over ratio; recordings are written far more than read
+            with gzip.open(filepath, "wb", compresslevel=1) as f:
+                f.write(payload)
         else:
-            with open(filepath, "w") as f:
-                json.dump(data, f, indent=2)
+            with open(filepath, "wb") as f:
+                f.write(payload)
 
+        self.write_metadata(recording)
         return str(filepath)
 
     def load_recording(self, session_id: str) -> SimulationRecording:
@@ -172,49 +331,67 @@ class SimulationPersistence:
         Returns:
             SimulationRecording
         """
-        # Try compressed first
-        filepath = self.storage_dir / f"sim_{session_id}.json.gz"
-        if filepath.exists():
-            with gzip.open(filepath, "rt", encoding="utf-8") as f:
-                data = json.load(f)
-        else:
-            # Try uncompressed
-            filepath = self.storage_dir / f"sim_{session_id}.json"
-            with open(filepath, "r") as f:
-                data = json.load(f)
+        filepath = self._find_recording(session_id)
+        return SimulationRecording.from_dict(self._read_document(filepath))
+
+    def load_recording_header(self, session_id: str) -> Dict[str, Any]:
+        """
+        Load recording metadata without decoding its snapshots.
+
+        Falls back to a full read for recordings without a metadata sidecar.
+
+        Args:
+            session_id: Session ID of the recording
+
+        Returns:
+            Dictionary with session_id, start_time, end_time, strategy_name,
+            num_snapshots and num_events
+        """
+        metadata_path = self.metadata_path(session_id)
+        if metadata_path.exists():
+            with open(metadata_path, "rb") as f:
+                return json_loads(f.read())
+        return _summarize(self._read_document(self._find_recording(session_id)))
 
-        return SimulationRecording.from_dict(data)
+    def iter_records(self, session_id: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Stream the records of a recording one at a time.
+
+        Yields ("header", ...), then "snapshot" and "event" records in the
+        order they were written, and a "footer" once the recording was
+        finalized. Event records carry the event under "data".
+
+        Args:
+            session_id: Session ID of the recording
+        """
+        return self._iter_file_records(self._find_recording(session_id))
 
     def list_recordings(self) -> List[Dict[str, Any]]:
         """
         List all available recordings.
 
+        Reads the metadata sidecar when present and only falls back to
+        decoding the full recording for files written without one.
+
         Returns:
             List of recording metadata
         """
         recordings = []
 
         for filepath in self.storage_dir.glob("sim_*.json*"):
+            if filepath.name.endswith(".meta.json"):
+                continue
             try:
-                # Quick load just the metadata
-                if filepath.suffix == ".gz":
-                    with gzip.open(filepath, "rt", encoding="utf-8") as f:
-                        data = json.load(f)
+                session_id = filepath.name[len("sim_") :].split(".json")[0]
+                metadata_path = self.metadata_path(session_id)
+                if metadata_path.exists():
+                    with open(metadata_path, "rb") as f:
+                        info = json_loads(f.read())
                 else:
-                    with open(filepath, "r") as f:
-                        data = json.load(f)
-
-                recordings.append(
-                    {
-                        "session_id": data["session_id"],
-                        "start_time": data["start_time"],
-                        "end_time": data.get("end_time"),
-                        "strategy_name": data.get("strategy_name", "unknown"),
-                        "num_snapshots": len(data.get("snapshots", [])),
-                        "num_events": len(data.get("events", [])),
-                        "filepath": str(filepath),
-                    }
-                )
+                    info = _summarize(self._read_document(filepath))
+
+                info["filepath"] = str(filepath)
+                recordings.append(info)
             except Exception as e:
                 print(f"Error reading {filepath}: {e}")
 
@@ -230,6 +407,10 @@ class SimulationPersistence:
         Returns:
             True if deleted, False if not found
         """
+        metadata_path = self.metadata_path(session_id)
+        if metadata_path.exists():
+            metadata_path.unlink()
+
         for pattern in [f"sim_{session_id}.json", f"sim_{session_id}.json.gz"]:
             filepath = self.storage_dir / pattern
             if filepath.exists():
@@ -251,12 +432,11 @@ class SimulationPersistence:
         snapshot_dir = self.storage_dir / f"snapshots_{session_id}"
         snapshot_dir.mkdir(parents=True, exist_ok=True)
 
-        timestamp = snapshot.timestamp.strftime("%Y%m%d_%H%M%S_%f")
-        filename = f"snapshot_{timestamp}.json"
+        filename = f"snapshot_{snapshot.timestamp_ns}.json"
         filepath = snapshot_dir / filename
 
-        with open(filepath, "w") as f:
-            json.dump(snapshot.to_dict(), f, indent=2)
+        with open(filepath, "wb") as f:
+            f.write(json_dumps(snapshot.to_dict()))
 
         return str(filepath)
 
@@ -289,19 +469,53 @@ class SimulationPersistence:
             )
 
             # Data from snapshots
-            for snapshot in recording.snapshots:
-                stats = snapshot.statistics
-                writer.writerow(
-                    [
-                        snapshot.timestamp.isoformat(),
-                        snapshot.simulation_time,
-                        stats.get("total_generated", 0),
-                        stats.get("total_completed", 0),
-                        stats.get("total_waiting", 0),
-                        stats.get("avg_wait_time", 0.0),
-                        stats.get("throughput", 0.0),
-                    ]
-                )
+            writer.writerows(_csv_rows(recording.snapshots))
+
+
+def _document_records(data: Dict[str, Any]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Present a single-document recording as journal records"""
+    yield "header", {
+        "session_id": data["session_id"],
+        "start_time": data["start_time"],
+        "config": data.get("config", {}),
+        "strategy_name": data.get("strategy_name", ""),
+        "metadata": data.get("metadata", {}),
+    }
+    for snapshot in data.get("snapshots", []):
+        yield "snapshot", snapshot
+    for event in data.get("events", []):
+        yield "event", {"data": event}
+    yield "footer", {
+        "end_time": data.get("end_time"),
+        "final_statistics": data.get("final_statistics", {}),
+    }
+
+
+def _summarize(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Build list_recordings metadata from a full recording dict"""
+    return {
+        "session_id": data["session_id"],
+        "start_time": data["start_time"],
+        "end_time": data.get("end_time"),
+        "strategy_name": data.get("strategy_name") or "unknown",
+        "num_snapshots": len(data.get("snapshots", [])),
+        "num_events": len(data.get("events", [])),
+    }
+
+
+def _csv_rows(snapshots: Iterable[SimulationSnapshot]) -> Iterable[tuple]:
+    """Yield one CSV row per snapshot for export_to_csv"""
+    for snapshot in snapshots:
+        stats_get = snapshot.statistics.get
+        yield (
+            snapshot.timestamp.isoformat(),
+            snapshot.simulation_time,
+            stats_get("total_generated", 0),
+            stats_get("total_completed", 0),
+            stats_get("total_waiting", 0),
+            stats_get("avg_wait_time", 0.0),
+            stats_get("throughput", 0.0),
+        )
 
 
 class SimulationRecorder:
@@ -330,6 +544,12 @@ class SimulationRecorder:
         self.auto_save_interval = auto_save_interval
         self.snapshot_count = 0
 
+        # Journal progress: what has already been written to disk
+        self._journal_path: Optional[str] = None
+        self._saved_snapshots = 0
+        self._saved_events = 0
+        self._footer_saved = False
+
     def start(
         self,
         config: Dict[str, Any],
@@ -345,6 +565,10 @@ class SimulationRecorder:
             metadata=metadata or {},
         )
         self.snapshot_count = 0
+        self._journal_path = None
+        self._saved_snapshots = 0
+        self._saved_events = 0
+        self._footer_saved = False
 
     def record_snapshot(self, snapshot: SimulationSnapshot):
         """Record a snapshot"""
@@ -370,10 +594,60 @@ class SimulationRecorder:
             self.recording.finalize(final_stats)
 
     def save(self, compress: bool = True) -> Optional[str]:
-        """Save the recording"""
-        if self.recording:
-            return self.persistence.save_recording(self.recording, compress=compress)
-        return None
+        """
+        Save the recording.
+
+        Only records added since the previous save are written, so repeated
+        auto-saves cost O(new records) rather than rewriting the session.
+        """
+        if not self.recording:
+            return None
+
+        recording = self.recording
+        path = str(self.persistence.recording_path(recording.session_id, compress))
+        start_new = path != self._journal_path
+        if start_new:
+            self._saved_snapshots = 0
+            self._saved_events = 0
+            self._footer_saved = False
+
+        records: List[Dict[str, Any]] = []
+        if start_new:
+            records.append(
+                {
+                    "record": "header",
+                    "session_id": recording.session_id,
+                    "start_time": recording.start_time.isoformat(),
+                    "config": recording.config,
+                    "strategy_name": recording.strategy_name,
+                    "metadata": recording.metadata,
+                }
+            )
+        for snapshot in recording.snapshots[self._saved_snapshots :]:
+            record = recording.snapshot_to_dict(snapshot)
+            record["record"] = "snapshot"
+            records.append(record)
+        records.extend(
+            {"record": "event", "data": event}
+            for event in recording.events[self._saved_events :]
+        )
+        if recording.end_time is not None and not self._footer_saved:
+            records.append(
+                {
+                    "record": "footer",
+                    "end_time": recording.end_time.isoformat(),
+                    "final_statistics": recording.final_statistics,
+                }
+            )
+            self._footer_saved = True
+
+        self._journal_path = self.persistence.write_records(
+            recording.session_id, records, compress=compress, append=not start_new
+        )
+        self.persistence.write_metadata(recording)
+        self._saved_snapshots = len(recording.snapshots)
+        self._saved_events = len(recording.events)
+        return self._journal_path
 
     def get_session_id(self) -> Optional[str]:
         """Get current session ID"""
@@ -394,19 +668,42 @@ class SimulationReplayer:
             session_id: Session to replay
             callback: Optional callback function called for each snapshot
         """
-        recording = self.persistence.load_recording(session_id)
+        header = self.persistence.load_recording_header(session_id)
+        start_time = datetime.fromisoformat(header["start_time"])
+        end_time = (
+            datetime.fromisoformat(header["end_time"]) if header["end_time"] else None
+        )
+        num_snapshots = header["num_snapshots"]
 
         print(f"\n{'='*80}")
         print(f"REPLAYING SIMULATION: {session_id}")
         print(f"{'='*80}")
-        print(f"Strategy: {recording.strategy_name}")
-        print(f"Duration: {recording.start_time} -> {recording.end_time}")
-        print(f"Snapshots: {len(recording.snapshots)}")
-        print(f"Events: {len(recording.events)}")
+        print(f"Strategy: {header['strategy_name']}")
+        print(f"Duration: {start_time} -> {end_time}")
+        print(f"Snapshots: {num_snapshots}")
+        print(f"Events: {header['num_events']}")
         print(f"{'='*80}\n")
 
-        for i, snapshot in enumerate(recording.snapshots):
-            print(f"\n--- Snapshot {i+1}/{len(recording.snapshots)} ---")
+        # Stream snapshots so memory use does not grow with recording length
+        final_statistics: Dict[str, Any] = {}
+        shared: Dict[str, Any] = {}
+        i = 0
+        for kind, record in self.persistence.iter_records(session_id):
+            if kind == "header":
+                shared = {
+                    "config": record.get("config", {}),
+                    "strategy_name": record.get("strategy_name", ""),
+                }
+                continue
+            if kind == "footer":
+                final_statistics = record.get("final_statistics", {})
+                continue
+            if kind != "snapshot":
+                continue
+
+            snapshot = SimulationSnapshot.from_dict({**shared, **record})
+            i += 1
+            print(f"\n--- Snapshot {i}/{num_snapshots} ---")
             print(f"Time: {snapshot.simulation_time:.1f}s")
             print(f"Statistics: {snapshot.statistics}")
 
@@ -416,7 +713,7 @@ class SimulationReplayer:
         print(f"\n{'='*80}")
         print("FINAL STATISTICS:")
         print(f"{'='*80}")
-        for key, value in recording.final_statistics.items():
+        for key, value in final_statistics.items():
             print(f"  {key}: {value}")
         print(f"{'='*80}\n")
 
@@ -9,13 +9,19 @@ passenger handling, and real-time scheduling.
 
 import time
 import threading
-from typing import List, Dict, Optional
-from queue import PriorityQueue
+from typing import Callable, Iterator, List, Dict, Optional, Tuple
 from dataclasses import dataclass
+import heapq
 import random
 
+from src.utils.compat import DATACLASS_SLOTS
 from src.utils.config_loader import get_config
 from src.core.strategy_factory import create_strategy
+from src.core.advanced_strategies import (
+    AdaptiveStrategy,
+    DestinationDispatchStrategy,
+    MLBasedStrategy,
+)
 from .elevator_simulator import (
     Building,
     Elevator,
@@ -23,12 +29,78 @@ from .elevator_simulator import (
     PersonGenerator,
     Direction,
     ElevatorState,
+    StepPlan,
 )
 
 
-@dataclass
+def _next_deadline(deadline: float, interval: float) -> float:
+    """
+    Return the monotonic time one interval past deadline.
+
+    Scheduling against a fixed timeline instead of "interval after the work
+    finished" keeps periodic tasks from drifting. If a task has fallen
+    behind, its schedule restarts from now rather than firing back-to-back
+    catch-up runs.
+    """
+    deadline += interval
+    now = time.monotonic()
+    return deadline if deadline > now else now
+
+
+# Outcome for a waiting passenger whose pickup depends on whether the car
+# still has requests further along its current direction
+_STOP_IF_NOTHING_AHEAD = None
+
+
+def _stop_decision(
+    direction: Direction, has_up: bool, has_down: bool, is_full: bool
+) -> Optional[bool]:
+    """
+    Decide whether to stop for waiting passengers.
+
+    Returns _STOP_IF_NOTHING_AHEAD when people are only waiting to travel
+    the opposite way: the car picks them up once nothing is left ahead.
+    """
+    if is_full:
+        return False
+    if direction == Direction.UP:
+        return True if has_up else (_STOP_IF_NOTHING_AHEAD if has_down else False)
+    if direction == Direction.DOWN:
+        return True if has_down else (_STOP_IF_NOTHING_AHEAD if has_up else False)
+    return has_up or has_down
+
+
+# Stop decisions keyed by (direction, has_up, has_down, is_full), built once
+# so the per-tick check is a single lookup instead of a chain of branches
+_STOP_TABLE: Dict[tuple, Optional[bool]] = {
+    (direction, has_up, has_down, is_full): _stop_decision(
+        direction, has_up, has_down, is_full
+    )
+    for direction in Direction
+    for has_up in (False, True)
+    for has_down in (False, True)
+    for is_full in (False, True)
+}
+
+
+def _elevator_signature(elevator: Elevator) -> tuple:
+    """The parts of an elevator's state that displays show"""
+    return (
+        elevator.current_floor,
+        elevator.state,
+        elevator.direction,
+        len(elevator.passengers),
+    )
+
+
+@dataclass(**DATACLASS_SLOTS)
 class SimulationEvent:
-    """Represents an event in the simulation timeline"""
+    """
+    Represents an event in the simulation timeline.
+
+    Events stay mutable: the scheduler re-queues an event by moving its
+    timestamp rather than allocating a new one.
+    """
 
     timestamp: float
     event_type: str
@@ -41,7 +113,14 @@ class SimulationEvent:
 
 
 class ElevatorController:
-    """Advanced controller for managing individual elevator operations"""
+    """
+    Advanced controller for managing individual elevator operations.
+
+    The controller has no thread of its own. SimulationEngine's scheduler
+    drives it by stepping the generator returned by _process_elevator_step.
+    The generator yields the wall-clock seconds it must wait, for loading or
+    for travel between floors.
+    """
 
     def __init__(
         self,
@@ -54,175 +133,189 @@ class ElevatorController:
         self.elevator = elevator
         self.building = building
         self.is_running = False
-        self.thread: Optional[threading.Thread] = None
         self.debug = debug
         self.time_scale = time_scale
         self.strategy = strategy
 
-        # Event queue for this elevator
-        self.event_queue: PriorityQueue = PriorityQueue()
+        # Timing parameters, read once rather than on every tick
+        self.reload_config()
 
-        # Performance metrics
+        # Event queue for this elevator (a heapq-ordered list)
+        self.event_queue: List[SimulationEvent] = []
+
+        # Performance metrics: wall-clock seconds spent idle and active,
+        # charged by the scheduler from the delays it waits out
         self.idle_time = 0
         self.active_time = 0
-        self.last_activity_time = time.time()
+
+        # Last get_elevator_status result and the state it was built from
+        self._status_key: Optional[tuple] = None
+        self._status_cache: Dict = {}
 
         # Track assignments for ML-based strategy
         # person_id -> assignment_idx
         self.pending_assignments: Dict[int, int] = {}
 
+    @property
+    def strategy(self):
+        """Assignment strategy shared with the building, if any"""
+        return self._strategy
+
+    @strategy.setter
+    def strategy(self, strategy):
+        # Resolve strategy capabilities once rather than on every boarding
+        self._strategy = strategy
+        self._is_dest_dispatch = isinstance(strategy, DestinationDispatchStrategy)
+        self._is_ml = isinstance(strategy, MLBasedStrategy)
+
+    def reload_config(self):
+        """Refresh cached timing parameters from the global config"""
+        config = get_config()
+        self._loop_interval = config.control_loop_interval
+        self._move_factor = config.movement_delay_factor
+
     def start(self):
-        """Start the elevator controller in a separate thread"""
-        if not self.is_running:
-            self.is_running = True
-            self.thread = threading.Thread(target=self._run_control_loop, daemon=True)
-            self.thread.start()
+        """Mark the controller as active so the scheduler steps it"""
+        self.is_running = True
 
     def stop(self):
         """Stop the elevator controller"""
         self.is_running = False
-        if self.thread:
-            self.thread.join(timeout=1.0)
 
-    def _run_control_loop(self):
-        """Main control loop for the elevator"""
-        config = get_config()
-        while self.is_running:
-            try:
-                self._process_elevator_step()
-                time.sleep(config.control_loop_interval * self.time_scale)
-            except Exception as e:
-                print(f"Error in elevator {self.elevator.id} control loop: {e}")
+    @property
+    def step_interval(self) -> float:
+        """Wall-clock seconds between the end of one step and the next"""
+        return self._loop_interval * self.time_scale
 
-    def _process_elevator_step(self):
-        """Process one step of elevator operation"""
-        current_time = time.time()
-
-        # Update activity tracking
-        if self.elevator.state != ElevatorState.IDLE:
-            self.active_time += current_time - self.last_activity_time
-        else:
-            self.idle_time += current_time - self.last_activity_time
-        self.last_activity_time = current_time
+    def _process_elevator_step(self) -> Iterator[float]:
+        """
+        Process one step of elevator operation.
 
+        Yields the number of seconds to wait before the step continues.
+        """
         # Update direction based on requests first
-        old_direction = self.elevator.direction
-        self.elevator.update_direction()
-
-        if self.debug and old_direction != self.elevator.direction:
-            if (
-                self.elevator.up_requests
-                or self.elevator.down_requests
-                or self.elevator.destination_floors
-            ):
-                print(
-                    f"E{self.elevator.id} Floor={self.elevator.current_floor}: "
-                    f"{old_direction.value} -> {self.elevator.direction.value} "
-                    f"(Dest={sorted(self.elevator.destination_floors)}, "
-                    f"Up={sorted(self.elevator.up_requests)}, "
-                    f"Down={sorted(self.elevator.down_requests)})"
-                )
+        plan = self.elevator.compute_step_plan()
+        if self.debug:
+            old_direction = self.elevator.direction
+            self.elevator.direction = plan.direction
+            self._log_direction_change(old_direction)
+        else:
+            self.elevator.direction = plan.direction
 
         # Check if we need to stop at current floor
-        if self._should_stop_at_current_floor():
-            self._handle_floor_stop()
+        if self._should_stop_at_current_floor(plan):
+            yield from self._handle_floor_stop()
             return
 
-        # Move towards next destination if we have one
-        next_stop = self.elevator.get_next_stop()
+        # Move towards next destination if we have one. Clearing stale
+        # requests at this floor above cannot change it.
+        next_stop = plan.next_stop
         if next_stop is not None and next_stop != self.elevator.current_floor:
-            self._move_towards_floor(next_stop)
+            yield from self._move_towards_floor(next_stop)
         else:
             # No requests, go idle
             self.elevator.state = ElevatorState.IDLE
             self.elevator.direction = Direction.IDLE
 
-    def _should_stop_at_current_floor(self) -> bool:
-        """Determine if elevator should stop at current floor"""
-        current_floor = self.elevator.current_floor
+    def track_activity(self, seconds: float):
+        """Charge seconds to active or idle time by the elevator's state"""
+        if self.elevator.state == ElevatorState.IDLE:
+            self.idle_time += seconds
+        else:
+            self.active_time += seconds
+
+    def _log_direction_change(self, old_direction: Direction):
+        """Print a debug line when a step changed the elevator's direction"""
+        elevator = self.elevator
+        if old_direction == elevator.direction:
+            return
+        if (
+            elevator.up_requests
+            or elevator.down_requests
+            or elevator.destination_floors
+        ):
+            print(
+                f"E{elevator.id} Floor={elevator.current_floor}: "
+                f"{old_direction.value} -> {elevator.direction.value} "
+                f"(Dest={sorted(elevator.destination_floors)}, "
+                f"Up={sorted(elevator.up_requests)}, "
+                f"Down={sorted(elevator.down_requests)})"
+            )
+
+    def _should_stop_at_current_floor(self, plan: Optional[StepPlan] = None) -> bool:
+        """
+        Determine if elevator should stop at current floor.
+
+        plan, when given, must be fresh for the current floor; it saves
+        rescanning the requests ahead of the car.
+        """
+        elevator = self.elevator
+        current_floor = elevator.current_floor
 
         # Stop if passengers want to get off
-        if current_floor in self.elevator.destination_floors:
+        if current_floor in elevator.destination_floors:
             return True
 
         # Check if there are people actually waiting, not just requests
-        has_people_waiting_up = (
-            len(self.building.get_waiting_people(current_floor, Direction.UP)) > 0
-        )
-        has_people_waiting_down = (
-            len(self.building.get_waiting_people(current_floor, Direction.DOWN)) > 0
-        )
+        has_people_waiting_up = bool(self.building.waiting_up[current_floor])
+        has_people_waiting_down = bool(self.building.waiting_down[current_floor])
 
         # Clean up stale requests - requests for current floor where nobody is waiting
-        if current_floor in self.elevator.up_requests and not has_people_waiting_up:
+        if current_floor in elevator.up_requests and not has_people_waiting_up:
             if self.debug:
                 print(
-                    f"E{self.elevator.id} Removing stale UP request at floor {current_floor}"
+                    f"E{elevator.id} Removing stale UP request at floor {current_floor}"
                 )
-            self.elevator.up_requests.discard(current_floor)
-        if current_floor in self.elevator.down_requests and not has_people_waiting_down:
+            elevator.up_requests.discard(current_floor)
+        if current_floor in elevator.down_requests and not has_people_waiting_down:
             if self.debug:
                 print(
-                    f"E{self.elevator.id} Removing stale DOWN request at floor {current_floor}"
-                )
-            self.elevator.down_requests.discard(current_floor)
-
-        # Stop if there are people waiting in our direction and we have space
-        if not self.elevator.is_full:
-            if self.elevator.direction == Direction.UP and has_people_waiting_up:
-                return True
-            if self.elevator.direction == Direction.DOWN and has_people_waiting_down:
-                return True
-            if self.elevator.direction == Direction.IDLE and (
-                has_people_waiting_up or has_people_waiting_down
-            ):
-                return True
-
-            # If no more requests in current direction but people waiting opposite direction, stop
-            if self.elevator.direction == Direction.UP:
-                has_more_up_requests = self.elevator.has_requests_in_direction(
-                    Direction.UP, current_floor
+                    f"E{elevator.id} Removing stale DOWN request at floor {current_floor}"
                 )
-                if not has_more_up_requests and has_people_waiting_down:
-                    return True
-            elif self.elevator.direction == Direction.DOWN:
-                has_more_down_requests = self.elevator.has_requests_in_direction(
-                    Direction.DOWN, current_floor
+            elevator.down_requests.discard(current_floor)
+
+        decision = _STOP_TABLE[
+            (
+                elevator.direction,
+                has_people_waiting_up,
+                has_people_waiting_down,
+                elevator.is_full,
+            )
+        ]
+        if decision is _STOP_IF_NOTHING_AHEAD:
+            if plan is None:
+                return not elevator.has_requests_in_direction(
+                    elevator.direction, current_floor
                 )
-                if not has_more_down_requests and has_people_waiting_up:
-                    return True
-
-        return False
-
-    def _handle_floor_stop(self):
-        """Handle stopping at current floor"""
+            if elevator.direction == Direction.UP:
+                return not plan.has_more_up
+            return not plan.has_more_down
+        return decision
+
+    def _handle_floor_stop(self, tick_time: Optional[float] = None) -> Iterator[float]:
+        """Handle stopping at current floor, yielding the loading delay"""
+        if tick_time is None:
+            tick_time = self.building.clock()
         current_floor = self.elevator.current_floor
         self.elevator.state = ElevatorState.LOADING
 
-        # Always check for waiting passengers at this floor
-        waiting_people = []
-
-        # Get people waiting in the elevator's current direction
-        if self.elevator.direction == Direction.UP:
-            waiting_people.extend(
-                self.building.get_waiting_people(current_floor, Direction.UP)
-            )
-        elif self.elevator.direction == Direction.DOWN:
-            waiting_people.extend(
-                self.building.get_waiting_people(current_floor, Direction.DOWN)
-            )
-        elif self.elevator.direction == Direction.IDLE:
+        # Always check for waiting passengers at this floor. The building's
+        # lists are only read here; boarded people are removed afterwards.
+        direction = self.elevator.direction
+        if direction == Direction.UP:
+            waiting_people = self.building.waiting_up[current_floor]
+        elif direction == Direction.DOWN:
+            waiting_people = self.building.waiting_down[current_floor]
+        else:
             # If idle, pick up everyone waiting
-            waiting_people.extend(
-                self.building.get_waiting_people(current_floor, Direction.UP)
-            )
-            waiting_people.extend(
-                self.building.get_waiting_people(current_floor, Direction.DOWN)
+            waiting_people = (
+                self.building.waiting_up[current_floor]
+                + self.building.waiting_down[current_floor]
             )
 
         # Handle the stop (unboard and board)
         passengers_leaving, passengers_boarding = self.elevator.handle_floor_stop(
-            current_floor, waiting_people
+            current_floor, waiting_people, tick_time
         )
 
         if self.debug and (passengers_leaving or passengers_boarding):
@@ -239,176 +332,203 @@ class ElevatorController:
                 )
 
         # Update building's waiting lists for boarded passengers
-        for person in passengers_boarding:
-            if person.direction == Direction.UP:
-                self.building.remove_waiting_people(
-                    current_floor, Direction.UP, [person]
-                )
-            else:
-                self.building.remove_waiting_people(
-                    current_floor, Direction.DOWN, [person]
-                )
+        boarded_up = [p for p in passengers_boarding if p.direction == Direction.UP]
+        boarded_down = [p for p in passengers_boarding if p.direction != Direction.UP]
+        self.building.remove_waiting_people(current_floor, Direction.UP, boarded_up)
+        self.building.remove_waiting_people(
+            current_floor, Direction.DOWN, boarded_down
+        )
 
-            # Track for DestinationDispatchStrategy
-            if self.strategy is not None:
-                from src.core.advanced_strategies import (
-                    DestinationDispatchStrategy,
-                    MLBasedStrategy,
+        if self._is_dest_dispatch:
+            for person in passengers_boarding:
+                # Register destination when passenger boards
+                self.strategy.register_destination(
+                    self.elevator.id - 1,  # Convert to 0-indexed
+                    current_floor,
+                    person.destination_floor,
+                )
+            for person in passengers_leaving:
+                # Clear destination when passenger reaches their floor
+                self.strategy.clear_destination(
+                    self.elevator.id - 1,  # Convert to 0-indexed
+                    person.destination_floor,
                 )
 
-                if isinstance(self.strategy, DestinationDispatchStrategy):
-                    # Register destination when passenger boards
-                    self.strategy.register_destination(
-                        self.elevator.id - 1,  # Convert to 0-indexed
-                        current_floor,
-                        person.destination_floor,
-                    )
-
-                if isinstance(self.strategy, MLBasedStrategy) and len(self.strategy.assignment_history) > 0:
-                    assignment_idx = len(self.strategy.assignment_history) - 1
-                    # Record wait time and update from feedback
-                    wait_time = person.wait_time
-                    self.strategy.update_from_feedback(wait_time, assignment_idx)
-
-        # Track destination clearing for DestinationDispatchStrategy
-        if self.strategy is not None and passengers_leaving:
-            from src.core.advanced_strategies import DestinationDispatchStrategy
-
-            if isinstance(self.strategy, DestinationDispatchStrategy):
-                for person in passengers_leaving:
-                    # Clear destination when passenger reaches their floor
-                    self.strategy.clear_destination(
-                        self.elevator.id - 1,  # Convert to 0-indexed
-                        person.destination_floor,
-                    )
+        if self._is_ml and self.strategy.assignment_history:
+            assignment_idx = len(self.strategy.assignment_history) - 1
+            for person in passengers_boarding:
+                # Record wait time and update from feedback
+                wait_time = person.wait_time_at(tick_time)
+                self.strategy.update_from_feedback(wait_time, assignment_idx)
 
         # Check if there are still people waiting after boarding
         # Only remove requests if the waiting area is now empty
-        still_waiting_up = len(
-            self.building.get_waiting_people(current_floor, Direction.UP)
-        )
-        still_waiting_down = len(
-            self.building.get_waiting_people(current_floor, Direction.DOWN)
-        )
-
-        # Remove requests only if no one is still waiting in that direction
-        if current_floor in self.elevator.up_requests and still_waiting_up == 0:
+        if not self.building.waiting_up[current_floor]:
             self.elevator.up_requests.discard(current_floor)
-        if current_floor in self.elevator.down_requests and still_waiting_down == 0:
+        if not self.building.waiting_down[current_floor]:
             self.elevator.down_requests.discard(current_floor)
 
         # Update statistics
-        for person in passengers_leaving:
-            self.building.total_people_completed += 1
-            self.building.completed_journeys.append(person)
+        self.building.record_completed_journeys(passengers_leaving, tick_time)
 
         # Simulate loading/unloading time
         loading_time = 0.5 + (len(passengers_leaving) + len(passengers_boarding)) * 0.2
-        time.sleep(loading_time * self.time_scale)
+        yield loading_time * self.time_scale
 
         self.elevator.state = ElevatorState.MOVING
 
-    def _move_towards_floor(self, target_floor: int):
+    def _move_towards_floor(self, target_floor: int) -> Iterator[float]:
         """Move elevator towards target floor"""
         current_floor = self.elevator.current_floor
+        self.elevator.state = ElevatorState.MOVING
 
         if target_floor > current_floor:
             self.elevator.direction = Direction.UP
             # Simulate gradual movement
-            self._simulate_movement(target_floor)
+            yield from self._simulate_movement(target_floor)
         elif target_floor < current_floor:
             self.elevator.direction = Direction.DOWN
             # Simulate gradual movement
-            self._simulate_movement(target_floor)
-
-        self.elevator.state = ElevatorState.MOVING
-
-    def _simulate_movement(self, target_floor: int):
-        """Simulate gradual elevator movement"""
-        current_floor = self.elevator.current_floor
-
-        if current_floor == target_floor:
-            return
-
-        # Determine next floor to move to
-        if target_floor > current_floor:
-            next_floor = current_floor + 1
-        else:
-            next_floor = current_floor - 1
-
-        # Update elevator position
-        self.elevator.current_floor = next_floor
-        self.elevator.total_distance_traveled += 1
-
-        # Small delay to simulate movement (configurable)
-        config = get_config()
-        time.sleep(config.movement_delay_factor / self.elevator.speed * self.time_scale)
+            yield from self._simulate_movement(target_floor)
+
+    def _simulate_movement(self, target_floor: int) -> Iterator[float]:
+        """
+        Travel towards target_floor, yielding the travel delay per floor.
+
+        The whole leg runs within one step: intermediate floors are passed
+        without a control-loop pause, re-planning only when the car should
+        stop at the floor it reached or its next stop changed.
+        """
+        elevator = self.elevator
+        step = 1 if target_floor > elevator.current_floor else -1
+        floor_delay = self._move_factor / elevator.speed * self.time_scale
+
+        while elevator.current_floor != target_floor:
+            # Update elevator position
+            elevator.current_floor += step
+            elevator.total_distance_traveled += 1
+
+            # Delay to simulate movement (configurable)
+            yield floor_delay
+
+            if elevator.current_floor == target_floor:
+                return
+            plan = elevator.compute_step_plan()
+            if (
+                plan.next_stop != target_floor
+                or self._should_stop_at_current_floor(plan)
+            ):
+                return
 
 
 class TrafficManager:
-    """Manages realistic traffic patterns and person generation"""
+    """
+    Manages realistic traffic patterns and person generation.
+
+    SimulationEngine's scheduler calls step() periodically; the manager has
+    no thread of its own.
+    """
 
     def __init__(self, building: Building, time_scale: float = 1.0):
-        config = get_config()
         self.building = building
         self.person_generator = PersonGenerator(building)
         self.is_running = False
-        self.thread: Optional[threading.Thread] = None
         self.time_scale = time_scale
+        self._start_time = building.clock()
+
+        # Poisson arrivals: current rate (per second) and the clock time of
+        # the next arrival
+        self._arrival_rate: Optional[float] = None
+        self._next_arrival = float("inf")
 
         # Traffic patterns from config
+        self.reload_config()
+
+    def reload_config(self):
+        """Refresh traffic parameters from the global config"""
+        config = get_config()
         self.base_arrival_rate = config.base_arrival_rate
         self.rush_multiplier = config.rush_multiplier
         self.lunch_multiplier = config.lunch_multiplier
         self.night_multiplier = config.night_multiplier
+        self._check_interval = config.traffic_check_interval
+
+        # Arrival rate for each hour of the simulated day, evaluated at the
+        # middle of the hour so the bucket matches the hourly schedule
+        self._rate_by_hour = tuple(
+            self._compute_rate_for_hour(hour + 0.5) for hour in range(24)
+        )
 
     def start(self):
         """Start traffic generation"""
         if not self.is_running:
             self.is_running = True
-            self.thread = threading.Thread(target=self._generate_traffic, daemon=True)
-            self.thread.start()
+            self._start_time = self.building.clock()
+            self._arrival_rate = None
+
+    def resume(self):
+        """Continue traffic generation where it was stopped"""
+        self.is_running = True
 
     def stop(self):
         """Stop traffic generation"""
         self.is_running = False
-        if self.thread:
-            self.thread.join(timeout=1.0)
-
-    def _generate_traffic(self):
-        """Generate realistic traffic patterns"""
-        start_time = time.time()
 
-        while self.is_running:
-            current_time = time.time()
-            elapsed_minutes = (current_time - start_time) / 60
-
-            # Determine current traffic rate based on time
-            rate = self._get_current_traffic_rate(elapsed_minutes)
-
-            # Generate people based on Poisson distribution
-            # Scale rate by time_scale: faster simulation = more passengers per wall-clock second
-            scaled_rate = rate / self.time_scale
-            if (
-                random.random() < scaled_rate / 60
-            ):  # Convert per-minute to per-second probability
-                person = self.person_generator.generate_person()
-                self.building.add_person_request(person)
-                self.building.total_people_generated += 1
-
-            # Process pending return journeys for visitors
-            self.building.process_pending_returns()
-
-            config = get_config()
-            # Scale sleep interval: faster simulation = check more frequently
-            time.sleep(config.traffic_check_interval * self.time_scale)
+    @property
+    def step_interval(self) -> float:
+        """Seconds between traffic checks; a faster simulation checks more often"""
+        return self._check_interval * self.time_scale
+
+    def step(self) -> float:
+        """
+        Run one traffic check.
+
+        Returns:
+            Seconds until the next check is due
+        """
+        now = self.building.clock()
+        elapsed_minutes = (now - self._start_time) / 60
+
+        # Determine current traffic rate based on time
+        rate = self._get_current_traffic_rate(elapsed_minutes)
+
+        interval = self.step_interval
+
+        # Arrivals form a Poisson process averaging rate / 60 people per
+        # check, scaled by time_scale: faster simulation = more passengers
+        # per wall-clock second. Gaps between arrivals are drawn directly and
+        # redrawn when the rate changes, which is exact because they are
+        # memoryless.
+        arrival_rate = min(rate / self.time_scale / 60, 1.0) / interval
+        if arrival_rate != self._arrival_rate:
+            self._arrival_rate = arrival_rate
+            self._next_arrival = self._draw_next_arrival(now)
+
+        while self._next_arrival <= now:
+            person = self.person_generator.generate_person()
+            self.building.add_person_request(person)
+            self.building.total_people_generated += 1
+            self._next_arrival = self._draw_next_arrival(self._next_arrival)
+
+        # Process pending return journeys for visitors
+        self.building.process_pending_returns()
+
+        return interval
+
+    def _draw_next_arrival(self, after: float) -> float:
+        """Clock time of the next arrival following after"""
+        if self._arrival_rate <= 0:
+            return float("inf")
+        return after + random.expovariate(self._arrival_rate)
 
     def _get_current_traffic_rate(self, elapsed_minutes: float) -> float:
         """Get traffic rate based on time of day simulation"""
         # Simulate a day with rush hours
         minute_in_day = elapsed_minutes % (24 * 60)  # 24-hour cycle
-        hour = minute_in_day / 60
+        return self._rate_by_hour[int(minute_in_day // 60)]
 
+    def _compute_rate_for_hour(self, hour: float) -> float:
+        """Compute the traffic rate for an hour of the simulated day"""
         # Define rush hours and peak times
         if 8 <= hour <= 10 or 17 <= hour <= 19:  # Morning and evening rush
             return self.base_arrival_rate * self.rush_multiplier
@@ -421,7 +541,14 @@ class TrafficManager:
 
 
 class SimulationEngine:
-    """Main simulation engine that coordinates all components"""
+    """
+    Main simulation engine that coordinates all components.
+
+    A time_scale of 0 selects simulated-time mode: nothing sleeps, and the
+    scheduler jumps a virtual clock straight to the next due event, so the
+    simulation runs as fast as the CPU allows. Durations are then in
+    simulated seconds; see run_for.
+    """
 
     def __init__(
         self,
@@ -435,11 +562,22 @@ class SimulationEngine:
         strategy = create_strategy(config.strategy_type)
 
         self.building = Building(num_floors, num_elevators, strategy=strategy)
-        self.traffic_manager = TrafficManager(self.building, time_scale)
-        self.elevator_controllers: List[ElevatorController] = []
         self.debug = debug
         self.time_scale = time_scale  # 1.0 = normal speed, 0.1 = 10x faster
 
+        # Simulated-time mode: components work in unscaled simulated seconds
+        # and read the engine's virtual clock instead of the wall clock
+        self.simulated_time = time_scale == 0
+        self._virtual_now = time.time()
+        if self.simulated_time:
+            time_scale = 1.0
+            self.building.clock = self._read_virtual_clock
+            if isinstance(strategy, AdaptiveStrategy):
+                strategy.clock = self._read_virtual_clock
+
+        self.traffic_manager = TrafficManager(self.building, time_scale)
+        self.elevator_controllers: List[ElevatorController] = []
+
         # Create controllers for each elevator
         for elevator in self.building.elevators:
             controller = ElevatorController(
@@ -455,12 +593,36 @@ class SimulationEngine:
         self.is_running = False
         self.start_time = None
         self.simulation_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
+        # Scheduler heap and suspended elevator steps; in simulated-time mode
+        # they carry over between run_for calls so a run can be split up
+        self._queue: List[SimulationEvent] = []
+        self._steps: Dict[int, Iterator[float]] = {}
 
         # Statistics
         self.stats_history: List[Dict] = []
         self.stats_interval = 10.0  # Record stats every 10 seconds
         self.last_stats_time = 0
 
+        # Scheduler events processed so far; get_current_statistics reuses
+        # its last result until this moves on
+        self._tick = 0
+        self._stats_cache: Optional[Tuple[int, Dict]] = None
+
+        # Called from the scheduler thread after a step moves an elevator,
+        # changes its state, direction or load, or brings in new people
+        self.state_listeners: List[Callable[[], None]] = []
+
+        # Called from the scheduler thread with the current statistics on
+        # every monitor step, i.e. once per monitor_interval seconds
+        self.stats_subscribers: List[Callable[[Dict], None]] = []
+        self.monitor_interval = 1.0
+
+    def _read_virtual_clock(self) -> float:
+        """Current time on the simulated-time clock"""
+        return self._virtual_now
+
     def __enter__(self):
         """Enter context manager - returns self for use in with statement"""
         return self
@@ -476,8 +638,7 @@ class SimulationEngine:
         if self.is_running:
             return
 
-        self.is_running = True
-        self.start_time = time.time()
+        self._start_components()
 
         print("Starting elevator simulation...")
         print(
@@ -485,24 +646,55 @@ class SimulationEngine:
             f"{len(self.building.elevators)} elevators"
         )
 
-        # Start all components
-        for controller in self.elevator_controllers:
-            controller.start()
-
-        self.traffic_manager.start()
-
-        # Start main simulation monitoring thread
+        # A single scheduler thread drives elevators, traffic and monitoring
         self.simulation_thread = threading.Thread(
-            target=self._run_simulation_monitor, daemon=True
+            target=self._run_scheduler, daemon=True
         )
         self.simulation_thread.start()
 
         print("Simulation started successfully!")
 
+    def run_for(self, duration: float):
+        """
+        Run a simulated-time simulation for duration simulated seconds.
+
+        Runs in the calling thread and returns once the virtual clock has
+        advanced by duration. Only available when time_scale is 0.
+        """
+        if not self.simulated_time:
+            raise ValueError("run_for requires simulated time (time_scale=0)")
+        if self.is_running:
+            return
+
+        self._start_components()
+        try:
+            self._run_scheduler(until=self._virtual_now + duration)
+        finally:
+            self.is_running = False
+            self.traffic_manager.stop()
+            for controller in self.elevator_controllers:
+                controller.stop()
+
+    def _start_components(self):
+        """Mark the simulation and all its components as running"""
+        self.is_running = True
+        if self.start_time is None or not self.simulated_time:
+            self.start_time = self.building.clock()
+        self._stop_event.clear()
+
+        for controller in self.elevator_controllers:
+            controller.start()
+
+        if self.simulated_time and self._queue:
+            self.traffic_manager.resume()
+        else:
+            self.traffic_manager.start()
+
     def stop_simulation(self):
         """Stop the simulation"""
         print("Stopping simulation...")
         self.is_running = False
+        self._stop_event.set()
 
         # Stop all components
         self.traffic_manager.stop()
@@ -515,22 +707,148 @@ class SimulationEngine:
 
         print("Simulation stopped.")
 
-    def _run_simulation_monitor(self):
-        """Monitor simulation and collect statistics"""
+    def _run_scheduler(self, until: Optional[float] = None):
+        """
+        Run every simulation component from one thread.
+
+        Pending work is kept in a heap of SimulationEvents ordered by due
+        time. Only this thread touches it, so a plain heapq list is used
+        rather than a locking PriorityQueue.
+
+        Elevator steps are generators; whenever a step yields a delay it is
+        parked in the queue and resumed once the delay has elapsed, so one
+        elevator loading or travelling never blocks the others.
+
+        In simulated-time mode due times are on the virtual clock, which
+        jumps to each event instead of waiting for it; until, if given,
+        is the virtual time at which to return. The queue and any suspended
+        steps are kept for the next call, which carries on where this one
+        stopped.
+        """
+        simulated = self.simulated_time
+        queue = self._queue
+        steps = self._steps
+        if not simulated or not queue:
+            now = self._virtual_now if simulated else time.monotonic()
+            queue[:] = [
+                SimulationEvent(now, "elevator_step", elevator_id=index)
+                for index in range(len(self.elevator_controllers))
+            ]
+            queue.append(SimulationEvent(now, "traffic"))
+            queue.append(SimulationEvent(now, "monitor"))
+            heapq.heapify(queue)
+            steps.clear()
+        listeners = self.state_listeners
+        building = self.building
+
         while self.is_running:
-            current_time = time.time()
+            event = heapq.heappop(queue)
+            if simulated:
+                if until is not None and event.timestamp > until:
+                    heapq.heappush(queue, event)
+                    self._virtual_now = until
+                    break
+                self._virtual_now = event.timestamp
+            else:
+                delay = event.timestamp - time.monotonic()
+                if delay > 0 and self._stop_event.wait(delay):
+                    break
+
+            if event.event_type == "elevator_step":
+                controller = self.elevator_controllers[event.elevator_id]
+                if not controller.is_running:
+                    continue
+                elevator = controller.elevator
+                before = _elevator_signature(elevator) if listeners else None
+                interval = self._advance_elevator(controller, steps, event.elevator_id)
+                if before is not None and _elevator_signature(elevator) != before:
+                    self._notify_state_change()
+            elif event.event_type == "traffic":
+                if not self.traffic_manager.is_running:
+                    continue
+                # New arrivals bump the counter; visitors setting off home
+                # leave pending_returns instead
+                generated = building.total_people_generated
+                returning = len(building.pending_returns)
+                try:
+                    interval = self.traffic_manager.step()
+                except Exception as e:
+                    print(f"Error in traffic generation: {e}")
+                    interval = self.traffic_manager.step_interval
+                if listeners and (
+                    building.total_people_generated != generated
+                    or len(building.pending_returns) != returning
+                ):
+                    self._notify_state_change()
+            else:
+                try:
+                    interval = self._monitor_step()
+                except Exception as e:
+                    print(f"Error in statistics monitor: {e}")
+                    interval = self.monitor_interval
+            self._tick += 1
+
+            if simulated:
+                event.timestamp += interval
+            else:
+                event.timestamp = _next_deadline(event.timestamp, interval)
+            heapq.heappush(queue, event)
 
-            # Record statistics periodically
-            if current_time - self.last_stats_time >= self.stats_interval:
-                stats = self._collect_statistics()
-                self.stats_history.append(stats)
-                self.last_stats_time = current_time
+    def _notify_state_change(self):
+        """Tell every state listener that the visible state has changed"""
+        for listener in self.state_listeners:
+            try:
+                listener()
+            except Exception as e:
+                print(f"Error in state listener: {e}")
 
-            time.sleep(1.0)
+    def _advance_elevator(
+        self,
+        controller: ElevatorController,
+        steps: Dict[int, Iterator[float]],
+        index: int,
+    ) -> float:
+        """Run an elevator step until it waits or finishes; return the delay"""
+        step = steps.get(index)
+        if step is None:
+            step = steps[index] = controller._process_elevator_step()
+        try:
+            delay = next(step)
+        except StopIteration:
+            pass
+        except Exception as e:
+            print(f"Error in elevator {controller.elevator.id} control loop: {e}")
+        else:
+            controller.track_activity(delay)
+            return delay
+        del steps[index]
+        delay = controller.step_interval
+        controller.track_activity(delay)
+        return delay
+
+    def _monitor_step(self) -> float:
+        """Record statistics if due; return seconds until the next check"""
+        current_time = self.building.clock()
+
+        # Record statistics periodically
+        if current_time - self.last_stats_time >= self.stats_interval:
+            stats = self._collect_statistics()
+            self.stats_history.append(stats)
+            self.last_stats_time = current_time
+
+        if self.stats_subscribers:
+            stats = self.get_current_statistics()
+            for subscriber in self.stats_subscribers:
+                try:
+                    subscriber(stats)
+                except Exception as e:
+                    print(f"Error in statistics subscriber: {e}")
+
+        return self.monitor_interval
 
     def _collect_statistics(self) -> Dict:
         """Collect comprehensive simulation statistics"""
-        current_time = time.time()
+        current_time = self.building.clock()
         elapsed_time = current_time - self.start_time if self.start_time else 0
 
         # Building statistics
@@ -559,21 +877,16 @@ class SimulationEngine:
 
         # Calculate average wait times from completed journeys
         avg_journey_time = 0.0
-        if self.building.completed_journeys:
-            if recent_journeys := [
-                j
-                for j in self.building.completed_journeys
-                if j.boarding_time is not None and j.boarding_time > current_time - 300
-            ]:
-                avg_journey_time = sum(
-                    (j.boarding_time - j.arrival_time)
-                    for j in recent_journeys
-                    if j.boarding_time is not None
-                ) / len(recent_journeys)
+        if recent_journeys := self.building.get_recent_journeys(current_time - 300):
+            avg_journey_time = sum(
+                (j.boarding_time - j.arrival_time) for j in recent_journeys
+            ) / len(recent_journeys)
 
         # Adjust wait times for time_scale (timestamps are in real time, not simulated time)
-        adjusted_avg_wait = building_status["avg_wait_time"] / self.time_scale
-        adjusted_avg_journey = avg_journey_time / self.time_scale
+        # In simulated-time mode timestamps are already simulated seconds
+        scale = self.time_scale or 1.0
+        adjusted_avg_wait = building_status["avg_wait_time"] / scale
+        adjusted_avg_journey = avg_journey_time / scale
 
         return {
             "timestamp": current_time,
@@ -593,45 +906,76 @@ class SimulationEngine:
         }
 
     def get_current_statistics(self) -> Dict:
-        """Get current simulation statistics"""
-        return self._collect_statistics()
+        """
+        Get current simulation statistics.
+
+        While the simulation runs, callers that poll between two scheduler
+        events share one result dict, which should not be modified.
+        """
+        tick = self._tick
+        cached = self._stats_cache
+        if self.is_running and cached is not None and cached[0] == tick:
+            return cached[1]
+        stats = self._collect_statistics()
+        self._stats_cache = (tick, stats)
+        return stats
 
     def get_elevator_status(self, elevator_id: int) -> Optional[Dict]:
-        """Get detailed status of a specific elevator"""
+        """
+        Get detailed status of a specific elevator.
+
+        The elevator-specific part is rebuilt only when the elevator's state
+        changed since the last call; the nested lists are shared between
+        calls and should not be modified.
+        """
         if 1 <= elevator_id <= len(self.building.elevators):
             elevator = self.building.elevators[elevator_id - 1]
             controller = self.elevator_controllers[elevator_id - 1]
 
-            return {
-                "id": elevator.id,
-                "current_floor": elevator.current_floor,
-                "direction": elevator.direction.value,
-                "state": elevator.state.value,
-                "passengers": [
-                    {
-                        "id": p.id,
-                        "destination": p.destination_floor,
-                        "wait_time": p.wait_time,
-                    }
-                    for p in elevator.passengers
-                ],
-                "capacity": elevator.capacity,
-                "speed": elevator.speed,
-                "up_requests": list(elevator.up_requests),
-                "down_requests": list(elevator.down_requests),
-                "destination_floors": list(elevator.destination_floors),
-                "total_served": elevator.total_passengers_served,
-                "distance_traveled": elevator.total_distance_traveled,
-                "efficiency": (
-                    (
-                        controller.active_time
-                        / (controller.active_time + controller.idle_time)
-                        * 100
-                    )
-                    if (controller.active_time + controller.idle_time) > 0
-                    else 0
-                ),
-            }
+            # Every field below changes only if one of these does
+            key = (
+                elevator.current_floor,
+                elevator.direction,
+                elevator.state,
+                len(elevator.passengers),
+                elevator.up_requests.mask,
+                elevator.down_requests.mask,
+                elevator.destination_floors.mask,
+                elevator.total_passengers_served,
+                elevator.total_distance_traveled,
+                elevator.capacity,
+                elevator.speed,
+            )
+            if key != controller._status_key:
+                controller._status_key = key
+                controller._status_cache = {
+                    "id": elevator.id,
+                    "current_floor": elevator.current_floor,
+                    "direction": elevator.direction.value,
+                    "state": elevator.state.value,
+                    "passengers": [
+                        {
+                            "id": p.id,
+                            "destination": p.destination_floor,
+                            "wait_time": p.wait_time,
+                        }
+                        for p in elevator.passengers
+                    ],
+                    "capacity": elevator.capacity,
+                    "speed": elevator.speed,
+                    "up_requests": list(elevator.up_requests),
+                    "down_requests": list(elevator.down_requests),
+                    "destination_floors": list(elevator.destination_floors),
+                    "total_served": elevator.total_passengers_served,
+                    "distance_traveled": elevator.total_distance_traveled,
+                }
+
+            status = dict(controller._status_cache)
+            total_time = controller.active_time + controller.idle_time
+            status["efficiency"] = (
+                (controller.active_time / total_time * 100) if total_time > 0 else 0
+            )
+            return status
         return None
 
     def add_manual_request(self, from_floor: int, to_floor: int) -> bool:
@@ -649,11 +993,13 @@ class SimulationEngine:
             id=self.building.total_people_generated + 1,
             current_floor=from_floor,
             destination_floor=to_floor,
-            arrival_time=time.time(),
+            arrival_time=self.building.clock(),
         )
 
         self.building.add_person_request(person)
         self.building.total_people_generated += 1
+        self._stats_cache = None
+        self._notify_state_change()
         return True
 
     def get_building_overview(self) -> str:
@@ -677,23 +1023,25 @@ class SimulationEngine:
 
         lines.append("")
 
-        # Waiting people summary
-        total_waiting_up = sum(
-            len(people) for people in self.building.waiting_up.values()
-        )
-        total_waiting_down = sum(
-            len(people) for people in self.building.waiting_down.values()
-        )
+        # Waiting people summary, collected in one pass over the floors
+        waiting_up = self.building.waiting_up
+        waiting_down = self.building.waiting_down
+        total_waiting_up = total_waiting_down = 0
+        floor_lines = []
+        for floor in range(self.building.num_floors, 0, -1):
+            up_count = len(waiting_up[floor])
+            down_count = len(waiting_down[floor])
+            if up_count > 0 or down_count > 0:
+                total_waiting_up += up_count
+                total_waiting_down += down_count
+                floor_lines.append(f"  Floor {floor:2d}: ↑{up_count} ↓{down_count}")
+
         lines.append(
             f"WAITING: {total_waiting_up} going UP, {total_waiting_down} going DOWN"
         )
 
         # Show floors with waiting people
-        for floor in range(self.building.num_floors, 0, -1):
-            up_count = len(self.building.waiting_up[floor])
-            down_count = len(self.building.waiting_down[floor])
-            if up_count > 0 or down_count > 0:
-                lines.append(f"  Floor {floor:2d}: ↑{up_count} ↓{down_count}")
+        lines.extend(floor_lines)
 
         return "\n".join(lines)
 
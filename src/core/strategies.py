@@ -6,6 +6,7 @@ Different strategies for assigning elevators to requests.
 Demonstrates Strategy Pattern + Dependency Injection.
 """
 
+from itertools import chain
 from typing import List, Optional
 from src.core.interfaces import ElevatorAssignmentStrategy, ElevatorConfig
 from src.core.elevator_simulator import Direction, ElevatorState
@@ -14,6 +15,8 @@ from src.core.elevator_simulator import Direction, ElevatorState
 class NearestCarStrategy(ElevatorAssignmentStrategy):
     """Assign nearest available elevator (current default behavior)"""
 
+    __slots__ = ()
+
     def assign_elevator(
         self,
         elevators: List,
@@ -26,50 +29,59 @@ class NearestCarStrategy(ElevatorAssignmentStrategy):
         best_elevator = None
         best_score = float("inf")
 
+        # Scoring weights are loop invariants; bind them once per request
+        distance_weight = config.distance_weight
+        full_penalty = config.full_penalty
+        idle_bonus = config.idle_bonus
+        same_direction_bonus = config.same_direction_bonus
+        opposite_direction_penalty = config.opposite_direction_penalty
+        load_factor_weight = config.load_factor_weight
+        enable_load_balancing = config.enable_load_balancing
+
+        # Score every elevator in one loop (lower is better), reading each
+        # elevator field once; is_full and passenger_count are properties
+        # over the same passenger list
         for i, elevator in enumerate(elevators):
-            score = self._calculate_score(elevator, request_floor, direction, config)
-
-            if score < best_score:
-                best_score = score
-                best_elevator = i
+            passenger_count = len(elevator.passengers)
+            capacity = elevator.capacity
 
-        return best_elevator
-
-    def _calculate_score(
-        self, elevator, request_floor: int, direction, config: ElevatorConfig
-    ) -> float:
-        """Calculate assignment score (lower is better)"""
-        # Can't assign if full
-        if elevator.is_full:
-            return config.full_penalty
+            # Can't assign if full
+            if passenger_count >= capacity:
+                score = full_penalty
+            else:
+                distance = abs(elevator.current_floor - request_floor)
+                score = distance * distance_weight
 
-        distance = abs(elevator.current_floor - request_floor)
-        score = distance * config.distance_weight
+                # Bonus if elevator is idle
+                elevator_direction = elevator.direction
+                if elevator.state is ElevatorState.IDLE:
+                    score += idle_bonus
 
-        # Bonus if elevator is idle
-        if elevator.state == ElevatorState.IDLE:
-            score += config.idle_bonus
+                elif (
+                    elevator_direction is direction
+                    and passenger_count < capacity * 0.7
+                ):
+                    score += same_direction_bonus
 
-        elif (
-            elevator.direction == direction
-            and elevator.passenger_count < elevator.capacity * 0.7
-        ):
-            score += config.same_direction_bonus
+                elif elevator_direction not in (Direction.IDLE, direction):
+                    score += opposite_direction_penalty
 
-        elif elevator.direction not in [Direction.IDLE, direction]:
-            score += config.opposite_direction_penalty
+                # Add load factor
+                if enable_load_balancing:
+                    score += passenger_count / capacity * load_factor_weight
 
-        # Add load factor
-        if config.enable_load_balancing:
-            load_factor = elevator.passenger_count / elevator.capacity
-            score += load_factor * config.load_factor_weight
+            if score < best_score:
+                best_score = score
+                best_elevator = i
 
-        return score
+        return best_elevator
 
 
 class SCANStrategy(ElevatorAssignmentStrategy):
     """SCAN algorithm - elevator continues in direction until no more requests"""
 
+    __slots__ = ()
+
     def assign_elevator(
         self,
         elevators: List,
@@ -79,53 +91,44 @@ class SCANStrategy(ElevatorAssignmentStrategy):
         destination_floor: Optional[int] = None,
     ) -> Optional[int]:
         """Assign elevator using SCAN algorithm"""
-        if same_direction := [
-            (i, e)
-            for i, e in enumerate(elevators)
-            if e.direction == direction and not e.is_full
-        ]:
-            # Prefer elevator approaching from correct direction
-            if direction.value == "UP":
-                candidates = [
-                    (i, e)
-                    for i, e in same_direction
-                    if e.current_floor <= request_floor
-                ]
-            else:
-                candidates = [
-                    (i, e)
-                    for i, e in same_direction
-                    if e.current_floor >= request_floor
-                ]
-
-            if candidates:
-                # Choose closest one
-                return min(
-                    candidates, key=lambda x: abs(x[1].current_floor - request_floor)
-                )[0]
-
-        if idle_elevators := [
-            (i, e)
-            for i, e in enumerate(elevators)
-            if e.state == ElevatorState.IDLE and not e.is_full
-        ]:
-            return min(
-                idle_elevators, key=lambda x: abs(x[1].current_floor - request_floor)
-            )[0]
-
-        # Last resort: nearest available
-        available = [(i, e) for i, e in enumerate(elevators) if not e.is_full]
-        if available:
-            return min(
-                available, key=lambda x: abs(x[1].current_floor - request_floor)
-            )[0]
-
-        return None
+        # Single pass keeping the closest car per tier (earlier cars win ties):
+        # same direction and approaching, then idle, then any with room.
+        # Lower tiers stop mattering once a same-direction car is found.
+        going_up = direction is Direction.UP
+        best_same = best_idle = best_any = None
+        same_distance = idle_distance = any_distance = float("inf")
+
+        for i, elevator in enumerate(elevators):
+            if len(elevator.passengers) >= elevator.capacity:
+                continue
+
+            floor = elevator.current_floor
+            if elevator.direction is direction and (
+                floor <= request_floor if going_up else floor >= request_floor
+            ):
+                distance = abs(floor - request_floor)
+                if distance < same_distance:
+                    same_distance, best_same = distance, i
+            elif best_same is None:
+                distance = abs(floor - request_floor)
+                if elevator.state is ElevatorState.IDLE:
+                    if distance < idle_distance:
+                        idle_distance, best_idle = distance, i
+                elif distance < any_distance:
+                    any_distance, best_any = distance, i
+
+        if best_same is not None:
+            return best_same
+        if best_idle is not None:
+            return best_idle
+        return best_any  # None when every elevator is full
 
 
 class RoundRobinStrategy(ElevatorAssignmentStrategy):
     """Simple round-robin assignment for load balancing"""
 
+    __slots__ = ("last_assigned",)
+
     def __init__(self):
         self.last_assigned = -1
 
@@ -139,12 +142,15 @@ class RoundRobinStrategy(ElevatorAssignmentStrategy):
     ) -> Optional[int]:
         """Assign next elevator in round-robin fashion"""
         num_elevators = len(elevators)
-
-        for _ in range(num_elevators):
-            self.last_assigned = (self.last_assigned + 1) % num_elevators
-            elevator = elevators[self.last_assigned]
-
-            if not elevator.is_full:
-                return self.last_assigned
+        if not num_elevators:
+            return None
+
+        # Walk from the cursor to the end of the fleet, then wrap around
+        start = (self.last_assigned + 1) % num_elevators
+        for index in chain(range(start, num_elevators), range(start)):
+            elevator = elevators[index]
+            if len(elevator.passengers) < elevator.capacity:
+                self.last_assigned = index
+                return index
 
         return None  # All elevators full
@@ -5,7 +5,8 @@ Strategy Factory
 Factory for creating elevator assignment strategies based on configuration.
 """
 
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping, Optional, Type
 from src.core.interfaces import ElevatorAssignmentStrategy
 from src.core.strategies import NearestCarStrategy, RoundRobinStrategy, SCANStrategy
 from src.core.advanced_strategies import (
@@ -15,6 +16,19 @@ from src.core.advanced_strategies import (
     AdaptiveStrategy,
 )
 
+# Strategy type name -> strategy class
+_STRATEGIES: Mapping[str, Type[ElevatorAssignmentStrategy]] = MappingProxyType(
+    {
+        "default": NearestCarStrategy,
+        "scan": SCANStrategy,
+        "round_robin": RoundRobinStrategy,
+        "look": LOOKStrategy,
+        "destination_dispatch": DestinationDispatchStrategy,
+        "ml": MLBasedStrategy,
+        "adaptive": AdaptiveStrategy,
+    }
+)
+
 
 def create_strategy(strategy_type: str) -> ElevatorAssignmentStrategy:
     """
@@ -31,23 +45,11 @@ def create_strategy(strategy_type: str) -> ElevatorAssignmentStrategy:
         ValueError: If strategy_type is unknown
     """
     strategy_type = strategy_type.lower()
-
-    if strategy_type == "default":
-        return NearestCarStrategy()
-    elif strategy_type == "scan":
-        return SCANStrategy()
-    elif strategy_type == "round_robin":
-        return RoundRobinStrategy()
-    elif strategy_type == "look":
-        return LOOKStrategy()
-    elif strategy_type == "destination_dispatch":
-        return DestinationDispatchStrategy()
-    elif strategy_type == "ml":
-        return MLBasedStrategy()
-    elif strategy_type == "adaptive":
-        return AdaptiveStrategy()
-    else:
+    try:
+        strategy_class = _STRATEGIES[strategy_type]
+    except KeyError:
         raise ValueError(
             f"Unknown strategy type: {strategy_type}. "
-            f"Valid options: default, scan, round_robin, look, destination_dispatch, ml, adaptive"
-        )
+            f"Valid options: {', '.join(_STRATEGIES)}"
+        ) from None
+    return strategy_class()
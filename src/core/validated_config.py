@@ -6,11 +6,24 @@ Type-safe configuration with validation rules.
 Replaces the dataclass-based ElevatorConfig with Pydantic models.
 """
 
+from functools import lru_cache
 from typing import List, Optional
 from pydantic import BaseModel, Field, field_validator, model_validator
 from pathlib import Path
 import json
 
+from src.utils.compat import json_loads
+
+
+@lru_cache(maxsize=32)
+def _read_config_json(filepath: str, mtime_ns: int) -> dict:
+    """Parse a config file, cached by path and modification time.
+
+    The returned dict is shared between callers and must not be mutated.
+    """
+    with open(filepath, "rb") as f:
+        return json_loads(f.read())
+
 
 class BuildingConfig(BaseModel):
     """Building-specific configuration"""
@@ -242,10 +255,10 @@ class ElevatorSystemConfig(BaseModel):
         if not path.exists():
             raise FileNotFoundError(f"Configuration file not found: {filepath}")
 
-        with open(path, "r") as f:
-            data = json.load(f)
-
-        return cls(**data)
+        # Re-reading an unchanged file only re-runs validation, which is
+        # cheaper than deep-copying a cached model and keeps instances apart.
+        data = _read_config_json(str(path), path.stat().st_mtime_ns)
+        return cls.model_validate(data)
 
     def save_to_file(self, filepath: str):
         """Save configuration to JSON file"""
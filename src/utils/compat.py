@@ -0,0 +1,33 @@
+"""
+Compatibility Helpers
+=====================
+
+Shims for optional dependencies and older Python versions, shared across
+the package.
+"""
+
+import json
+import sys
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib json module
+    orjson = None
+
+# dataclass(slots=True) needs Python 3.10; older versions keep a __dict__
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def json_dumps(data: Any) -> bytes:
+    """Serialize data to compact JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def json_loads(raw: bytes) -> Any:
+    """Deserialize JSON bytes"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
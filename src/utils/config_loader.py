@@ -5,13 +5,49 @@ This module loads and validates configuration from elevator_config.json
 and provides easy access to all settings.
 """
 
-import json
 import os
 from typing import Dict, Any
 
+from src.utils.compat import json_loads
+
 
 class ElevatorConfig:
-    """Load and manage elevator simulation configuration"""
+    """Load and manage elevator simulation configuration
+
+    Settings are resolved once per load into plain attributes, so hot
+    callers read a slot instead of walking the nested config dict.
+    """
+
+    __slots__ = (
+        "config_path",
+        "config",
+        # Building parameters
+        "num_floors",
+        "num_elevators",
+        "elevator_capacity",
+        "elevator_speed",
+        # Strategy parameters
+        "strategy_type",
+        "distance_weight",
+        "full_penalty",
+        "same_direction_bonus",
+        "opposite_direction_penalty",
+        "load_factor_weight",
+        "idle_bonus",
+        # Traffic parameters
+        "base_arrival_rate",
+        "rush_multiplier",
+        "lunch_multiplier",
+        "night_multiplier",
+        "enable_realistic_visitors",
+        # Simulation parameters
+        "control_loop_interval",
+        "traffic_check_interval",
+        "movement_delay_factor",
+        "stats_recording_interval",
+        # Behavior parameters
+        "enable_load_balancing",
+    )
 
     def __init__(self, config_path: str = "config/elevator_config.json"):
         self.config_path = config_path
@@ -22,104 +58,55 @@ class ElevatorConfig:
         """Load configuration from JSON file"""
         if not os.path.exists(self.config_path):
             raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
-        with open(self.config_path, "r", encoding="utf-8") as f:
-            self.config = json.load(f)
+        with open(self.config_path, "rb") as f:
+            self.config = json_loads(f.read())
+        self._apply_config()
 
     def reload(self):
         """Reload configuration from file"""
         self.load_config()
 
-    # Building parameters
-    @property
-    def num_floors(self) -> int:
-        return self.config.get("building", {}).get("num_floors", 20)
-
-    @property
-    def num_elevators(self) -> int:
-        return self.config.get("building", {}).get("num_elevators", 4)
-
-    @property
-    def elevator_capacity(self) -> int:
-        return self.config.get("building", {}).get("elevator_capacity", 8)
-
-    @property
-    def elevator_speed(self) -> float:
-        return self.config.get("building", {}).get("elevator_speed", 2.0)
-
-    # Strategy parameters
-    @property
-    def strategy_type(self) -> str:
-        """Get the strategy type: default, look, destination_dispatch, ml, adaptive"""
-        return self.config.get("strategy", {}).get("strategy_type", "default")
-
-    @property
-    def distance_weight(self) -> float:
-        return self.config.get("strategy", {}).get("distance_weight", 1.0)
-
-    @property
-    def full_penalty(self) -> int:
-        return self.config.get("strategy", {}).get("full_penalty", 50)
-
-    @property
-    def same_direction_bonus(self) -> int:
-        return self.config.get("strategy", {}).get("same_direction_bonus", -10)
-
-    @property
-    def opposite_direction_penalty(self) -> int:
-        return self.config.get("strategy", {}).get("opposite_direction_penalty", 20)
-
-    @property
-    def load_factor_weight(self) -> int:
-        return self.config.get("strategy", {}).get("load_factor_weight", 10)
-
-    @property
-    def idle_bonus(self) -> int:
-        return self.config.get("strategy", {}).get("idle_bonus", 0)
-
-    # Traffic parameters
-    @property
-    def base_arrival_rate(self) -> float:
-        return self.config.get("traffic", {}).get("base_arrival_rate", 6.0)
-
-    @property
-    def rush_multiplier(self) -> float:
-        return self.config.get("traffic", {}).get("rush_multiplier", 3.0)
-
-    @property
-    def lunch_multiplier(self) -> float:
-        return self.config.get("traffic", {}).get("lunch_multiplier", 2.0)
-
-    @property
-    def night_multiplier(self) -> float:
-        return self.config.get("traffic", {}).get("night_multiplier", 0.2)
-
-    @property
-    def enable_realistic_visitors(self) -> bool:
-        return self.config.get("traffic", {}).get("enable_realistic_visitors", True)
-
-    # Simulation parameters
-    @property
-    def control_loop_interval(self) -> float:
-        """Returns interval in seconds"""
-        ms = self.config.get("simulation", {}).get("control_loop_interval_ms", 100)
-        return ms / 1000.0
-
-    @property
-    def traffic_check_interval(self) -> float:
-        return self.config.get("simulation", {}).get("traffic_check_interval_s", 1.0)
-
-    @property
-    def movement_delay_factor(self) -> float:
-        return self.config.get("simulation", {}).get("movement_delay_factor", 0.5)
-
-    @property
-    def stats_recording_interval(self) -> float:
-        return self.config.get("simulation", {}).get("stats_recording_interval_s", 10.0)
-
-    # Behavior parameters
-    @property
-    def enable_load_balancing(self) -> bool:
-        return self.config.get("behavior", {}).get("enable_load_balancing", True)
+    def _apply_config(self):
+        """Resolve every setting from the raw config dict"""
+        building = self.config.get("building", {})
+        self.num_floors = int(building.get("num_floors", 20))
+        self.num_elevators = int(building.get("num_elevators", 4))
+        self.elevator_capacity = int(building.get("elevator_capacity", 8))
+        self.elevator_speed = float(building.get("elevator_speed", 2.0))
+
+        # Strategy type: default, look, destination_dispatch, ml, adaptive
+        strategy = self.config.get("strategy", {})
+        self.strategy_type = strategy.get("strategy_type", "default")
+        self.distance_weight = strategy.get("distance_weight", 1.0)
+        self.full_penalty = strategy.get("full_penalty", 50)
+        self.same_direction_bonus = strategy.get("same_direction_bonus", -10)
+        self.opposite_direction_penalty = strategy.get("opposite_direction_penalty", 20)
+        self.load_factor_weight = strategy.get("load_factor_weight", 10)
+        self.idle_bonus = strategy.get("idle_bonus", 0)
+
+        traffic = self.config.get("traffic", {})
+        self.base_arrival_rate = float(traffic.get("base_arrival_rate", 6.0))
+        self.rush_multiplier = float(traffic.get("rush_multiplier", 3.0))
+        self.lunch_multiplier = float(traffic.get("lunch_multiplier", 2.0))
+        self.night_multiplier = float(traffic.get("night_multiplier", 0.2))
+        self.enable_realistic_visitors = bool(
+            traffic.get("enable_realistic_visitors", True)
+        )
+
+        simulation = self.config.get("simulation", {})
+        # Stored in seconds; the file gives milliseconds
+        interval_ms = simulation.get("control_loop_interval_ms", 100)
+        self.control_loop_interval = interval_ms / 1000.0
+        self.traffic_check_interval = float(
+            simulation.get("traffic_check_interval_s", 1.0)
+        )
+        self.movement_delay_factor = float(simulation.get("movement_delay_factor", 0.5))
+        self.stats_recording_interval = float(
+            simulation.get("stats_recording_interval_s", 10.0)
+        )
+
+        behavior = self.config.get("behavior", {})
+        self.enable_load_balancing = bool(behavior.get("enable_load_balancing", True))
 
     def get_raw_config(self) -> Dict[str, Any]:
         """Get the raw configuration dictionary"""
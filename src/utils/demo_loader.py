@@ -6,12 +6,15 @@ Loads and manages demo scenarios from configuration file.
 """
 
 import json
+import threading
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 
+from src.utils.compat import DATACLASS_SLOTS, json_loads
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class ManualRequest:
     """Represents a manual elevator request"""
 
@@ -19,7 +22,7 @@ class ManualRequest:
     to_floor: int
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DemoScenario:
     """Represents a demo scenario configuration"""
 
@@ -99,8 +102,8 @@ class DemoScenarioLoader:
     def _load_scenarios(self):
         """Load scenarios from JSON file"""
         try:
-            with open(self.config_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(self.config_path, "rb") as f:
+                data = json_loads(f.read())
 
             self._default_scenario_id = data.get("default_scenario", "quick_demo")
 
@@ -112,7 +115,7 @@ class DemoScenarioLoader:
             print(f"Warning: Demo scenarios config not found at {self.config_path}")
             print("Using built-in defaults")
             self._create_default_scenarios()
-        except json.JSONDecodeError as e:
+        except json.JSONDecodeError as e:  # orjson's error subclasses this
             print(f"Error parsing demo scenarios config: {e}")
             print("Using built-in defaults")
             self._create_default_scenarios()
@@ -155,9 +158,8 @@ class DemoScenarioLoader:
         """Get the default scenario"""
         if self._default_scenario_id in self._scenarios:
             return self._scenarios[self._default_scenario_id]
-        if self._scenarios:
-            return list(self._scenarios.values())[0]
-        return None
+        # Fall back to the first scenario loaded, if any
+        return next(iter(self._scenarios.values()), None)
 
     def list_scenarios(self) -> List[str]:
         """List all available scenario IDs"""
@@ -171,13 +173,17 @@ class DemoScenarioLoader:
 
 # Singleton instance
 _loader: Optional[DemoScenarioLoader] = None
+_loader_lock = threading.Lock()
 
 
 def get_demo_loader(config_path: Optional[str] = None) -> DemoScenarioLoader:
     """Get or create the demo scenario loader singleton"""
     global _loader
     if _loader is None:
-        _loader = DemoScenarioLoader(config_path)
+        # Only first use takes the lock; later calls return the cached loader
+        with _loader_lock:
+            if _loader is None:
+                _loader = DemoScenarioLoader(config_path)
     return _loader
 
 
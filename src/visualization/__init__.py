@@ -12,7 +12,6 @@ from .visualization import (
     run_visual_simulation,
     run_statistics_simulation,
 )
-from .pygame_visualization import run_pygame_simulation
 
 __all__ = [
     "ASCIIDisplay",
@@ -22,3 +21,12 @@ __all__ = [
     "run_statistics_simulation",
     "run_pygame_simulation",
 ]
+
+
+def __getattr__(name):
+    # pygame is only imported when the pygame front end is actually requested
+    if name == "run_pygame_simulation":
+        from .pygame_visualization import run_pygame_simulation
+
+        return run_pygame_simulation
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
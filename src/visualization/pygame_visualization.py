@@ -8,12 +8,26 @@ featuring real-time animations, interactive controls, and detailed status displa
 
 import pygame
 import time
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass
 
 from src.core.simulation_engine import SimulationEngine
 from src.core.elevator_simulator import ElevatorState, Direction
 
+# Upper bound on cached label surfaces before the cache is flushed
+_TEXT_CACHE_SIZE = 512
+
+# A rendered surface and the screen position it is blitted to
+_Blit = Tuple[pygame.Surface, Tuple[int, int]]
+
+# The only event types the UI reacts to; everything else is never queued
+_HANDLED_EVENTS = (
+    pygame.QUIT,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEMOTION,
+    pygame.KEYDOWN,
+)
+
 
 @dataclass
 class Colors:
@@ -57,6 +71,8 @@ class PygameVisualization:
         # Create display
         self.screen = pygame.display.set_mode((width, height))
         pygame.display.set_caption("Elevator Mall Simulator")
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(_HANDLED_EVENTS)
 
         # Fonts
         self.font_large = pygame.font.Font(None, 24)
@@ -69,16 +85,32 @@ class PygameVisualization:
         self.status_area = pygame.Rect(50, height - 80, width - 100, 60)
 
         # Animation state
-        self.elevator_positions = {}  # Smooth positions for animation
+        # Smooth positions for animation, indexed like building.elevators
+        self.elevator_positions: List[float] = []
         self.animation_speed = 0.1
 
         # Control state
         self.buttons = {}
         self.selected_elevator = 0
+        self._any_hover = False  # Whether any button is currently hovered
 
         # Clock for frame rate control
         self.clock = pygame.time.Clock()
 
+        # Pre-rendered static layout, rebuilt if the floor count changes
+        self._background: Optional[pygame.Surface] = None
+        self._background_floors = 0
+
+        # Rendered labels keyed by (font id, text, color)
+        self._text_cache: Dict[tuple, pygame.Surface] = {}
+
+        # Elevator details and status text are re-sampled from the simulation
+        # at 10 Hz and blitted from these (surface, position) lists per frame
+        self._sample_interval = 0.1
+        self._next_sample = 0.0
+        self._detail_blits: List[_Blit] = []
+        self._status_blits: List[_Blit] = []
+
         self._setup_buttons()
 
     def _setup_buttons(self):
@@ -116,8 +148,10 @@ class PygameVisualization:
         self.simulation.start_simulation()
 
         # Initialize elevator positions
-        for elevator in self.simulation.building.elevators:
-            self.elevator_positions[elevator.id] = float(elevator.current_floor)
+        self.elevator_positions = [
+            float(elevator.current_floor)
+            for elevator in self.simulation.building.elevators
+        ]
 
         try:
             self._main_loop()
@@ -143,7 +177,7 @@ class PygameVisualization:
         """Handle pygame events"""
         mouse_pos = pygame.mouse.get_pos()
 
-        for event in pygame.event.get():
+        for event in pygame.event.get(_HANDLED_EVENTS):
             if event.type == pygame.QUIT:
                 self.running = False
 
@@ -171,8 +205,21 @@ class PygameVisualization:
 
     def _handle_mouse_hover(self, mouse_pos: Tuple[int, int]):
         """Handle mouse hover effects"""
+        # Every button sits inside the control panel, so outside it the only
+        # work is clearing a hover left over from the previous motion event
+        if not self.control_area.collidepoint(mouse_pos):
+            if self._any_hover:
+                for button in self.buttons.values():
+                    button["hover"] = False
+                self._any_hover = False
+            return
+
+        any_hover = False
         for button in self.buttons.values():
-            button["hover"] = button["rect"].collidepoint(mouse_pos)
+            hover = button["rect"].collidepoint(mouse_pos)
+            button["hover"] = hover
+            any_hover = any_hover or hover
+        self._any_hover = any_hover
 
     def _handle_keypress(self, key):
         """Handle keyboard input"""
@@ -225,44 +272,64 @@ class PygameVisualization:
 
     def _get_elevator_at_position(self, mouse_pos: Tuple[int, int]) -> Optional[int]:
         """Get elevator ID at mouse position"""
-        # Calculate if mouse is over an elevator
+        # Elevator i is centred on the (i + 1)-th of n + 1 equal columns and
+        # is half a column wide, so the column and the offset into it are
+        # enough to tell which shaft (if any) was hit
         building_rect = self.building_area
-        num_elevators = len(self.simulation.building.elevators)
-        elevator_width = building_rect.width // (num_elevators + 1)
-
-        for i, elevator in enumerate(self.simulation.building.elevators):
-            elevator_x = (
-                building_rect.x + (i + 1) * elevator_width - elevator_width // 4
-            )
-            elevator_rect = pygame.Rect(
-                elevator_x, 0, elevator_width // 2, building_rect.height
-            )
-
-            if elevator_rect.collidepoint(mouse_pos):
-                return elevator.id
+        elevators = self.simulation.building.elevators
+        elevator_width = building_rect.width // (len(elevators) + 1)
+        mouse_x, mouse_y = mouse_pos
+        if elevator_width == 0 or not 0 <= mouse_y < building_rect.height:
+            return None
+
+        column, offset = divmod(
+            mouse_x - building_rect.x + elevator_width // 4, elevator_width
+        )
+        index = column - 1
+        if 0 <= index < len(elevators) and offset < elevator_width // 2:
+            return elevators[index].id
         return None
 
     def _update_animations(self):
         """Update smooth animation positions"""
-        for elevator in self.simulation.building.elevators:
+        elevators = self.simulation.building.elevators
+        positions = self.elevator_positions
+        if len(positions) != len(elevators):
+            # Not started yet, or the fleet changed: snap to current floors
+            positions[:] = [float(elevator.current_floor) for elevator in elevators]
+
+        for i, elevator in enumerate(elevators):
             target_floor = float(elevator.current_floor)
-            current_pos = self.elevator_positions.get(elevator.id, target_floor)
+            current_pos = positions[i]
 
             # Smooth interpolation
             diff = target_floor - current_pos
             if abs(diff) > 0.01:
-                self.elevator_positions[elevator.id] = (
-                    current_pos + diff * self.animation_speed
-                )
+                positions[i] = current_pos + diff * self.animation_speed
             else:
-                self.elevator_positions[elevator.id] = target_floor
+                positions[i] = target_floor
+
+    def _render_text(
+        self, font: pygame.font.Font, text: str, color: Tuple[int, int, int]
+    ) -> pygame.Surface:
+        """Render a label, reusing the surface when the same text repeats"""
+        key = (id(font), text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            if len(self._text_cache) >= _TEXT_CACHE_SIZE:
+                self._text_cache.clear()
+            surface = font.render(text, True, color)
+            self._text_cache[key] = surface
+        return surface
 
     def _render(self):
         """Render the entire scene"""
-        # Clear screen
-        self.screen.fill(Colors.BACKGROUND)
+        now = time.monotonic()
+        if now >= self._next_sample:
+            self._next_sample = now + self._sample_interval
+            self._sample_simulation()
 
-        # Render building
+        # Render building (also clears the screen)
         self._render_building()
 
         # Render elevators
@@ -280,28 +347,59 @@ class PygameVisualization:
     def _render_building(self):
         """Render the building structure"""
         building_rect = self.building_area
+        num_floors = self.simulation.building.num_floors
+        if self._background_floors != num_floors:
+            self._build_background(num_floors)
+
+        # Background, outline, floor lines and numbers never change per frame
+        self.screen.blit(self._background, (0, 0))
+
+        # People already in elevators, collected once per frame (safety check
+        # for race conditions with the simulation thread)
+        people_in_elevators = {
+            id(p)
+            for elevator in self.simulation.building.elevators
+            for p in elevator.passengers
+        }
+
+        # Show waiting people
+        floor_height = building_rect.height / num_floors
+        for floor_num in range(num_floors):
+            y = building_rect.bottom - floor_num * floor_height
+            self._render_waiting_people(
+                floor_num + 1, y, floor_height, people_in_elevators
+            )
+
+    def _build_background(self, num_floors: int):
+        """Pre-render the screen background and static building layout"""
+        background = pygame.Surface((self.width, self.height))
+        background.fill(Colors.BACKGROUND)
+        building_rect = self.building_area
 
         # Draw building outline
-        pygame.draw.rect(self.screen, Colors.BUILDING, building_rect, 2)
+        pygame.draw.rect(background, Colors.BUILDING, building_rect, 2)
 
         # Draw floors
-        num_floors = self.simulation.building.num_floors
         floor_height = building_rect.height / num_floors
 
         for floor_num in range(num_floors):
             y = building_rect.bottom - floor_num * floor_height
             floor_rect = pygame.Rect(building_rect.x, y, building_rect.width, 2)
-            pygame.draw.rect(self.screen, Colors.FLOOR, floor_rect)
+            background.fill(Colors.FLOOR, floor_rect)
 
             # Floor number
             floor_text = self.font_small.render(str(floor_num + 1), True, Colors.TEXT)
-            self.screen.blit(floor_text, (building_rect.x - 25, y - 8))
+            background.blit(floor_text, (building_rect.x - 25, y - 8))
 
-            # Show waiting people
-            self._render_waiting_people(floor_num + 1, y, floor_height)
+        self._background = background
+        self._background_floors = num_floors
 
     def _render_waiting_people(
-        self, floor_number: int, y_position: float, floor_height: float
+        self,
+        floor_number: int,
+        y_position: float,
+        floor_height: float,
+        people_in_elevators: Set[int],
     ):
         """Render people waiting on a floor"""
         # Get waiting people - use .get() to avoid KeyError
@@ -309,11 +407,7 @@ class PygameVisualization:
         waiting_down = self.simulation.building.waiting_down.get(floor_number, [])
         all_waiting = waiting_up + waiting_down
 
-        # Filter out people who are already in elevators (safety check for race conditions)
-        people_in_elevators = set()
-        for elevator in self.simulation.building.elevators:
-            people_in_elevators.update(id(p) for p in elevator.passengers)
-
+        # Filter out people who are already in elevators
         all_waiting = [p for p in all_waiting if id(p) not in people_in_elevators]
 
         if not all_waiting:
@@ -323,25 +417,26 @@ class PygameVisualization:
         waiting_count = len(all_waiting)
         people_per_row = 10
         circle_size = 3
+        spacing = circle_size * 2 + 1
 
-        for i, person in enumerate(all_waiting[:30]):  # Limit display
-            row = i // people_per_row
-            col = i % people_per_row
+        # Up to 30 circles per floor every frame; bind the invariants once
+        screen = self.screen
+        draw_circle = pygame.draw.circle
+        color = Colors.PERSON_WAITING
+        left = self.building_area.x + 10
+        top = y_position - floor_height + 5
 
-            person_x = self.building_area.x + 10 + col * (circle_size * 2 + 1)
-            person_y = y_position - floor_height + 5 + row * (circle_size * 2 + 1)
+        for i in range(min(waiting_count, 30)):  # Limit display
+            row, col = divmod(i, people_per_row)
+            person_x = left + col * spacing
+            person_y = top + row * spacing
 
-            pygame.draw.circle(
-                self.screen,
-                Colors.PERSON_WAITING,
-                (int(person_x), int(person_y)),
-                circle_size,
-            )
+            draw_circle(screen, color, (int(person_x), int(person_y)), circle_size)
 
         # Show count if too many people
         if waiting_count > 30:
-            count_text = self.font_small.render(
-                f"+{waiting_count - 30}", True, Colors.TEXT
+            count_text = self._render_text(
+                self.font_small, f"+{waiting_count - 30}", Colors.TEXT
             )
             self.screen.blit(
                 count_text,
@@ -363,10 +458,9 @@ class PygameVisualization:
                 building_rect.x + (i + 1) * elevator_width - elevator_width // 4
             )
 
-            # Get smooth position
-            smooth_floor = self.elevator_positions.get(
-                elevator.id, elevator.current_floor
-            )
+            # Get smooth position (kept in step with the fleet by
+            # _update_animations, which runs before every render)
+            smooth_floor = self.elevator_positions[i]
             # Convert floor number (1-based) to 0-based for positioning calculation
             floor_position = smooth_floor - 1
             # Clamp floor position to valid range
@@ -382,7 +476,7 @@ class PygameVisualization:
                 elevator_width // 2,
                 building_rect.height,
             )
-            pygame.draw.rect(self.screen, Colors.SHAFT, shaft_rect)
+            self.screen.fill(Colors.SHAFT, shaft_rect)
 
             # Choose elevator color based on state
             if elevator.state == ElevatorState.MOVING:
@@ -399,7 +493,7 @@ class PygameVisualization:
                 elevator_width // 2 - 4,
                 floor_height // 2,
             )
-            pygame.draw.rect(self.screen, color, elevator_rect)
+            self.screen.fill(color, elevator_rect)
 
             # Highlight selected elevator
             if elevator.id == self.selected_elevator:
@@ -413,14 +507,14 @@ class PygameVisualization:
             # Draw passenger count
             passenger_count = len(elevator.passengers)
             if passenger_count > 0:
-                count_text = self.font_small.render(
-                    str(passenger_count), True, Colors.TEXT
+                count_text = self._render_text(
+                    self.font_small, str(passenger_count), Colors.TEXT
                 )
                 text_rect = count_text.get_rect(center=elevator_rect.center)
                 self.screen.blit(count_text, text_rect)
 
             # Draw elevator ID
-            id_text = self.font_small.render(f"E{elevator.id}", True, Colors.TEXT)
+            id_text = self._render_text(self.font_small, f"E{elevator.id}", Colors.TEXT)
             self.screen.blit(id_text, (elevator_x, building_rect.y - 20))
 
     def _render_elevator_direction(self, elevator, elevator_rect):
@@ -447,11 +541,11 @@ class PygameVisualization:
         control_rect = self.control_area
 
         # Panel background
-        pygame.draw.rect(self.screen, Colors.BUILDING, control_rect)
+        self.screen.fill(Colors.BUILDING, control_rect)
         pygame.draw.rect(self.screen, Colors.TEXT, control_rect, 2)
 
         # Title
-        title_text = self.font_large.render("Controls", True, Colors.TEXT)
+        title_text = self._render_text(self.font_large, "Controls", Colors.TEXT)
         self.screen.blit(title_text, (control_rect.x + 20, control_rect.y + 20))
 
         # Render buttons
@@ -465,11 +559,13 @@ class PygameVisualization:
                 color = Colors.BUTTON_NORMAL
 
             # Draw button
-            pygame.draw.rect(self.screen, color, button["rect"])
+            self.screen.fill(color, button["rect"])
             pygame.draw.rect(self.screen, Colors.TEXT, button["rect"], 2)
 
             # Button text
-            text_surface = self.font_medium.render(button["text"], True, Colors.TEXT)
+            text_surface = self._render_text(
+                self.font_medium, button["text"], Colors.TEXT
+            )
             text_rect = text_surface.get_rect(center=button["rect"].center)
             self.screen.blit(text_surface, text_rect)
 
@@ -478,12 +574,23 @@ class PygameVisualization:
 
     def _render_elevator_details(self):
         """Render detailed information about elevators"""
+        details_title = self._render_text(
+            self.font_medium, "Elevator Details", Colors.TEXT
+        )
+        self.screen.blit(details_title, (self.control_area.x + 20, 350))
+        self.screen.blits(self._detail_blits, doreturn=False)
+
+    def _sample_simulation(self):
+        """Re-render the text panels derived from simulation state"""
+        self._detail_blits = self._build_elevator_details()
+        self._status_blits = self._build_status()
+
+    def _build_elevator_details(self) -> List[_Blit]:
+        """Render the per-elevator detail lines for the control panel"""
+        blits = []
         start_y = 350
         line_height = 20
 
-        details_title = self.font_medium.render("Elevator Details", True, Colors.TEXT)
-        self.screen.blit(details_title, (self.control_area.x + 20, start_y))
-
         current_y = start_y + 30
 
         for elevator in self.simulation.building.elevators:
@@ -493,8 +600,10 @@ class PygameVisualization:
                 if elevator.direction != Direction.IDLE:
                     info_text += f" ({elevator.direction.value})"
 
-                text_surface = self.font_small.render(info_text, True, Colors.TEXT)
-                self.screen.blit(text_surface, (self.control_area.x + 30, current_y))
+                text_surface = self._render_text(
+                    self.font_small, info_text, Colors.TEXT
+                )
+                blits.append((text_surface, (self.control_area.x + 30, current_y)))
                 current_y += line_height
 
                 # Passenger info
@@ -508,48 +617,52 @@ class PygameVisualization:
                     except AttributeError as e:
                         passenger_info += f"Error accessing passenger data: {e}"
 
-                    text_surface = self.font_small.render(
-                        passenger_info, True, Colors.PERSON_IN_ELEVATOR
-                    )
-                    self.screen.blit(
-                        text_surface, (self.control_area.x + 30, current_y)
+                    text_surface = self._render_text(
+                        self.font_small, passenger_info, Colors.PERSON_IN_ELEVATOR
                     )
+                    blits.append((text_surface, (self.control_area.x + 30, current_y)))
                     current_y += line_height
 
-                # Requests
+                # Requests (FloorSets already iterate in ascending order)
                 requests = []
                 if elevator.up_requests:
-                    requests.append(f"Up: {sorted(elevator.up_requests)}")
+                    requests.append(f"Up: {list(elevator.up_requests)}")
                 if elevator.down_requests:
-                    requests.append(f"Down: {sorted(elevator.down_requests)}")
+                    requests.append(f"Down: {list(elevator.down_requests)}")
                 if elevator.destination_floors:
-                    requests.append(f"Dest: {sorted(elevator.destination_floors)}")
+                    requests.append(f"Dest: {list(elevator.destination_floors)}")
 
                 if requests:
                     request_info = f"  Requests: {' | '.join(requests)}"
-                    text_surface = self.font_small.render(
-                        request_info, True, Colors.REQUEST_INDICATOR
-                    )
-                    self.screen.blit(
-                        text_surface, (self.control_area.x + 30, current_y)
+                    text_surface = self._render_text(
+                        self.font_small, request_info, Colors.REQUEST_INDICATOR
                     )
+                    blits.append((text_surface, (self.control_area.x + 30, current_y)))
                     current_y += line_height
 
                 current_y += 5  # Extra space between elevators
             except Exception as e:
                 error_text = f"E{elevator.id}: Error - {str(e)}"
                 text_surface = self.font_small.render(error_text, True, (255, 0, 0))
-                self.screen.blit(text_surface, (self.control_area.x + 30, current_y))
+                blits.append((text_surface, (self.control_area.x + 30, current_y)))
                 current_y += line_height
 
+        return blits
+
     def _render_status(self):
         """Render status bar at bottom"""
         status_rect = self.status_area
 
         # Background
-        pygame.draw.rect(self.screen, Colors.BUILDING, status_rect)
+        self.screen.fill(Colors.BUILDING, status_rect)
         pygame.draw.rect(self.screen, Colors.TEXT, status_rect, 1)
 
+        self.screen.blits(self._status_blits, doreturn=False)
+
+    def _build_status(self) -> List[_Blit]:
+        """Render the status bar text from current statistics"""
+        status_rect = self.status_area
+
         # Get current statistics
         stats = self.simulation.get_current_statistics()
 
@@ -561,14 +674,16 @@ class PygameVisualization:
             f"Avg Wait: {stats.get('avg_journey_time', 0):.1f}s | "
             f"Throughput: {stats['throughput']:.1f}/hour"
         )
-
         text_surface = self.font_medium.render(status_text, True, Colors.TEXT)
-        self.screen.blit(text_surface, (status_rect.x + 10, status_rect.y + 20))
 
         # FPS counter
         fps_text = f"FPS: {self.clock.get_fps():.0f}"
         fps_surface = self.font_small.render(fps_text, True, Colors.TEXT)
-        self.screen.blit(fps_surface, (status_rect.right - 80, status_rect.y + 5))
+
+        return [
+            (text_surface, (status_rect.x + 10, status_rect.y + 20)),
+            (fps_surface, (status_rect.right - 80, status_rect.y + 5)),
+        ]
 
     def _cleanup(self):
         """Clean up pygame resources"""
@@ -6,19 +6,65 @@ This module provides real-time visualization of the elevator simulation,
 including ASCII art display, statistics dashboards, and interactive controls.
 """
 
+import array
 import os
+import shutil
+import sys
 import time
 import threading
-from typing import Dict, List, Optional
-from collections import deque
+from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from itertools import islice, zip_longest
 
 from src.core.elevator_simulator import (
     Elevator,
     Direction,
     ElevatorState,
+    Person,
 )
 from src.core.simulation_engine import SimulationEngine
 
+# Statistics samples kept by StatisticsTracker; older ones are dropped
+_HISTORY_SIZE = 1000
+
+# Per-sample fields StatisticsTracker keeps, with their array typecodes
+_HISTORY_FIELDS = (
+    ("elapsed_time", "d"),
+    ("throughput", "d"),
+    ("avg_wait_time", "d"),
+    ("people_waiting", "q"),
+    ("people_in_transit", "q"),
+    ("total_people_generated", "q"),
+    ("total_people_completed", "q"),
+)
+
+
+def _preview_people(people: List[Person], shown: int = 3) -> str:
+    """Label the first few people in a queue and count the rest"""
+    # Only the people shown are formatted, however long the queue is
+    preview = ", ".join(
+        [f"P{p.id}→{p.destination_floor}" for p in islice(people, shown)]
+    )
+    if len(people) > shown:
+        preview += f" +{len(people) - shown} more"
+    return preview
+
+
+# The same few car and shaft cells repeat on every floor of every frame, so
+# each distinct cell is formatted once. Cars are keyed by their glyph rather
+# than by the state enums, whose hashing runs in Python.
+@lru_cache(maxsize=256)
+def _car_display(state_char: str, passengers: int, capacity: int, width: int) -> str:
+    """An elevator car cell, e.g. '[ ↑2/8 ]'"""
+    car_content = f"{state_char}{passengers}/{capacity}"
+    return f"[{car_content:^{width - 2}}]"
+
+
+@lru_cache(maxsize=16)
+def _shaft_display(mark: str, width: int) -> str:
+    """An empty shaft cell, showing mark centred"""
+    return f"{mark:^{width}}"
+
 
 class ASCIIDisplay:
     """ASCII-based real-time visualization of the elevator system"""
@@ -28,17 +74,38 @@ class ASCIIDisplay:
         self.building = simulation.building
         self.is_running = False
         self.display_thread: Optional[threading.Thread] = None
-        self.refresh_rate = 1.0  # seconds between updates
+        self.refresh_rate = 1.0  # minimum seconds between updates
+        self.idle_refresh_rate = 5.0  # redraw at least this often when idle
 
         # Display settings
         self.elevator_width = 8
         self.floor_height = 1
         self.show_details = True
 
+        # Lines currently on the terminal, so a refresh only rewrites changes
+        self._prev_lines: List[str] = []
+
+        # Floor view column starts and header, rebuilt only if the elevator
+        # width or count changes
+        self._layout_key: Optional[tuple] = None
+        self._elevator_columns: List[int] = []
+        self._floor_header: List[str] = []
+
+        # Joined passenger labels per elevator, with the list they came from
+        self._passenger_text: Dict[int, Tuple[List[Dict], str]] = {}
+
+        # Set by the simulation when something shown on screen has changed
+        self._dirty = threading.Event()
+
+    def mark_dirty(self):
+        """Request a redraw at the next refresh"""
+        self._dirty.set()
+
     def start(self):
         """Start the visual display in a separate thread"""
         if not self.is_running:
             self.is_running = True
+            self.simulation.state_listeners.append(self.mark_dirty)
             self.display_thread = threading.Thread(
                 target=self._display_loop, daemon=True
             )
@@ -47,64 +114,103 @@ class ASCIIDisplay:
     def stop(self):
         """Stop the visual display"""
         self.is_running = False
+        if self.mark_dirty in self.simulation.state_listeners:
+            self.simulation.state_listeners.remove(self.mark_dirty)
+        self._dirty.set()  # wake the loop so it notices the stop
         if self.display_thread:
             self.display_thread.join(timeout=1.0)
 
     def _display_loop(self):
         """Main display refresh loop"""
+        self._clear_screen()
         while self.is_running:
             try:
-                self._clear_screen()
-                self._render_building()
+                self._dirty.clear()
+                self._draw(self._render_building())
+                # Redraw at most once per refresh_rate, and only once the
+                # simulation reports a change (or idle_refresh_rate passes)
                 time.sleep(self.refresh_rate)
+                self._dirty.wait(self.idle_refresh_rate)
             except Exception as e:
                 print(f"Display error: {e}")
                 break
 
     def _clear_screen(self):
         """Clear the terminal screen"""
-        os.system("cls" if os.name == "nt" else "clear")
+        if os.name == "nt":
+            os.system("")  # switches the Windows console to ANSI handling
+        sys.stdout.write("\x1b[2J\x1b[H")
+        sys.stdout.flush()
+        self._prev_lines = []  # everything must be redrawn
 
-    def _render_building(self):
-        """Render the complete building view"""
+    def _draw(self, lines: List[str]):
+        """
+        Rewrite only the terminal rows that differ from the previous frame.
+
+        Rows are addressed absolutely, which only works while the frame fits
+        the terminal. A frame that is too tall or too wide is printed whole
+        after clearing the screen instead, so the terminal can wrap and
+        scroll it.
+        """
+        columns, rows = shutil.get_terminal_size()
+        if len(lines) >= rows or max(map(len, lines), default=0) > columns:
+            sys.stdout.write("\x1b[2J\x1b[H" + "\n".join(lines) + "\n")
+            sys.stdout.flush()
+            self._prev_lines = []  # the screen scrolled, so repaint it all
+            return
+
+        # Nothing known to be on screen: clear leftovers from a full repaint
+        out = [] if self._prev_lines else ["\x1b[2J"]
+        for row, (old, new) in enumerate(
+            zip_longest(self._prev_lines, lines, fillvalue=""), start=1
+        ):
+            if old != new:
+                # Move to the row, clear it, then write the new content
+                out.append(f"\x1b[{row};1H\x1b[2K{new}")
+        # Park the cursor below the frame so stray output doesn't overwrite it
+        out.append(f"\x1b[{len(lines) + 1};1H")
+        sys.stdout.write("".join(out))
+        sys.stdout.flush()
+        self._prev_lines = lines
+
+    def _render_building(self) -> List[str]:
+        """Render the complete building view as a list of lines"""
         # Header
         stats = self.simulation.get_current_statistics()
         elapsed_time = stats.get("elapsed_time", 0)
 
-        print("=" * 80)
-        print(f"{'ELEVATOR MALL SIMULATOR':^80}")
-        print("=" * 80)
-        print(
+        lines = [
+            "=" * 80,
+            f"{'ELEVATOR MALL SIMULATOR':^80}",
+            "=" * 80,
             f"Time: {elapsed_time:.1f}s | "
             f"Generated: {stats['total_people_generated']} | "
             f"Completed: {stats['total_people_completed']} | "
-            f"Waiting: {stats['people_waiting']}"
-        )
-        print(
+            f"Waiting: {stats['people_waiting']}",
             f"Average Wait: {stats['avg_wait_time']:.1f}s | "
-            f"Throughput: {stats['throughput']:.1f}/hour"
-        )
-        print("")
+            f"Throughput: {stats['throughput']:.1f}/hour",
+            "",
+        ]
 
         # Building visualization
-        self._render_floors()
+        self._render_floors(lines)
 
         # Elevator details
-        print("\n" + "=" * 80)
-        print("ELEVATOR STATUS")
-        print("=" * 80)
-        self._render_elevator_details()
+        lines.extend(("", "=" * 80, "ELEVATOR STATUS", "=" * 80))
+        self._render_elevator_details(lines)
 
         # Traffic summary
-        print("\n" + "=" * 80)
-        print("FLOOR ACTIVITY")
-        print("=" * 80)
-        self._render_floor_activity()
+        lines.extend(("", "=" * 80, "FLOOR ACTIVITY", "=" * 80))
+        self._render_floor_activity(lines)
 
-    def _render_floors(self):
-        """Render the building floors with elevators"""
-        elevators = self.building.elevators
-        num_floors = self.building.num_floors
+        return lines
+
+    def _update_layout(self, elevators: List[Elevator]):
+        """Compute elevator column starts and the floor view header"""
+        key = (self.elevator_width, len(elevators))
+        if key == self._layout_key:
+            return
+        self._layout_key = key
 
         # Calculate layout
         elevator_columns = []
@@ -119,42 +225,53 @@ class ASCIIDisplay:
             header = f"Elev{elevator.id}".center(self.elevator_width)
             header_line += " " * (col_start - len(header_line)) + header
 
-        print(header_line)
-        print("-" * len(header_line))
+        self._elevator_columns = elevator_columns
+        self._floor_header = [header_line, "-" * len(header_line)]
+
+    def _render_floors(self, lines: List[str]):
+        """Render the building floors with elevators"""
+        elevators = self.building.elevators
+        num_floors = self.building.num_floors
+
+        self._update_layout(elevators)
+        elevator_columns = self._elevator_columns
+        lines.extend(self._floor_header)
 
         # Render floors from top to bottom
         for floor in range(num_floors, 0, -1):
-            self._render_single_floor(floor, elevators, elevator_columns)
+            lines.append(self._render_single_floor(floor, elevators, elevator_columns))
 
     def _render_single_floor(
         self,
         floor: int,
         elevators: List[Elevator],
         elevator_columns: List[int],
-    ):
+    ) -> str:
         """Render a single floor line"""
-        line = f"{floor:2d}:  "
+        label = f"{floor:2d}:  "
+        parts = [label]
+        pos = len(label)
 
         # Add elevator representations
-        for i, elevator in enumerate(elevators):
-            col_start = elevator_columns[i]
-
+        for col_start, elevator in zip(elevator_columns, elevators):
             # Pad to column start
-            while len(line) < col_start:
-                line += " "
+            if pos < col_start:
+                parts.append(" " * (col_start - pos))
+                pos = col_start
 
             # Render elevator shaft and car
             elevator_display = self._get_elevator_display(elevator, floor)
-            line += elevator_display
+            parts.append(elevator_display)
+            pos += len(elevator_display)
 
         # Add waiting people count
         waiting_up = len(self.building.waiting_up[floor])
         waiting_down = len(self.building.waiting_down[floor])
 
         if waiting_up > 0 or waiting_down > 0:
-            line += f"  ↑{waiting_up} ↓{waiting_down}"
+            parts.append(f"  ↑{waiting_up} ↓{waiting_down}")
 
-        print(line)
+        return "".join(parts)
 
     def _get_elevator_display(self, elevator: Elevator, floor: int) -> str:
         """Get the visual representation of an elevator at a specific floor"""
@@ -165,117 +282,108 @@ class ASCIIDisplay:
             passengers = elevator.passenger_count
             capacity = elevator.capacity
 
-            # Direction indicator
-            if elevator.direction == Direction.UP:
-                direction_char = "↑"
-            elif elevator.direction == Direction.DOWN:
-                direction_char = "↓"
-            else:
-                direction_char = "●"
-
-            # State indicator
-            if elevator.state == ElevatorState.LOADING:
+            # State indicator; only a moving car shows its direction
+            state = elevator.state
+            if state is ElevatorState.LOADING:
                 state_char = "◆"
-            elif elevator.state == ElevatorState.MOVING:
-                state_char = direction_char
+            elif state is ElevatorState.MOVING:
+                direction = elevator.direction
+                if direction is Direction.UP:
+                    state_char = "↑"
+                elif direction is Direction.DOWN:
+                    state_char = "↓"
+                else:
+                    state_char = "●"
             else:
                 state_char = "○"
 
-            # Passenger count display
-            passenger_display = f"{passengers}/{capacity}"
-
-            # Build elevator car display
-            car_content = f"{state_char}{passenger_display}"
-            car_display = f"[{car_content:^{width - 2}}]"
-
-            return car_display
+            return _car_display(state_char, passengers, capacity, width)
         else:
             # Empty shaft
             if floor in elevator.up_requests or floor in elevator.down_requests:
                 # There's a request for this floor
-                return f"{'◇':^{width}}"
+                return _shaft_display("◇", width)
             else:
                 # Empty shaft
-                return f"{'│':^{width}}"
+                return _shaft_display("│", width)
 
-    def _render_elevator_details(self):
+    def _render_elevator_details(self, lines: List[str]):
         """Render detailed elevator information"""
         for elevator in self.building.elevators:
             if status := self.simulation.get_elevator_status(elevator.id):
                 # Basic info
-                print(
+                lines.append(
                     f"Elevator {status['id']}: Floor {status['current_floor']} | "
                     f"{status['direction']} | {status['state']} | "
                     f"Load: {len(status['passengers'])}/{status['capacity']}"
                 )
 
                 # Passengers
-                if status["passengers"]:
-                    passenger_info = ", ".join(
-                        [f"P{p['id']}→{p['destination']}" for p in status["passengers"]]
-                    )
-                    print(f"  Passengers: {passenger_info}")
+                if passengers := status["passengers"]:
+                    passenger_info = self._passenger_info(status["id"], passengers)
+                    lines.append(f"  Passengers: {passenger_info}")
 
                 # Requests
                 requests = []
                 if status["up_requests"]:
-                    requests.append(f"Up: {sorted(status['up_requests'])}")
+                    requests.append(f"Up: {status['up_requests']}")
                 if status["down_requests"]:
-                    requests.append(f"Down: {sorted(status['down_requests'])}")
+                    requests.append(f"Down: {status['down_requests']}")
                 if status["destination_floors"]:
-                    requests.append(f"Dest: {sorted(status['destination_floors'])}")
+                    requests.append(f"Dest: {status['destination_floors']}")
 
                 if requests:
-                    print(f"  Requests: {' | '.join(requests)}")
+                    lines.append(f"  Requests: {' | '.join(requests)}")
 
                 # Performance
-                print(
+                lines.append(
                     f"  Served: {status['total_served']} | "
                     f"Distance: {status['distance_traveled']:.1f} floors | "
                     f"Efficiency: {status['efficiency']:.1f}%"
                 )
-                print()
+                lines.append("")
 
-    def _render_floor_activity(self):
-        """Render floor-by-floor activity summary"""
+    def _active_floors(self) -> List[Tuple[int, List[Person], List[Person]]]:
+        """Floors with anyone waiting, with their up and down queues"""
+        waiting_up = self.building.waiting_up
+        waiting_down = self.building.waiting_down
         active_floors = []
-
         for floor in range(1, self.building.num_floors + 1):
-            waiting_up = len(self.building.waiting_up[floor])
-            waiting_down = len(self.building.waiting_down[floor])
-
-            if waiting_up > 0 or waiting_down > 0:
-                active_floors.append((floor, waiting_up, waiting_down))
+            up = waiting_up[floor]
+            down = waiting_down[floor]
+            if up or down:
+                active_floors.append((floor, up, down))
+        return active_floors
+
+    def _passenger_info(self, elevator_id: int, passengers: List[Dict]) -> str:
+        """Join passenger labels, reusing the text while the list is unchanged"""
+        # get_elevator_status hands back the same list object until the
+        # elevator's state changes, so identity is enough to detect changes
+        cached = self._passenger_text.get(elevator_id)
+        if cached is not None and cached[0] is passengers:
+            return cached[1]
+        text = ", ".join([f"P{p['id']}→{p['destination']}" for p in passengers])
+        self._passenger_text[elevator_id] = (passengers, text)
+        return text
+
+    def _render_floor_activity(self, lines: List[str]):
+        """Render floor-by-floor activity summary"""
+        active_floors = self._active_floors()
 
         if active_floors:
             for floor, up, down in active_floors:
-                people_up = [
-                    f"P{p.id}→{p.destination_floor}"
-                    for p in self.building.waiting_up[floor]
-                ]
-                people_down = [
-                    f"P{p.id}→{p.destination_floor}"
-                    for p in self.building.waiting_down[floor]
-                ]
-
                 floor_info = f"Floor {floor:2d}: "
-                if people_up:
-                    floor_info += f"UP({len(people_up)}): {', '.join(people_up[:3])}"
-                    if len(people_up) > 3:
-                        floor_info += f" +{len(people_up) - 3} more"
+                if up:
+                    floor_info += f"UP({len(up)}): {_preview_people(up)}"
 
-                if people_down:
-                    if people_up:
+                if down:
+                    if up:
                         floor_info += " | "
-                    floor_info += (
-                        f"DOWN({len(people_down)}): {', '.join(people_down[:3])}"
-                    )
-                    if len(people_down) > 3:
-                        floor_info += f" +{len(people_down) - 3} more"
+                    floor_info += f"DOWN({len(down)}): {_preview_people(down)}"
 
-                print(floor_info)
+                lines.append(floor_info)
         else:
-            print("No people currently waiting.")
+            lines.append("No people currently waiting.")
 
 
 class StatisticsTracker:
@@ -283,9 +391,26 @@ class StatisticsTracker:
 
     def __init__(self, simulation: SimulationEngine):
         self.simulation = simulation
-        self.stats_history: deque = deque(maxlen=1000)  # Keep last 1000 data points
         self.is_tracking = False
-        self.tracking_thread: Optional[threading.Thread] = None
+
+        # Sample history as one fixed-size ring-buffer column per field,
+        # rather than a deque of full statistics dicts. Slots not yet
+        # written stay zero and so add nothing to the report sums.
+        self._columns: Dict[str, array.array] = {
+            name: array.array(typecode, bytes(8 * _HISTORY_SIZE))
+            for name, typecode in _HISTORY_FIELDS
+        }
+        self._throughput = self._columns["throughput"]
+        self._wait_time = self._columns["avg_wait_time"]
+        self._people_waiting = self._columns["people_waiting"]
+        self._head = 0
+        self._count = 0
+        # Newest sample in full, for the per-elevator part of the report
+        self._latest: Optional[Dict] = None
+
+        # Sample every _sample_every-th monitor step of the simulation
+        self._sample_every = 1
+        self._steps_until_sample = 0
 
         # Performance metrics
         self.peak_waiting_time = 0
@@ -294,66 +419,87 @@ class StatisticsTracker:
         self.completed_trips = 0
 
     def start_tracking(self, interval: float = 5.0):
-        """Start continuous statistics tracking"""
+        """
+        Start continuous statistics tracking.
+
+        The simulation hands statistics to on_tick from its own scheduler
+        thread, so interval is rounded to a whole number of its monitor
+        steps (one second each by default).
+        """
         if not self.is_tracking:
             self.is_tracking = True
-            self.tracking_thread = threading.Thread(
-                target=self._tracking_loop, args=(interval,), daemon=True
+            self._sample_every = max(
+                1, round(interval / self.simulation.monitor_interval)
             )
-            self.tracking_thread.start()
+            self._steps_until_sample = 0
+            self.simulation.stats_subscribers.append(self.on_tick)
 
     def stop_tracking(self):
         """Stop statistics tracking"""
         self.is_tracking = False
-        if self.tracking_thread:
-            self.tracking_thread.join(timeout=1.0)
-
-    def _tracking_loop(self, interval: float):
-        """Main tracking loop"""
-        while self.is_tracking:
-            try:
-                stats = self.simulation.get_current_statistics()
-                self._process_statistics(stats)
-                self.stats_history.append(stats)
-                time.sleep(interval)
-            except Exception as e:
-                print(f"Statistics tracking error: {e}")
-                break
+        if self.on_tick in self.simulation.stats_subscribers:
+            self.simulation.stats_subscribers.remove(self.on_tick)
+
+    def on_tick(self, stats: Dict):
+        """Record a sample on every interval's worth of monitor steps"""
+        if self._steps_until_sample > 0:
+            self._steps_until_sample -= 1
+            return
+        self._steps_until_sample = self._sample_every - 1
+        self._process_statistics(stats)
+        self._record(stats)
+
+    def _record(self, stats: Dict):
+        """Append a sample to the history columns"""
+        head = self._head
+        for name, column in self._columns.items():
+            column[head] = stats[name]
+        self._head = (head + 1) % _HISTORY_SIZE
+        if self._count < _HISTORY_SIZE:
+            self._count += 1
+        self._latest = stats
+
+    @property
+    def stats_history(self) -> List[Dict]:
+        """Retained samples, oldest first, as dicts of the tracked fields"""
+        columns = self._columns.items()
+        first = self._head - self._count
+        return [
+            {name: column[(first + i) % _HISTORY_SIZE] for name, column in columns}
+            for i in range(self._count)
+        ]
 
     def _process_statistics(self, stats: Dict):
         """Process and update cumulative statistics"""
-        # Update peak metrics
-        if stats["avg_wait_time"] > self.peak_waiting_time:
-            self.peak_waiting_time = stats["avg_wait_time"]
+        avg_wait_time = stats["avg_wait_time"]
+        people_waiting = stats["people_waiting"]
+        completed = stats["total_people_completed"]
 
-        if stats["people_waiting"] > self.peak_waiting_count:
-            self.peak_waiting_count = stats["people_waiting"]
+        # Update peak metrics (plain comparisons beat max() calls here)
+        if avg_wait_time > self.peak_waiting_time:
+            self.peak_waiting_time = avg_wait_time
+
+        if people_waiting > self.peak_waiting_count:
+            self.peak_waiting_count = people_waiting
 
         # Update cumulative metrics
-        new_completions = stats["total_people_completed"] - self.completed_trips
+        new_completions = completed - self.completed_trips
         if new_completions > 0:
-            self.completed_trips = stats["total_people_completed"]
+            self.completed_trips = completed
             # Estimate total wait time (this is approximate)
-            self.total_wait_time += stats["avg_wait_time"] * new_completions
+            self.total_wait_time += avg_wait_time * new_completions
 
     def generate_report(self) -> str:
         """Generate comprehensive performance report"""
-        if not self.stats_history:
+        latest = self._latest
+        if latest is None:
             return "No statistics available yet."
 
-        latest = self.stats_history[-1]
-
         # Calculate averages over time
-        if len(self.stats_history) > 1:
-            avg_throughput = sum(s["throughput"] for s in self.stats_history) / len(
-                self.stats_history
-            )
-            avg_wait_time = sum(s["avg_wait_time"] for s in self.stats_history) / len(
-                self.stats_history
-            )
-            avg_people_waiting = sum(
-                s["people_waiting"] for s in self.stats_history
-            ) / len(self.stats_history)
+        if (count := self._count) > 1:
+            avg_throughput = sum(self._throughput) / count
+            avg_wait_time = sum(self._wait_time) / count
+            avg_people_waiting = sum(self._people_waiting) / count
         else:
             avg_throughput = latest["throughput"]
             avg_wait_time = latest["avg_wait_time"]
@@ -405,29 +551,30 @@ class StatisticsTracker:
 
         return "\n".join(report_lines)
 
+    def _window_mean(self, column: array.array, start: int, size: int = 5) -> float:
+        """Mean of a column over size samples from position start in history"""
+        # Map history positions (0 = oldest kept sample) onto ring slots,
+        # reading just the window instead of copying the whole history
+        first = self._head - self._count + start
+        return sum(column[(first + i) % _HISTORY_SIZE] for i in range(size)) / size
+
     def get_trend_analysis(self) -> Dict:
         """Analyze trends in the statistics history"""
-        if len(self.stats_history) < 10:
+        count = self._count
+        if count < 10:
             return {"status": "Insufficient data for trend analysis"}
 
-        # Get recent and older data points
-        recent_stats = list(self.stats_history)[-5:]
-        older_stats = (
-            list(self.stats_history)[-15:-10]
-            if len(self.stats_history) >= 15
-            else list(self.stats_history)[:5]
-        )
+        # Compare the last five samples with five from ten samples earlier
+        # (or the first five while the history is still short)
+        recent = count - 5
+        older = count - 15 if count >= 15 else 0
 
         # Calculate trends
-        recent_avg_wait = sum(s["avg_wait_time"] for s in recent_stats) / len(
-            recent_stats
-        )
-        older_avg_wait = sum(s["avg_wait_time"] for s in older_stats) / len(older_stats)
+        recent_avg_wait = self._window_mean(self._wait_time, recent)
+        older_avg_wait = self._window_mean(self._wait_time, older)
 
-        recent_throughput = sum(s["throughput"] for s in recent_stats) / len(
-            recent_stats
-        )
-        older_throughput = sum(s["throughput"] for s in older_stats) / len(older_stats)
+        recent_throughput = self._window_mean(self._throughput, recent)
+        older_throughput = self._window_mean(self._throughput, older)
 
         wait_trend = "improving" if recent_avg_wait < older_avg_wait else "worsening"
         throughput_trend = (
@@ -546,15 +693,11 @@ class InteractiveController:
                     print(f"    Carrying: {passenger_list}")
 
         # Show waiting people
-        total_waiting = 0
-        for floor in range(1, self.simulation.building.num_floors + 1):
-            waiting_up = len(self.simulation.building.waiting_up[floor])
-            waiting_down = len(self.simulation.building.waiting_down[floor])
-            if waiting_up > 0 or waiting_down > 0:
-                total_waiting += waiting_up + waiting_down
-                print(f"  Floor {floor}: ↑{waiting_up} ↓{waiting_down}")
-
-        if total_waiting == 0:
+        active_floors = self.display._active_floors()
+        for floor, up, down in active_floors:
+            print(f"  Floor {floor}: ↑{len(up)} ↓{len(down)}")
+
+        if not active_floors:
             print("  No people waiting.")
 
         print("=" * 60)
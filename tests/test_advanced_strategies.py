@@ -14,6 +14,7 @@ from src.core.advanced_strategies import (
     AdaptiveStrategy,
 )
 from src.core.interfaces import ElevatorConfig
+from src.core.strategy_factory import create_strategy
 from src.core.elevator_simulator import Elevator, Direction, ElevatorState
 
 
@@ -108,6 +109,19 @@ class TestDestinationDispatchStrategy:
 
         assert assigned == 0  # Should group with elevator going to 20
 
+    def test_groups_with_least_loaded_match(self, test_elevators, config):
+        """Should pick the least loaded of several grouped elevators"""
+        strategy = DestinationDispatchStrategy()
+        strategy.register_destination(0, 1, 20)
+        strategy.register_destination(2, 15, 19)
+        test_elevators[0].passengers = [object()] * 4
+
+        assigned = strategy.assign_elevator(
+            test_elevators, 5, Direction.UP, config, destination_floor=21
+        )
+
+        assert assigned == 2
+
     def test_fallback_to_nearest(self, test_elevators, config):
         """Should fall back to nearest if no destination given"""
         strategy = DestinationDispatchStrategy()
@@ -117,6 +131,20 @@ class TestDestinationDispatchStrategy:
 
         assert assigned is not None
 
+    def test_fallback_prefers_idle_then_any_with_room(self, test_elevators, config):
+        """Fallback picks the closest idle car before any busy one"""
+        strategy = DestinationDispatchStrategy()
+
+        # Elevator 2 (floor 10) is closest to floor 11 but is moving
+        assert strategy.assign_elevator(test_elevators, 11, Direction.UP, config) == 2
+
+        test_elevators[0].passengers = [object()] * test_elevators[0].capacity
+        test_elevators[2].passengers = [object()] * test_elevators[2].capacity
+        assert strategy.assign_elevator(test_elevators, 11, Direction.UP, config) == 1
+
+        test_elevators[1].passengers = [object()] * test_elevators[1].capacity
+        assert strategy.assign_elevator(test_elevators, 11, Direction.UP, config) is None
+
     def test_clears_destination(self, test_elevators, config):
         """Should clear destinations when reached"""
         strategy = DestinationDispatchStrategy()
@@ -224,3 +252,87 @@ class TestAdaptiveStrategy:
 
         # Should have recorded requests
         assert len(strategy.recent_requests) == 10
+
+    def test_uses_simulation_clock(self, monkeypatch):
+        """Request times come from the simulated clock, not the wall clock"""
+        from src.core.simulation_engine import SimulationEngine
+        from src.utils.config_loader import get_config
+
+        monkeypatch.setattr(get_config(), "strategy_type", "adaptive")
+        sim = SimulationEngine(num_floors=10, num_elevators=2, time_scale=0)
+        sim.traffic_manager.step = lambda: 1.0  # manual requests only
+        strategy = sim.building.strategy
+        start = sim.building.clock()
+
+        for floor in range(2, 7):
+            assert sim.add_manual_request(from_floor=floor, to_floor=1)
+            sim.run_for(60)
+
+        assert strategy.recent_requests == [start + 60 * i for i in range(5)]
+
+
+class TestStrategyFactory:
+    """Test strategy creation by type name"""
+
+    def test_creates_fresh_instances(self):
+        """Should map type names to new strategy instances"""
+        strategy = create_strategy("LOOK")
+        assert isinstance(strategy, LOOKStrategy)
+        assert create_strategy("look") is not strategy
+        assert isinstance(create_strategy("adaptive"), AdaptiveStrategy)
+
+    def test_unknown_type_lists_options(self):
+        """Should reject unknown names and list the valid ones"""
+        with pytest.raises(ValueError, match="round_robin, look"):
+            create_strategy("elevator_magic")
+
+
+class TestStrategyTrackingInSimulation:
+    """Test strategy bookkeeping while a simulation serves requests"""
+
+    @staticmethod
+    def _run_requests(strategy, requests):
+        """Queue the requests, then serve them for 2.5 simulated seconds"""
+        from src.core.simulation_engine import SimulationEngine
+
+        sim = SimulationEngine(num_floors=10, num_elevators=2, time_scale=0)
+        sim.traffic_manager.step = lambda: 1.0  # manual requests only
+        sim.building.strategy = strategy
+        for controller in sim.elevator_controllers:
+            controller.strategy = strategy
+
+        for from_floor, to_floor in requests:
+            assert sim.add_manual_request(from_floor=from_floor, to_floor=to_floor)
+        sim.run_for(2.5)
+        return sim
+
+    def test_destination_dispatch_tracks_and_clears(self):
+        """Destinations are tracked on assignment and cleared on arrival"""
+        strategy = DestinationDispatchStrategy()
+        lobby_requests = [(1, floor) for floor in range(5, 10)]
+        sim = self._run_requests(strategy, lobby_requests)
+
+        tracked = sorted(
+            floor
+            for floors in strategy.elevator_destinations.values()
+            for floor in floors
+        )
+        assert tracked == [5, 6, 7, 8, 9]
+        assert len(strategy.destination_groups) == 5
+
+        sim.run_for(60)
+        assert sim.building.total_people_completed == 5
+        assert all(not floors for floors in strategy.elevator_destinations.values())
+
+    def test_ml_strategy_records_assignments(self):
+        """Every assignment is recorded and feeds the strategy weights"""
+        strategy = MLBasedStrategy()
+        initial_weights = dict(strategy.strategy_weights)
+        # One caller per floor, so each request is a separate assignment
+        sim = self._run_requests(strategy, [(floor, 10) for floor in range(1, 6)])
+
+        assert len(strategy.assignment_history) == 5
+        assert strategy.strategy_weights != initial_weights
+
+        sim.run_for(60)
+        assert sim.building.total_people_completed == 5
@@ -2,9 +2,12 @@
 Test configuration integration and loading
 """
 
+import json
+
 import pytest
 from src.core.elevator_simulator import Building, Direction
 from src.core.simulation_engine import TrafficManager
+from src.utils.config_loader import ElevatorConfig
 
 
 @pytest.mark.unit
@@ -90,3 +93,29 @@ def test_config_has_required_fields(config):
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+@pytest.mark.unit
+def test_config_resolves_values_on_load(tmp_path):
+    """Settings are resolved at load time, with defaults for missing keys"""
+    path = tmp_path / "config.json"
+    path.write_text(
+        json.dumps(
+            {
+                "building": {"num_floors": 12},
+                "simulation": {"control_loop_interval_ms": 250},
+            }
+        )
+    )
+
+    config = ElevatorConfig(str(path))
+    assert config.num_floors == 12
+    assert config.num_elevators == 4
+    assert config.control_loop_interval == 0.25
+    assert config.enable_load_balancing is True
+
+    path.write_text(json.dumps({"building": {"num_floors": 30}}))
+    assert config.num_floors == 12
+    config.reload()
+    assert config.num_floors == 30
+    assert config.control_loop_interval == 0.1
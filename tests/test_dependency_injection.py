@@ -99,6 +99,12 @@ class TestDependencyInjection:
         assert len(set(assignments)) == 3  # All different
         assert set(assignments) == {0, 1, 2}  # All elevators used
     
+    def test_basic_strategies_use_slots(self):
+        """Basic strategies keep no per-instance __dict__"""
+        for strategy in (NearestCarStrategy(), SCANStrategy(), RoundRobinStrategy()):
+            assert not hasattr(strategy, "__dict__")
+        assert RoundRobinStrategy().last_assigned == -1
+    
     def test_multiple_containers(self):
         """Test creating multiple independent containers"""
         container1 = create_test_container(
@@ -173,3 +179,51 @@ class TestStrategyComparison:
         assigned = strategy.assign_elevator(test_elevators, 7, Direction.UP, config)
         
         assert assigned == 1  # Elevator going UP
+
+    def test_nearest_skips_full_and_opposite(self, test_elevators):
+        """NearestCar avoids full cars and cars heading the other way"""
+        config = ElevatorConfig()
+        strategy = NearestCarStrategy()
+
+        # Elevator 2 (floor 5) is nearest but heads DOWN; elevator 1 is full
+        test_elevators[1].direction = Direction.DOWN
+        test_elevators[0].passengers = [object()] * test_elevators[0].capacity
+
+        assigned = strategy.assign_elevator(test_elevators, 6, Direction.UP, config)
+
+        assert assigned == 2  # Idle elevator at floor 10
+
+    def test_round_robin_skips_full_and_wraps(self, test_elevators):
+        """RoundRobin skips full cars and wraps around the fleet"""
+        config = ElevatorConfig()
+        strategy = RoundRobinStrategy()
+        test_elevators[1].passengers = [object()] * test_elevators[1].capacity
+
+        assigned = [
+            strategy.assign_elevator(test_elevators, 3, Direction.UP, config)
+            for _ in range(3)
+        ]
+        assert assigned == [0, 2, 0]
+
+        for elevator in test_elevators:
+            elevator.passengers = [object()] * elevator.capacity
+        assert strategy.assign_elevator(test_elevators, 3, Direction.UP, config) is None
+
+    def test_scan_falls_back_by_tier(self, test_elevators):
+        """SCAN tries approaching, then idle, then any car with room"""
+        config = ElevatorConfig()
+        strategy = SCANStrategy()
+
+        # Elevator 2 heads UP from floor 5, so it has passed floor 3
+        assert strategy.assign_elevator(test_elevators, 3, Direction.UP, config) == 0
+
+        test_elevators[0].state = ElevatorState.MOVING
+        test_elevators[2].state = ElevatorState.MOVING
+        assert strategy.assign_elevator(test_elevators, 3, Direction.UP, config) == 0
+
+        test_elevators[0].passengers = [object()] * test_elevators[0].capacity
+        assert strategy.assign_elevator(test_elevators, 3, Direction.UP, config) == 1
+
+        for elevator in test_elevators:
+            elevator.passengers = [object()] * elevator.capacity
+        assert strategy.assign_elevator(test_elevators, 3, Direction.UP, config) is None
@@ -5,7 +5,10 @@ Tests for Event Bus
 Test the Observer Pattern implementation.
 """
 
+from datetime import datetime
+
 from src.core.event_bus import (
+    Event,
     EventBus,
     EventType,
     EventLogger,
@@ -63,6 +66,24 @@ class TestEventBus:
 
         assert len(received) == 1  # Only first event
 
+    def test_duplicate_subscribe_is_ignored(self):
+        """Test that a handler is registered at most once per event type"""
+        bus = EventBus()
+        received = []
+
+        def handler(event):
+            received.append(event)
+
+        bus.subscribe(EventType.ELEVATOR_ARRIVED, handler)
+        bus.subscribe(EventType.ELEVATOR_ARRIVED, handler)
+        bus.publish(EventType.ELEVATOR_ARRIVED, {"floor": 1})
+        assert len(received) == 1
+
+        bus.unsubscribe(EventType.ELEVATOR_ARRIVED, handler)
+        bus.unsubscribe(EventType.ELEVATOR_ARRIVED, handler)  # No error
+        bus.publish(EventType.ELEVATOR_ARRIVED, {"floor": 2})
+        assert len(received) == 1
+
     def test_event_history(self):
         """Test event history tracking"""
         bus = EventBus()
@@ -81,6 +102,14 @@ class TestEventBus:
         # Limit
         limited = bus.get_history(limit=2)
         assert len(limited) == 2
+        assert [e.event_type for e in limited] == [
+            EventType.PERSON_GENERATED,
+            EventType.ELEVATOR_MOVING,
+        ]
+
+        # Filter and limit together keep the most recent matches, oldest first
+        latest = bus.get_history(EventType.PERSON_GENERATED, limit=1)
+        assert [e.data["id"] for e in latest] == [2]
 
     def test_event_counts(self):
         """Test event counting"""
@@ -140,6 +169,19 @@ class TestEventBus:
         assert len(good_handler_called) == 1
 
 
+class TestEvent:
+    """Test Event formatting"""
+
+    def test_str_format(self):
+        """Test the timestamp prefix and payload in str(event)"""
+        event = Event(
+            EventType.ELEVATOR_ARRIVED,
+            timestamp=datetime(2024, 1, 2, 3, 4, 5, 67890),
+            data={"floor": 3},
+        )
+        assert str(event) == "[03:04:05.067] elevator_arrived: {'floor': 3}"
+
+
 class TestEventLogger:
     """Test EventLogger functionality"""
 
@@ -160,6 +202,43 @@ class TestEventLogger:
         assert log_file.exists()
         content = log_file.read_text()
         assert "PERSON_GENERATED" in content or "person_generated" in content
+        assert len(content.splitlines()) == 2
+
+    def test_silent_logger_does_not_subscribe(self):
+        """Test that a logger with no output skips subscribing"""
+        bus = EventBus()
+        logger = EventLogger(bus, verbose=False)
+        logger.start()
+
+        assert not any(bus._subscribers.values())
+        logger.stop()
+
+    def test_events_reach_file_before_stop(self, tmp_path):
+        """Each event is on disk as soon as it is logged"""
+        bus = EventBus()
+        log_file = tmp_path / "events.log"
+        logger = EventLogger(bus, verbose=False)
+        logger.start(str(log_file))
+
+        bus.publish(EventType.PERSON_GENERATED, {"id": 1})
+        assert len(log_file.read_text().splitlines()) == 1
+        logger.stop()
+
+    def test_restart_replaces_log_file(self, tmp_path):
+        """Starting again closes the old file and logs each event once"""
+        bus = EventBus()
+        first, second = tmp_path / "first.log", tmp_path / "second.log"
+        logger = EventLogger(bus, verbose=False)
+        logger.start(str(first))
+        old_fh = logger._fh
+
+        logger.start(str(second))
+        bus.publish(EventType.PERSON_GENERATED, {"id": 1})
+        logger.stop()
+
+        assert old_fh.closed
+        assert first.read_text() == ""
+        assert len(second.read_text().splitlines()) == 1
 
 
 class TestEventMetrics:
@@ -197,3 +276,21 @@ class TestEventMetrics:
         collected = metrics.get_metrics()
         assert collected["total_events"] == 0
         assert collected["passengers_served"] == 0
+
+    def test_events_by_type(self):
+        """Test per-type event counts"""
+        bus = EventBus()
+        metrics = EventMetrics(bus)
+        metrics.start()
+
+        bus.publish(EventType.ELEVATOR_MOVING, {})
+        bus.publish(EventType.ELEVATOR_MOVING, {})
+        bus.publish(EventType.PERSON_BOARDED, {})
+
+        by_type = metrics.get_metrics()["events_by_type"]
+        assert by_type["elevator_moving"] == 2
+        assert by_type["person_boarded"] == 1
+        assert "person_arrived" not in by_type
+
+        metrics.reset()
+        assert metrics.get_metrics()["events_by_type"] == {}
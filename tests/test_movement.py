@@ -84,5 +84,132 @@ def test_elevator_capacity(simple_building):
     assert elevator.capacity > 0, "Capacity should be positive"
 
 
+@pytest.mark.unit
+def test_remove_waiting_people_batch(simple_building):
+    """Test boarded people are removed from the waiting list in one call"""
+    from src.core.elevator_simulator import Direction, Person
+
+    people = [
+        Person(id=i, current_floor=2, destination_floor=5, arrival_time=0.0)
+        for i in range(4)
+    ]
+    simple_building.waiting_up[2].extend(people)
+
+    simple_building.remove_waiting_people(2, Direction.UP, [people[0], people[2]])
+
+    assert simple_building.waiting_up[2] == [people[1], people[3]]
+
+
+@pytest.mark.unit
+def test_recent_journeys_window(simple_building):
+    """Test only journeys boarded inside the window are reported"""
+    from src.core.elevator_simulator import Person
+
+    journeys = [(10.0, 20.0), (50.0, 90.0), (80.0, 95.0)]
+    for i, (boarded, completed) in enumerate(journeys):
+        person = Person(id=i, current_floor=1, destination_floor=3, arrival_time=0.0)
+        person.boarding_time = boarded
+        simple_building.completed_journeys.append(person)
+        simple_building.completed_journey_times.append(completed)
+
+    recent = simple_building.get_recent_journeys(60.0)
+
+    assert [p.id for p in recent] == [2]
+    assert simple_building.get_recent_journeys(100.0) == []
+
+
+@pytest.mark.unit
+def test_building_status_wait_totals(simple_building):
+    """Test waiting counts and average wait across both directions"""
+    from src.core.elevator_simulator import Person
+
+    now = time.time()
+    simple_building.waiting_up[2].append(
+        Person(id=1, current_floor=2, destination_floor=5, arrival_time=now - 10)
+    )
+    simple_building.waiting_down[7].append(
+        Person(id=2, current_floor=7, destination_floor=1, arrival_time=now - 20)
+    )
+
+    status = simple_building.get_building_status()
+
+    assert status["total_waiting"] == 2
+    assert status["avg_wait_time"] == 15
+
+
+@pytest.mark.unit
+def test_record_completed_journeys(simple_building):
+    """Test completed journeys update the counter and the journey log together"""
+    from src.core.elevator_simulator import Person
+
+    people = [
+        Person(id=i, current_floor=1, destination_floor=4, arrival_time=0.0)
+        for i in range(3)
+    ]
+    simple_building.record_completed_journeys(people, 42.0)
+    simple_building.record_completed_journeys([], 43.0)
+
+    assert simple_building.total_people_completed == 3
+    assert simple_building.completed_journeys == people
+    assert simple_building.completed_journey_times == [42.0] * 3
+
+
+@pytest.mark.unit
+def test_floor_set_behaves_like_set():
+    """Test the bitmask-backed request set keeps set semantics"""
+    from src.core.elevator_simulator import FloorSet
+
+    floors = FloorSet([7, 2])
+    floors.add(5)
+    floors.discard(7)
+    floors.discard(9)
+
+    assert list(floors) == [2, 5]
+    assert 5 in floors and 7 not in floors
+    assert len(floors) == 2 and floors == {2, 5}
+    floors.clear()
+    assert not floors
+
+
+@pytest.mark.unit
+def test_next_stop_from_request_masks(simple_building):
+    """Test directional next-stop queries on bitmask requests"""
+    from src.core.elevator_simulator import Direction
+
+    elevator = simple_building.elevators[0]
+    elevator.current_floor = 5
+    elevator.add_destination(8)
+    elevator.add_request(3, Direction.DOWN)
+    elevator.add_request(7, Direction.UP)
+
+    elevator.direction = Direction.UP
+    assert elevator.get_next_stop() == 7
+    elevator.direction = Direction.DOWN
+    assert elevator.get_next_stop() == 3
+    assert not elevator.has_requests_in_direction(Direction.DOWN, 3)
+    elevator.direction = Direction.IDLE
+    assert elevator.get_next_stop() == 8
+
+
+@pytest.mark.unit
+def test_step_plan_matches_direction_update(simple_building):
+    """Test the fused step plan agrees with update_direction/get_next_stop"""
+    from src.core.elevator_simulator import Direction
+
+    elevator = simple_building.elevators[0]
+    elevator.current_floor = 6
+    elevator.direction = Direction.UP
+    elevator.add_request(2, Direction.UP)
+    elevator.add_destination(4)
+
+    plan = elevator.compute_step_plan()
+    assert elevator.direction == Direction.UP
+    assert not plan.has_more_up and plan.has_more_down
+
+    elevator.update_direction()
+    assert plan.direction == elevator.direction == Direction.DOWN
+    assert plan.next_stop == elevator.get_next_stop() == 4
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
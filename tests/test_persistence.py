@@ -5,6 +5,8 @@ Tests for Data Persistence
 Test simulation recording, saving, loading, and replay functionality.
 """
 
+import gzip
+import json
 import pytest
 import tempfile
 from pathlib import Path
@@ -163,6 +165,28 @@ class TestSimulationRecording:
         assert len(data["snapshots"]) == 1
         assert isinstance(data["start_time"], str)
 
+    def test_snapshots_share_recording_config(self):
+        """Snapshot config/strategy are stored once per recording"""
+        config = {"num_floors": 20}
+        recording = SimulationRecording(
+            session_id="dedupe", strategy_name="scan", config=config
+        )
+        recording.add_snapshot(SimulationSnapshot(config=config, strategy_name="scan"))
+        recording.add_snapshot(
+            SimulationSnapshot(config={"num_floors": 5}, strategy_name="scan")
+        )
+
+        data = recording.to_dict()
+        first, second = data["snapshots"]
+        assert "config" not in first and "strategy_name" not in first
+        assert second["config"] == {"num_floors": 5}
+        assert "strategy_name" not in second
+
+        restored = SimulationRecording.from_dict(data)
+        assert restored.snapshots[0].config == config
+        assert restored.snapshots[0].strategy_name == "scan"
+        assert restored.snapshots[1].config == {"num_floors": 5}
+
     def test_recording_from_dict(self):
         """Create recording from dictionary"""
         data = {
@@ -289,6 +313,51 @@ class TestSimulationPersistence:
         assert all("session_id" in r for r in recordings)
         assert all("strategy_name" in r for r in recordings)
 
+    def test_load_pretty_printed_recording(self, persistence):
+        """Recordings written with indented JSON still load"""
+        recording = SimulationRecording(session_id="pretty", strategy_name="scan")
+        recording.add_snapshot(SimulationSnapshot(simulation_time=5.0))
+        recording.finalize({"completed": 1})
+
+        filepath = persistence.storage_dir / "sim_pretty.json"
+        filepath.write_text(json.dumps(recording.to_dict(), indent=2))
+
+        loaded = persistence.load_recording("pretty")
+        assert loaded.strategy_name == "scan"
+        assert loaded.snapshots[0].simulation_time == 5.0
+
+    def test_list_recordings_uses_metadata_sidecar(self, persistence):
+        """Listing reads the sidecar instead of the recording body"""
+        recording = SimulationRecording(session_id="meta_test", strategy_name="scan")
+        recording.add_snapshot(SimulationSnapshot(simulation_time=1.0))
+        recording.add_event({"type": "request"})
+        recording.finalize({})
+        filepath = persistence.save_recording(recording, compress=True)
+
+        assert persistence.metadata_path("meta_test").exists()
+
+        # Corrupt the body; the listing must not need to decode it
+        Path(filepath).write_bytes(b"not json")
+
+        recordings = persistence.list_recordings()
+        assert len(recordings) == 1
+        assert recordings[0]["session_id"] == "meta_test"
+        assert recordings[0]["strategy_name"] == "scan"
+        assert recordings[0]["num_snapshots"] == 1
+        assert recordings[0]["num_events"] == 1
+        assert recordings[0]["filepath"] == filepath
+
+    def test_list_recordings_without_sidecar(self, persistence):
+        """Recordings without a sidecar are still listed"""
+        recording = SimulationRecording(session_id="no_meta", strategy_name="scan")
+        recording.add_snapshot(SimulationSnapshot(simulation_time=1.0))
+        persistence.save_recording(recording, compress=False)
+        persistence.metadata_path("no_meta").unlink()
+
+        recordings = persistence.list_recordings()
+        assert len(recordings) == 1
+        assert recordings[0]["num_snapshots"] == 1
+
     def test_delete_recording(self, persistence):
         """Delete a recording"""
         # Create recording
@@ -306,6 +375,7 @@ class TestSimulationPersistence:
         result = persistence.delete_recording("delete_test")
 
         assert result is True
+        assert not persistence.metadata_path("delete_test").exists()
         recordings = persistence.list_recordings()
         assert len(recordings) == 0
 
@@ -323,6 +393,18 @@ class TestSimulationPersistence:
         assert Path(filepath).exists()
         assert "snapshot_" in filepath
 
+    def test_save_snapshot_filenames_sort_by_capture_time(self, persistence):
+        """Snapshot files are named by monotonic capture time"""
+        first = SimulationSnapshot(simulation_time=1.0)
+        second = SimulationSnapshot(simulation_time=2.0)
+
+        path2 = persistence.save_snapshot(second, session_id="order_test")
+        path1 = persistence.save_snapshot(first, session_id="order_test")
+
+        assert Path(path1).name == f"snapshot_{first.timestamp_ns}.json"
+        names = sorted(Path(path1).parent.iterdir(), key=lambda p: int(p.stem[9:]))
+        assert [p.name for p in names] == [Path(path1).name, Path(path2).name]
+
     def test_export_to_csv(self, persistence):
         """Export recording to CSV"""
         # Create recording with snapshots
@@ -359,6 +441,17 @@ class TestSimulationPersistence:
                 assert "Timestamp" in content
                 assert "Simulation Time" in content
                 assert "Total Completed" in content
+
+            lines = content.strip().splitlines()
+            assert len(lines) == 4
+            assert lines[-1].split(",")[1:] == [
+                "20.0",
+                "40",
+                "30",
+                "10",
+                "12.0",
+                "32.0",
+            ]
         finally:
             Path(csv_path).unlink()
 
@@ -460,6 +553,88 @@ class TestSimulationRecorder:
             files = list(Path(tmpdir).glob("sim_*.json.gz"))
             assert len(files) == 1
 
+    def test_auto_save_appends_only_new_records(self):
+        """Auto-saves append to the journal instead of rewriting it"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            recorder = SimulationRecorder(storage_dir=tmpdir, auto_save_interval=2)
+            recorder.start(config={"num_floors": 10}, strategy_name="test")
+
+            for i in range(4):
+                recorder.record_snapshot(SimulationSnapshot(simulation_time=i * 1.0))
+                recorder.record_event({"type": "tick", "i": i})
+            recorder.stop({"total_completed": 7})
+            filepath = recorder.save(compress=True)
+
+            with gzip.open(filepath, "rt", encoding="utf-8") as f:
+                kinds = [json.loads(line)["record"] for line in f]
+            assert kinds.count("header") == 1
+            assert kinds.count("snapshot") == 4
+            assert kinds.count("event") == 4
+            assert kinds.count("footer") == 1
+
+            loaded = SimulationPersistence(tmpdir).load_recording(
+                recorder.get_session_id()
+            )
+            times = [s.simulation_time for s in loaded.snapshots]
+            assert times == [0.0, 1.0, 2.0, 3.0]
+            assert [e["i"] for e in loaded.events] == [0, 1, 2, 3]
+            assert loaded.config == {"num_floors": 10}
+            assert loaded.final_statistics == {"total_completed": 7}
+            assert loaded.end_time is not None
+
+    def test_load_truncated_journal(self):
+        """Records written before a crash remain loadable"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            recorder = SimulationRecorder(storage_dir=tmpdir)
+            recorder.start(config={}, strategy_name="test")
+            recorder.record_snapshot(SimulationSnapshot(simulation_time=1.0))
+            filepath = recorder.save(compress=True)
+
+            # Simulate a partially written trailing gzip member
+            with open(filepath, "ab") as f:
+                f.write(gzip.compress(b'{"record": "snapshot"}\n')[:12])
+
+            loaded = SimulationPersistence(tmpdir).load_recording(
+                recorder.get_session_id()
+            )
+            assert len(loaded.snapshots) == 1
+            assert loaded.end_time is None
+
+    def test_load_journal_truncated_mid_record(self, capsys):
+        """A half-written last line is skipped in an uncompressed journal"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            recorder = SimulationRecorder(storage_dir=tmpdir)
+            recorder.start(config={}, strategy_name="test")
+            recorder.record_snapshot(SimulationSnapshot(simulation_time=1.0))
+            recorder.record_snapshot(SimulationSnapshot(simulation_time=2.0))
+            filepath = Path(recorder.save(compress=False))
+
+            # Cut the file off partway through the last snapshot
+            data = filepath.read_bytes()
+            filepath.write_bytes(data[: data.rindex(b"\n", 0, -1) + 20])
+
+            loaded = SimulationPersistence(tmpdir).load_recording(
+                recorder.get_session_id()
+            )
+            assert [s.simulation_time for s in loaded.snapshots] == [1.0]
+            assert "Skipping truncated record" in capsys.readouterr().out
+
+    def test_load_journal_with_corrupt_middle_record_fails(self):
+        """Only the last record may be incomplete"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            recorder = SimulationRecorder(storage_dir=tmpdir)
+            recorder.start(config={}, strategy_name="test")
+            recorder.record_snapshot(SimulationSnapshot(simulation_time=1.0))
+            filepath = Path(recorder.save(compress=False))
+
+            with open(filepath, "ab") as f:
+                f.write(b'{"record": "snap\n{"record": "footer"}\n')
+
+            with pytest.raises(ValueError):
+                SimulationPersistence(tmpdir).load_recording(
+                    recorder.get_session_id()
+                )
+
 
 class TestSimulationReplayer:
     """Test SimulationReplayer class"""
@@ -514,6 +689,38 @@ class TestSimulationReplayer:
         assert len(snapshots_seen) == 3
         assert all(isinstance(s, SimulationSnapshot) for s in snapshots_seen)
 
+    def test_replay_streams_without_full_load(self, replayer, capsys):
+        """Replay does not decode the whole recording up front"""
+
+        def fail(session_id):
+            raise AssertionError("replay should not call load_recording")
+
+        replayer.persistence.load_recording = fail
+        replayer.replay("replay_test")
+
+        captured = capsys.readouterr()
+        assert "Snapshots: 3" in captured.out
+        assert "--- Snapshot 3/3 ---" in captured.out
+        assert "total_completed: 30" in captured.out
+
+    def test_replay_recorded_journal(self, capsys):
+        """Replay a journal written by SimulationRecorder"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            recorder = SimulationRecorder(storage_dir=tmpdir)
+            recorder.start(config={}, strategy_name="scan")
+            recorder.record_snapshot(SimulationSnapshot(simulation_time=5.0))
+            recorder.record_event({"type": "request"})
+            recorder.stop({"total_completed": 4})
+            recorder.save()
+
+            SimulationReplayer(storage_dir=tmpdir).replay(recorder.get_session_id())
+
+            captured = capsys.readouterr()
+            assert "Strategy: scan" in captured.out
+            assert "Events: 1" in captured.out
+            assert "Time: 5.0s" in captured.out
+            assert "total_completed: 4" in captured.out
+
     def test_compare_sessions(self, capsys):
         """Compare multiple sessions"""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -0,0 +1,457 @@
+"""
+Tests for the Simulation Engine
+===============================
+
+Test controller scheduling and bookkeeping helpers.
+"""
+
+import random
+import sys
+import threading
+import time
+
+import pytest
+
+from src.core.advanced_strategies import DestinationDispatchStrategy
+from src.core.elevator_simulator import Direction, Person
+from src.core.simulation_engine import (
+    ElevatorController,
+    SimulationEvent,
+    TrafficManager,
+    _next_deadline,
+)
+
+
+class TestTickScheduling:
+    """Test deadline-based scheduling"""
+
+    def test_next_deadline_follows_timeline(self):
+        """The next deadline is one interval after the previous one"""
+        start = time.monotonic() + 10.0
+        assert _next_deadline(start, 0.05) == start + 0.05
+
+    def test_next_deadline_reanchors_when_behind(self):
+        """A late task restarts its schedule instead of bursting"""
+        stale = time.monotonic() - 10.0
+        before = time.monotonic()
+        deadline = _next_deadline(stale, 0.05)
+
+        assert before <= deadline <= time.monotonic()
+
+
+class TestScheduler:
+    """Test the single-threaded simulation scheduler"""
+
+    def test_events_order_by_timestamp(self):
+        """Events sort by due time and carry no per-instance dict"""
+        early = SimulationEvent(1.0, "traffic")
+        late = SimulationEvent(2.0, "elevator_step", elevator_id=0)
+
+        assert early < late and not late < early
+        if sys.version_info >= (3, 10):
+            assert not hasattr(early, "__dict__")
+
+    def test_runs_on_one_thread(self, simulation):
+        """Starting a simulation runs one scheduler thread and no others"""
+        simulation.start_simulation()
+        try:
+            assert simulation.simulation_thread.is_alive()
+            components = [*simulation.elevator_controllers, simulation.traffic_manager]
+            for component in components:
+                assert not any(
+                    isinstance(value, threading.Thread)
+                    for value in vars(component).values()
+                )
+        finally:
+            simulation.stop_simulation()
+
+        assert not simulation.simulation_thread.is_alive()
+
+    def test_elevator_step_yields_delays(self, simple_building, monkeypatch):
+        """Elevator steps yield their waits instead of sleeping"""
+        controller = ElevatorController(simple_building.elevators[0], simple_building)
+        simple_building.elevators[0].add_destination(3)
+
+        def no_sleep(seconds):
+            raise AssertionError("elevator step slept")
+
+        monkeypatch.setattr(time, "sleep", no_sleep)
+        delays = list(controller._process_elevator_step())
+
+        assert len(delays) == 2 and all(delay > 0 for delay in delays)
+        assert simple_building.elevators[0].current_floor == 3
+
+    def test_activity_charged_from_delays(self, simulation):
+        """Active and idle time come from the delays the scheduler waits"""
+        controller = simulation.elevator_controllers[0]
+        steps = {}
+
+        idle_delay = simulation._advance_elevator(controller, steps, 0)
+        assert controller.idle_time == idle_delay == controller.step_interval
+        assert controller.active_time == 0
+
+        controller.elevator.add_destination(3)
+        move_delay = simulation._advance_elevator(controller, steps, 0)
+        assert controller.active_time == move_delay > 0
+
+    def test_movement_leg_replans_for_new_stop(self, simple_building):
+        """A car travelling several floors re-plans for a request on the way"""
+        elevator = simple_building.elevators[0]
+        controller = ElevatorController(elevator, simple_building)
+        elevator.add_destination(6)
+
+        step = controller._process_elevator_step()
+        next(step)
+        elevator.add_destination(3)
+        assert list(step) == []
+        assert elevator.current_floor == 2
+
+        list(controller._process_elevator_step())
+        assert elevator.current_floor == 3
+        assert controller._should_stop_at_current_floor()
+
+
+class TestSimulatedTime:
+    """Test the time_scale=0 simulated-time mode"""
+
+    def test_run_for_advances_virtual_clock(self):
+        """An hour of simulated time passes without sleeping"""
+        from src.core.simulation_engine import SimulationEngine
+
+        engine = SimulationEngine(num_floors=10, num_elevators=2, time_scale=0)
+        start = engine.building.clock()
+
+        wall_start = time.monotonic()
+        engine.run_for(3600)
+
+        assert time.monotonic() - wall_start < 30
+        assert engine.building.clock() == start + 3600
+        assert not engine.is_running
+        stats = engine.get_current_statistics()
+        assert stats["total_people_generated"] > 0
+        assert stats["total_people_completed"] > 0
+        assert stats["elapsed_time"] == 3600
+
+    def test_run_for_requires_simulated_time(self, simulation):
+        """Wall-clock engines cannot be run in simulated time"""
+        with pytest.raises(ValueError):
+            simulation.run_for(10)
+
+    def test_state_listeners_notified_on_change(self):
+        """Listeners hear about new people and elevator movement"""
+        from src.core.simulation_engine import SimulationEngine
+
+        engine = SimulationEngine(num_floors=10, num_elevators=2, time_scale=0)
+        engine.traffic_manager.step = lambda: 1.0  # no automatic arrivals
+        calls = []
+        engine.state_listeners.append(lambda: calls.append(engine.building.clock()))
+
+        engine.run_for(60)
+        assert calls == []  # nobody arrives, so nothing moves
+
+        assert engine.add_manual_request(1, 5)
+        assert len(calls) == 1
+
+        engine.run_for(60)
+        assert len(calls) > 1
+
+    def test_failing_traffic_and_monitor_steps_keep_elevators_running(self, capsys):
+        """A traffic or statistics error is reported without stopping the cars"""
+        from src.core.simulation_engine import SimulationEngine
+
+        def fail(*args):
+            raise RuntimeError("boom")
+
+        engine = SimulationEngine(num_floors=10, num_elevators=2, time_scale=0)
+        engine.traffic_manager.step = fail
+        engine._collect_statistics = fail
+
+        assert engine.add_manual_request(1, 5)
+        engine.run_for(60)
+
+        assert engine.building.total_people_completed == 1
+        out = capsys.readouterr().out
+        assert "Error in traffic generation: boom" in out
+        assert "Error in statistics monitor: boom" in out
+
+    def test_failing_state_listener_does_not_stop_simulation(self, capsys):
+        """A listener error is reported and the other listeners still run"""
+        from src.core.simulation_engine import SimulationEngine
+
+        def fail():
+            raise RuntimeError("boom")
+
+        engine = SimulationEngine(num_floors=10, num_elevators=2, time_scale=0)
+        engine.traffic_manager.step = lambda: 1.0  # manual requests only
+        calls = []
+        engine.state_listeners.extend([fail, lambda: calls.append(1)])
+
+        assert engine.add_manual_request(1, 5)
+        engine.run_for(60)
+
+        assert engine.building.total_people_completed == 1
+        assert len(calls) > 1
+        assert "Error in state listener: boom" in capsys.readouterr().out
+
+    def test_state_listeners_notified_of_returning_visitors(self):
+        """A visitor setting off home counts as a change"""
+        from src.core.simulation_engine import SimulationEngine
+
+        engine = SimulationEngine(num_floors=10, num_elevators=2, time_scale=0)
+        engine.traffic_manager._rate_by_hour = (0.0,) * 24  # no new arrivals
+        engine._advance_elevator = lambda controller, steps, index: 1.0
+        building = engine.building
+        calls = []
+        engine.state_listeners.append(lambda: calls.append(building.clock()))
+
+        visitor = Person(id=1, current_floor=1, destination_floor=5, arrival_time=0.0)
+        building.pending_returns.append((building.clock() + 30, visitor))
+        engine.run_for(20)
+        assert calls == []
+
+        engine.run_for(20)
+        assert len(calls) == 1
+        assert building.pending_returns == []
+
+    def test_chunked_run_matches_single_run(self):
+        """Splitting run_for into short calls reaches the same state"""
+        from src.core.simulation_engine import SimulationEngine
+
+        def run(chunks):
+            random.seed(42)
+            engine = SimulationEngine(num_floors=20, num_elevators=2, time_scale=0)
+            start = engine.building.clock()
+            engine.add_manual_request(1, 20)
+            for _ in range(chunks):
+                engine.run_for(120 / chunks)
+
+            building = engine.building
+            assert building.clock() == start + 120
+            return (
+                [
+                    (e.current_floor, e.state, e.direction, len(e.passengers))
+                    for e in building.elevators
+                ],
+                building.total_people_generated,
+                engine.get_current_statistics()["total_people_completed"],
+            )
+
+        assert run(480) == run(1)
+
+
+class TestStopDecision:
+    """Test the table-driven stop check"""
+
+    def _controller_with_waiting(self, building, direction, destination):
+        elevator = building.elevators[0]
+        elevator.current_floor = 3
+        elevator.direction = direction
+        person = Person(
+            id=1, current_floor=3, destination_floor=destination, arrival_time=0.0
+        )
+        waiting = building.waiting_up if destination > 3 else building.waiting_down
+        waiting[3].append(person)
+        return ElevatorController(elevator, building)
+
+    def test_stops_for_same_direction(self, simple_building):
+        """A car going up stops for someone waiting to go up"""
+        controller = self._controller_with_waiting(simple_building, Direction.UP, 5)
+        assert controller._should_stop_at_current_floor()
+
+    def test_opposite_direction_waits_for_requests_ahead(self, simple_building):
+        """Opposite-direction pickups wait until nothing is left ahead"""
+        controller = self._controller_with_waiting(simple_building, Direction.UP, 1)
+        assert controller._should_stop_at_current_floor()
+
+        controller.elevator.add_destination(5)
+        assert not controller._should_stop_at_current_floor()
+
+    def test_stop_keeps_request_while_people_remain(self, simple_building):
+        """A hall call is cleared only once its waiting area is empty"""
+        elevator = simple_building.elevators[0]
+        controller = self._controller_with_waiting(simple_building, Direction.UP, 5)
+        elevator.add_request(3, Direction.UP)
+        elevator.add_request(3, Direction.DOWN)
+        elevator.capacity = 0
+
+        list(controller._handle_floor_stop())
+        assert 3 in elevator.up_requests and 3 not in elevator.down_requests
+
+        elevator.capacity = 5
+        list(controller._handle_floor_stop())
+        assert 3 not in elevator.up_requests
+
+    def test_full_car_passes(self, simple_building):
+        """A full car does not stop for waiting passengers"""
+        controller = self._controller_with_waiting(simple_building, Direction.IDLE, 5)
+        controller.elevator.capacity = 0
+        assert not controller._should_stop_at_current_floor()
+
+
+class TestDebugOutput:
+    """Test that debug logging only happens in debug mode"""
+
+    def test_direction_change_logged_in_debug(self, simple_building, capsys):
+        """Direction changes are printed only when debug is on"""
+        for debug in (False, True):
+            elevator = simple_building.elevators[0]
+            elevator.current_floor = 1
+            elevator.add_destination(2)
+            controller = ElevatorController(elevator, simple_building, debug=debug)
+            list(controller._process_elevator_step())
+            elevator.direction = Direction.IDLE
+
+            output = capsys.readouterr().out
+            assert ("IDLE -> UP" in output) is debug
+
+
+class TestStrategyHooks:
+    """Test strategy callbacks made while passengers board and leave"""
+
+    def test_capability_flags_follow_strategy(self, simple_building):
+        """Strategy capabilities are resolved when the strategy is set"""
+        controller = ElevatorController(simple_building.elevators[0], simple_building)
+        assert not controller._is_dest_dispatch and not controller._is_ml
+
+        controller.strategy = DestinationDispatchStrategy()
+        assert controller._is_dest_dispatch and not controller._is_ml
+
+    def test_destination_dispatch_tracks_stops(self, simple_building):
+        """Boarding registers a destination and arriving clears it"""
+        strategy = DestinationDispatchStrategy()
+        elevator = simple_building.elevators[0]
+        controller = ElevatorController(elevator, simple_building, strategy=strategy)
+        simple_building.waiting_up[1].append(
+            Person(id=1, current_floor=1, destination_floor=4, arrival_time=0.0)
+        )
+
+        list(controller._handle_floor_stop())
+        assert 4 in strategy.elevator_destinations[0]
+
+        elevator.current_floor = 4
+        list(controller._handle_floor_stop())
+        assert 4 not in strategy.elevator_destinations[0]
+
+
+class TestTrafficArrivals:
+    """Test Poisson passenger arrivals"""
+
+    def test_arrivals_due_are_generated(self, simple_building):
+        """Every arrival scheduled before now is generated in one step"""
+        manager = TrafficManager(simple_building)
+        manager.start()
+        manager.step()
+
+        manager._next_arrival = time.time() - 1.0
+        generated = simple_building.total_people_generated
+        manager.step()
+
+        assert simple_building.total_people_generated > generated
+        assert manager._next_arrival > time.time() - 1.0
+
+    def test_no_arrivals_before_due(self, simple_building):
+        """Checks before the next arrival generate nobody"""
+        manager = TrafficManager(simple_building)
+        manager.start()
+        manager.step()
+
+        manager._next_arrival = time.time() + 60.0
+        generated = simple_building.total_people_generated
+        manager.step()
+
+        assert simple_building.total_people_generated == generated
+
+    def test_zero_rate_never_arrives(self, simple_building):
+        """A zero arrival rate schedules no arrival"""
+        manager = TrafficManager(simple_building)
+        manager._arrival_rate = 0.0
+        assert manager._draw_next_arrival(time.time()) == float("inf")
+
+
+class TestStatusReporting:
+    """Test elevator status and building overview reporting"""
+
+    def test_elevator_status_reused_until_state_changes(self, simulation):
+        """Unchanged elevators reuse their status lists"""
+        first = simulation.get_elevator_status(1)
+        second = simulation.get_elevator_status(1)
+        assert first == second
+        assert first["up_requests"] is second["up_requests"]
+
+        simulation.building.elevators[0].add_request(4, Direction.UP)
+        third = simulation.get_elevator_status(1)
+        assert third["up_requests"] == [4]
+        assert simulation.get_elevator_status(99) is None
+
+    def test_statistics_reused_within_a_tick(self, simulation):
+        """A running simulation recomputes statistics once per scheduler tick"""
+        simulation.is_running = True  # as if between two scheduler events
+        try:
+            first = simulation.get_current_statistics()
+            assert simulation.get_current_statistics() is first
+
+            assert simulation.add_manual_request(1, 5)
+            second = simulation.get_current_statistics()
+            assert second["total_people_generated"] == 1
+
+            simulation._tick += 1
+            assert simulation.get_current_statistics() is not second
+        finally:
+            simulation.is_running = False
+
+        assert simulation.get_current_statistics() is not second
+
+    def test_building_overview_counts_waiting(self, simulation):
+        """The overview totals waiting people and lists busy floors"""
+        building = simulation.building
+        building.waiting_up[2].append(
+            Person(id=1, current_floor=2, destination_floor=5, arrival_time=0.0)
+        )
+        building.waiting_down[7].append(
+            Person(id=2, current_floor=7, destination_floor=1, arrival_time=0.0)
+        )
+
+        overview = simulation.get_building_overview()
+
+        assert "WAITING: 1 going UP, 1 going DOWN" in overview
+        assert overview.index("Floor  7") < overview.index("Floor  2")
+
+
+class TestConfigCaching:
+    """Test that timing parameters are read once and refreshed on demand"""
+
+    def test_controller_reload_config(self, simple_building, config):
+        """Controller picks up config changes only on reload_config"""
+        controller = ElevatorController(simple_building.elevators[0], simple_building)
+        original = config.movement_delay_factor
+        try:
+            config.movement_delay_factor = original * 2
+            assert controller._move_factor == original
+
+            controller.reload_config()
+            assert controller._move_factor == original * 2
+        finally:
+            config.movement_delay_factor = original
+
+    def test_traffic_manager_caches_interval(self, simple_building, config):
+        """TrafficManager caches its check interval"""
+        manager = TrafficManager(simple_building)
+        assert manager._check_interval == config.traffic_check_interval
+
+    def test_traffic_rate_by_hour(self, simple_building, config):
+        """Traffic rates come from the hourly table built on reload"""
+        manager = TrafficManager(simple_building)
+        base = config.base_arrival_rate
+        rush = base * manager.rush_multiplier
+
+        assert manager._get_current_traffic_rate(9 * 60) == rush
+        assert manager._get_current_traffic_rate(13 * 60 + 30) == (
+            base * manager.lunch_multiplier
+        )
+        assert manager._get_current_traffic_rate(15 * 60) == base
+        assert manager._get_current_traffic_rate(23 * 60 + 30) == (
+            base * manager.night_multiplier
+        )
+        assert manager._get_current_traffic_rate(24 * 60 + 9 * 60) == (
+            manager._get_current_traffic_rate(9 * 60)
+        )
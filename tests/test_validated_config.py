@@ -5,6 +5,7 @@ Tests for Configuration Validation with Pydantic
 Test Pydantic-based configuration system.
 """
 
+import os
 import pytest
 from pydantic import ValidationError
 from src.core.validated_config import (
@@ -13,6 +14,7 @@ from src.core.validated_config import (
     ElevatorConfig,
     StrategyConfig,
     TrafficConfig,
+    SimulationConfig,
     ConfigFactory,
     validate_config_file,
     migrate_legacy_config,
@@ -170,6 +172,29 @@ class TestElevatorSystemConfig:
         assert loaded.building.num_floors == 25
         assert loaded.building.num_elevators == 5
 
+    def test_repeated_load_returns_independent_copies(self, tmp_path):
+        """Cached loads give separate instances and pick up file changes"""
+        filepath = tmp_path / "test_config.json"
+        ElevatorSystemConfig(
+            building=BuildingConfig(num_floors=25, num_elevators=5)
+        ).save_to_file(str(filepath))
+
+        first = ElevatorSystemConfig.load_from_file(str(filepath))
+        first.building.num_floors = 30
+        first.traffic.peak_hours.append(3)
+        second = ElevatorSystemConfig.load_from_file(str(filepath))
+        assert second is not first
+        assert second.building.num_floors == 25
+        assert 3 not in second.traffic.peak_hours
+
+        ElevatorSystemConfig(
+            building=BuildingConfig(num_floors=12, num_elevators=3)
+        ).save_to_file(str(filepath))
+        stat = filepath.stat()
+        os.utime(filepath, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        third = ElevatorSystemConfig.load_from_file(str(filepath))
+        assert third.building.num_floors == 12
+
     def test_extra_fields_forbidden(self):
         """Test that extra fields are forbidden"""
         with pytest.raises(ValidationError):
@@ -265,6 +290,21 @@ class TestConfigUtilities:
         assert config.strategy.distance_weight == 1.5
         assert config.traffic.base_arrival_rate == 30.0
 
+    def test_legacy_format_round_trip(self):
+        """Legacy export and migration are inverse mappings"""
+        config = ElevatorSystemConfig(
+            building=BuildingConfig(num_floors=25, num_elevators=5),
+            elevator=ElevatorConfig(elevator_capacity=10, elevator_speed=2.5),
+            strategy=StrategyConfig(load_weight=3.0, opposite_direction_penalty=12),
+            traffic=TrafficConfig(base_arrival_rate=30.0, rush_multiplier=2.5),
+            simulation=SimulationConfig(control_loop_interval=0.25),
+        )
+
+        migrated = migrate_legacy_config(config.to_legacy_format())
+        assert migrated.to_legacy_format() == config.to_legacy_format()
+        assert migrated.strategy.load_weight == 3.0
+        assert migrated.simulation.control_loop_interval == 0.25
+
 
 class TestConfigValidation:
     """Test configuration validation rules"""
@@ -0,0 +1,220 @@
+"""
+Tests for the Text Visualization
+================================
+
+Test statistics tracking and the ASCII display helpers.
+"""
+
+import os
+import shutil
+
+from src.core.elevator_simulator import Direction, ElevatorState, Person
+from src.core.simulation_engine import SimulationEngine
+from src.visualization.visualization import ASCIIDisplay, StatisticsTracker
+
+# Frame for the building set up in TestASCIIDisplay._fixed_state_engine, as
+# rendered before the floor view and elevator details were optimised
+EXPECTED_FRAME = [
+    "=" * 80,
+    f"{'ELEVATOR MALL SIMULATOR':^80}",
+    "=" * 80,
+    "Time: 0.0s | Generated: 0 | Completed: 0 | Waiting: 6",
+    "Average Wait: 0.0s | Throughput: 0.0/hour",
+    "",
+    "Floor Elev1     Elev2     Elev3  ",
+    "---------------------------------",
+    " 8:     │         │         │      ↑0 ↓3",
+    " 7:     │         │         │    ",
+    " 6:     │      [ ◆1/8 ]     │    ",
+    " 5:     ◇         │         │      ↑0 ↓1",
+    " 4:     │         ◇         │    ",
+    " 3:  [ ↑4/8 ]     │         │    ",
+    " 2:     │         │         │      ↑2 ↓0",
+    " 1:     │         │      [ ○0/8 ]",
+    "",
+    "=" * 80,
+    "ELEVATOR STATUS",
+    "=" * 80,
+    "Elevator 1: Floor 3 | UP | MOVING | Load: 4/8",
+    "  Passengers: P1→6, P2→8, P3→6, P4→7",
+    "  Requests: Up: [5] | Dest: [6, 7, 8]",
+    "  Served: 0 | Distance: 0.0 floors | Efficiency: 0.0%",
+    "",
+    "Elevator 2: Floor 6 | DOWN | LOADING | Load: 1/8",
+    "  Passengers: P5→1",
+    "  Requests: Down: [4] | Dest: [1]",
+    "  Served: 0 | Distance: 0.0 floors | Efficiency: 0.0%",
+    "",
+    "Elevator 3: Floor 1 | IDLE | MAINTENANCE | Load: 0/8",
+    "  Served: 0 | Distance: 0.0 floors | Efficiency: 0.0%",
+    "",
+    "",
+    "=" * 80,
+    "FLOOR ACTIVITY",
+    "=" * 80,
+    "Floor  2: UP(2): P6→5, P7→7",
+    "Floor  5: DOWN(1): P8→1",
+    "Floor  8: DOWN(3): P9→1, P10→3, P11→2",
+]
+
+
+class TestStatisticsTracker:
+    """Test StatisticsTracker sampling driven by the simulation"""
+
+    def test_samples_every_interval_of_monitor_steps(self):
+        """Samples arrive from the scheduler without a tracking thread"""
+        engine = SimulationEngine(num_floors=10, num_elevators=2, time_scale=0)
+        tracker = StatisticsTracker(engine)
+
+        tracker.start_tracking(interval=5.0)
+        engine.run_for(20)
+        tracker.stop_tracking()
+
+        # Monitor steps run at 0, 1, ..., 20 simulated seconds
+        timestamps = [s["elapsed_time"] for s in tracker.stats_history]
+        assert timestamps == [0, 5, 10, 15, 20]
+        assert engine.stats_subscribers == []
+
+        # History keeps just the scalar fields, with counts still integers
+        latest = tracker.stats_history[-1]
+        assert "elevator_stats" not in latest
+        assert latest["total_people_generated"] == (
+            engine.get_current_statistics()["total_people_generated"]
+        )
+        assert isinstance(latest["people_waiting"], int)
+
+        engine.run_for(10)
+        assert len(tracker.stats_history) == 5
+
+    def test_report_averages_cover_retained_history(self):
+        """Averages match the retained samples after the history wraps"""
+        engine = SimulationEngine(num_floors=10, num_elevators=2, time_scale=0)
+        tracker = StatisticsTracker(engine)
+        base = engine.get_current_statistics()
+
+        for i in range(1205):
+            tracker.on_tick(
+                {**base, "throughput": i, "avg_wait_time": i % 7, "people_waiting": 3}
+            )
+
+        history = tracker.stats_history
+        assert len(history) == 1000
+        avg_throughput = sum(s["throughput"] for s in history) / len(history)
+        avg_wait = sum(s["avg_wait_time"] for s in history) / len(history)
+
+        report = tracker.generate_report()
+        assert f"Average Throughput: {avg_throughput:.1f} people/hour" in report
+        assert f"Overall Avg Wait Time: {avg_wait:.1f} seconds" in report
+
+    def test_trend_windows_follow_history(self):
+        """Trend windows read the right samples before and after wrapping"""
+        engine = SimulationEngine(num_floors=10, num_elevators=2, time_scale=0)
+        tracker = StatisticsTracker(engine)
+        base = engine.get_current_statistics()
+        assert tracker.get_trend_analysis() == {
+            "status": "Insufficient data for trend analysis"
+        }
+
+        for i in range(1, 1206):
+            tracker.on_tick({**base, "throughput": i * 2.0, "avg_wait_time": i % 11})
+            if i not in (12, 20, 1205):
+                continue
+
+            history = list(tracker.stats_history)
+            recent = history[-5:]
+            older = history[-15:-10] if len(history) >= 15 else history[:5]
+            recent_wait = sum(s["avg_wait_time"] for s in recent) / 5
+            recent_throughput = sum(s["throughput"] for s in recent) / 5
+            older_throughput = sum(s["throughput"] for s in older) / 5
+
+            trend = tracker.get_trend_analysis()
+            assert trend["recent_avg_wait"] == recent_wait
+            assert trend["recent_throughput"] == recent_throughput
+            assert trend["throughput_change"] == recent_throughput - older_throughput
+
+
+class TestASCIIDisplay:
+    """Test ASCIIDisplay rendering helpers"""
+
+    @staticmethod
+    def _fixed_state_engine():
+        """An 8-floor building with cars and callers in known positions"""
+        engine = SimulationEngine(num_floors=8, num_elevators=3, time_scale=0)
+        building = engine.building
+        now = building.clock()
+
+        def person(person_id, floor, destination):
+            return Person(
+                id=person_id,
+                current_floor=floor,
+                destination_floor=destination,
+                arrival_time=now,
+            )
+
+        first, second, third = building.elevators
+        first.current_floor = 3
+        first.state = ElevatorState.MOVING
+        first.direction = Direction.UP
+        for person_id, destination in ((1, 6), (2, 8), (3, 6), (4, 7)):
+            first.board_passenger(person(person_id, 1, destination), now)
+        first.add_request(5, Direction.UP)
+
+        second.current_floor = 6
+        second.state = ElevatorState.LOADING
+        second.direction = Direction.DOWN
+        second.board_passenger(person(5, 8, 1), now)
+        second.add_request(4, Direction.DOWN)
+
+        third.state = ElevatorState.MAINTENANCE
+
+        building.waiting_up[2].extend([person(6, 2, 5), person(7, 2, 7)])
+        building.waiting_down[5].append(person(8, 5, 1))
+        building.waiting_down[8].extend(
+            [person(9, 8, 1), person(10, 8, 3), person(11, 8, 2)]
+        )
+        return engine
+
+    def test_render_matches_expected_frame(self):
+        """The rendered frame is unchanged, including from cached cells"""
+        display = ASCIIDisplay(self._fixed_state_engine())
+
+        assert display._render_building() == EXPECTED_FRAME
+        assert display._render_building() == EXPECTED_FRAME
+
+    def test_passenger_text_follows_status_list(self):
+        """Passenger text is reused until the status list is replaced"""
+        engine = SimulationEngine(num_floors=10, num_elevators=2, time_scale=0)
+        display = ASCIIDisplay(engine)
+        passengers = [{"id": 7, "destination": 4}, {"id": 9, "destination": 2}]
+
+        first = display._passenger_info(1, passengers)
+        assert first == "P7→4, P9→2"
+        assert display._passenger_info(1, passengers) is first
+
+        changed = [{"id": 7, "destination": 4}]
+        assert display._passenger_info(1, changed) == "P7→4"
+
+    def test_draw_rewrites_changed_rows(self, monkeypatch, capsys):
+        """Only changed rows are rewritten while the frame fits the terminal"""
+        monkeypatch.setattr(
+            shutil, "get_terminal_size", lambda *a: os.terminal_size((80, 24))
+        )
+        engine = SimulationEngine(num_floors=10, num_elevators=2, time_scale=0)
+        display = ASCIIDisplay(engine)
+        display._prev_lines = ["top", "middle", "bottom"]
+
+        display._draw(["top", "changed", "bottom"])
+        assert capsys.readouterr().out == "\x1b[2;1H\x1b[2Kchanged\x1b[4;1H"
+
+    def test_draw_repaints_frames_too_big_for_terminal(self, monkeypatch, capsys):
+        """A frame taller than the terminal is printed whole after a clear"""
+        monkeypatch.setattr(
+            shutil, "get_terminal_size", lambda *a: os.terminal_size((80, 3))
+        )
+        engine = SimulationEngine(num_floors=10, num_elevators=2, time_scale=0)
+        display = ASCIIDisplay(engine)
+        display._prev_lines = ["top", "middle", "bottom"]
+
+        display._draw(["top", "changed", "bottom"])
+        assert capsys.readouterr().out == "\x1b[2J\x1b[Htop\nchanged\nbottom\n"
+        assert display._prev_lines == []